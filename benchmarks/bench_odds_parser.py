@@ -0,0 +1,129 @@
+"""
+Micro-benchmark of `OddsParser.parse_market_odds` on a saved 200-bookmaker odds table.
+
+Compares the current parser (module-level compiled patterns) against the previous implementation, which
+compiled its regexes on every call and ran the duplicated-odds substitution on every cell.
+
+The tree-building cost of lxml is reported separately from the per-row extraction it feeds.
+
+Usage:
+    python -m benchmarks.bench_odds_parser [--iterations 20] [--regenerate]
+"""
+
+import argparse
+import logging
+from pathlib import Path
+import re
+import statistics
+import time
+
+from src.core.market_extraction.odds_parser import OddsParser
+from src.utils.utils import parse_html
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "odds_200_bookmakers.html"
+BOOKMAKER_COUNT = 200
+ODDS_LABELS = ["1", "X", "2"]
+
+_ROW_TEMPLATE = (
+    '<div class="border-black-borders flex h-9 border-b border-l border-r text-xs">'
+    '<div class="flex w-full items-center justify-start pl-3">'
+    '<a href="/bookmaker/{slug}/link/" class="flex items-center gap-[6px]">'
+    '<img class="bookmaker-logo h-[20px] w-[60px]" title="{name}" alt="{name}" src="/logos/{slug}.png"></a></div>'
+    "{cells}</div>"
+)
+_CELL_TEMPLATE = (
+    '<div class="flex-center min-w-[60px] flex-col gap-1 pb-0.5 pt-0.5 font-bold">'
+    '<div class="flex-center flex-col font-bold"><p class="height-content">{odds}</p></div></div>'
+)
+
+
+def build_fixture(bookmaker_count: int = BOOKMAKER_COUNT) -> str:
+    """Build a deterministic odds table; every tenth cell repeats its value as the live page sometimes does."""
+    rows = []
+    for index in range(bookmaker_count):
+        cells = []
+        for outcome in range(len(ODDS_LABELS)):
+            odds = f"{1.5 + ((index * 7 + outcome * 13) % 300) / 100:.2f}"
+            cells.append(_CELL_TEMPLATE.format(odds=odds * 2 if (index + outcome) % 10 == 0 else odds))
+        rows.append(_ROW_TEMPLATE.format(slug=f"bookmaker-{index}", name=f"Bookmaker {index}", cells="".join(cells)))
+    return f"<div>{''.join(rows)}</div>"
+
+
+def legacy_parse_bookmaker_rows(soup, period: str, odds_labels: list) -> list[dict]:
+    """The row loop as it was before the pattern registry, kept here as the benchmark baseline."""
+    bookmaker_blocks = soup.find_all("div", class_=re.compile(r"border-black-borders"))
+
+    odds_data = []
+    for block in bookmaker_blocks:
+        img_tag = block.find("img", class_="bookmaker-logo")
+        bookmaker_name = img_tag["title"] if img_tag and "title" in img_tag.attrs else "Unknown"
+        odds_blocks = block.find_all("div", class_=re.compile(r"flex-center.*flex-col.*font-bold"))
+
+        if len(odds_blocks) < len(odds_labels):
+            continue
+
+        extracted_odds = {label: odds_blocks[i].get_text(strip=True) for i, label in enumerate(odds_labels)}
+        for key, value in extracted_odds.items():
+            extracted_odds[key] = re.sub(r"(\d+\.\d+)\1", r"\1", value)
+
+        extracted_odds["bookmaker_name"] = bookmaker_name
+        extracted_odds["period"] = period
+        odds_data.append(extracted_odds)
+
+    return odds_data
+
+
+def _time_per_row(parse, source, rows: int, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        parse(source)
+        samples.append((time.perf_counter() - start) / rows * 1e6)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20, help="Timed parses per implementation.")
+    parser.add_argument("--regenerate", action="store_true", help="Rewrite the saved fixture before running.")
+    args = parser.parse_args()
+
+    if args.regenerate or not FIXTURE_PATH.exists():
+        FIXTURE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        FIXTURE_PATH.write_text(build_fixture(), encoding="utf-8")
+
+    html_content = FIXTURE_PATH.read_text(encoding="utf-8")
+    logging.disable(logging.WARNING)
+    odds_parser = OddsParser()
+    soup = parse_html(html_content)
+
+    legacy_rows = legacy_parse_bookmaker_rows(soup, "FullTime", ODDS_LABELS)
+    current_rows = odds_parser.parse_bookmaker_rows(soup, "FullTime", ODDS_LABELS)
+    assert legacy_rows == current_rows, "Current parser output differs from the legacy parser"
+    rows = len(current_rows)
+
+    cases = {
+        "row extraction (pre-parsed tree)": (
+            soup,
+            lambda tree: legacy_parse_bookmaker_rows(tree, "FullTime", ODDS_LABELS),
+            lambda tree: odds_parser.parse_bookmaker_rows(tree, "FullTime", ODDS_LABELS),
+        ),
+        "end to end (html -> odds)": (
+            html_content,
+            lambda html: legacy_parse_bookmaker_rows(parse_html(html), "FullTime", ODDS_LABELS),
+            lambda html: odds_parser.parse_market_odds(html, "FullTime", ODDS_LABELS),
+        ),
+    }
+
+    print(f"{rows} bookmaker rows, {args.iterations} iterations, median cost per row:")
+    for name, (source, legacy, current) in cases.items():
+        legacy_cost = statistics.median(_time_per_row(legacy, source, rows, args.iterations))
+        current_cost = statistics.median(_time_per_row(current, source, rows, args.iterations))
+        print(
+            f"  {name:<34} legacy {legacy_cost:7.1f} us  current {current_cost:7.1f} us  "
+            f"({legacy_cost / current_cost:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Offline benchmark of every odds parser on pages served by the site stand-in.
+
+A match page and its odds feed are fetched over HTTP from a local `SiteStandIn`, then each parser is timed on
+them: the bookmaker rows (`OddsParser.parse_market_odds`), the odds movement modal
+(`OddsParser.parse_odds_history_modal`), the feed body (`OddsFeedClient.decode_body`) and the feed odds of every
+market tab (`OddsFeedDecoder.decode_market`). Reports calls per second and p50/p95 per call.
+
+Usage:
+    python -m benchmarks.bench_parsers [--iterations 200] [--bookmakers 30]
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from urllib.parse import urlparse
+from urllib.request import urlopen
+
+from benchmarks.site_standin import FEED_BETTING_TYPES, SiteStandIn, build_odds_history_modal
+from src.core.market_extraction.odds_feed_client import OddsFeedClient
+from src.core.market_extraction.odds_feed_decoder import OddsFeedDecoder
+from src.core.market_extraction.odds_parser import OddsParser
+
+LEAGUE_PATH = "football/england/premier-league-2023-2024"
+ODDS_LABELS = ["1", "X", "2"]
+
+
+def _time_calls(call, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per parser.")
+    parser.add_argument("--bookmakers", type=int, default=30, help="Bookmaker rows of the match page.")
+    parser.add_argument("--pages_dir", type=str, default=None, help="Saved pages the stand-in serves first.")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    odds_parser = OddsParser()
+    feed_decoder = OddsFeedDecoder()
+
+    with SiteStandIn(pages_dir=args.pages_dir, results_pages=1, matches_per_page=1, bookmakers=args.bookmakers) as s:
+        match_path = urlparse(s.match_links(LEAGUE_PATH)[0]).path
+        match_id = match_path.strip("/").rsplit("-", 1)[1]
+        with urlopen(f"{s.origin}{match_path}") as response:  # noqa: S310
+            match_html = response.read().decode("utf-8")
+        with urlopen(f"{s.origin}/feed/match-event/{match_id}.dat") as response:  # noqa: S310
+            feed_body = response.read().decode("utf-8")
+
+    modal_html = build_odds_history_modal()
+    feed_payload = OddsFeedClient.decode_body(feed_body)
+
+    def decode_every_market():
+        for market in FEED_BETTING_TYPES:
+            feed_decoder.decode_market(feed_payload, market, None, "FullTime", ODDS_LABELS)
+
+    cases = {
+        "bookmaker rows (html -> odds)": lambda: odds_parser.parse_market_odds(match_html, "FullTime", ODDS_LABELS),
+        "odds movement modal": lambda: odds_parser.parse_odds_history_modal(modal_html),
+        "odds feed body (json)": lambda: OddsFeedClient.decode_body(feed_body),
+        f"odds feed, {len(FEED_BETTING_TYPES)} markets": decode_every_market,
+    }
+
+    print(f"{args.bookmakers} bookmakers, {args.iterations} iterations:")
+    for name, call in cases.items():
+        samples = _time_calls(call, args.iterations)
+        print(
+            f"  {name:<30} {1 / statistics.fmean(samples):9.0f} calls/s  "
+            f"p50 {_percentile(samples, 0.5) * 1e3:7.3f} ms  p95 {_percentile(samples, 0.95) * 1e3:7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+End-to-end throughput benchmark of the scraper, run offline.
+
+Runs `scrape_historic` (results pages, link collection and odds) and `scrape_matches` (odds of known links) in a
+headless browser, against the local `SiteStandIn` or against a run recorded with `--record_har`, and reports
+matches/min, p50/p95 per-match latency, CPU time and peak RSS of the whole process tree (Python, the Playwright
+driver and the browser). Wall time, and so matches/min, includes starting and stopping the browser. With
+`--stages`, the p50/p95 of every stage of a match (goto, tab navigation, parse, ...) are listed too; with
+`--trace DIR`, the page calls of each scenario are traced to `DIR/<scenario>.json` and the slowest are listed.
+
+Usage:
+    python -m benchmarks.bench_scraper [--scenario all] [--pages 2] [--matches 40] [--concurrency 4]
+        [--markets 1x2,double_chance] [--use_odds_feed] [--replay_har DIR] [--league L] [--season S] [--stages]
+        [--trace DIR]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import glob
+import json
+import logging
+import math
+import os
+import re
+import resource
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+from benchmarks.site_standin import SiteStandIn
+from src.core.browser_helper import BrowserHelper
+from src.core.har_archive import HarArchive
+from src.core.odds_portal_market_extractor import OddsPortalMarketExtractor
+from src.core.odds_portal_scraper import OddsPortalScraper
+from src.core.page_readiness import PageReadiness
+from src.core.page_tracer import PageTracer
+from src.core.playwright_manager import PlaywrightManager
+from src.core.request_rate_limiter import RequestRateLimiter
+from src.core.scrape_metrics import ScrapeMetrics
+from src.core.sport_market_registry import SportMarketRegistrar
+from src.core.url_builder import URLBuilder
+from src.utils.constants import ODDSPORTAL_BASE_URL
+
+SPORT = "football"
+SCENARIOS = ["historic", "matches"]
+# Sport, country, league-season and "<home>-<away>-<8 character id>" segments
+_RECORDED_MATCH_URL = re.compile(rf"^{re.escape(ODDSPORTAL_BASE_URL)}(/[^/#?]+){{3}}/[^/#?]+-[A-Za-z0-9]{{8}}/$")
+
+
+class ProcessTreeSampler:
+    """
+    Measures the CPU time and peak resident memory of this process and all its descendants over a block.
+
+    Memory is sampled from `/proc` every `interval` seconds (Linux); elsewhere only this process's own peak RSS is
+    known. CPU time comes from `getrusage`: descendants are only counted once they have exited and been waited for,
+    so the browser must be stopped inside the block. The site stand-in runs in this process and is counted too.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.peak_rss = 0
+        self.cpu_seconds = 0.0
+        self._task: asyncio.Task | None = None
+        self._cpu_at_start = 0.0
+
+    async def __aenter__(self) -> "ProcessTreeSampler":
+        self._cpu_at_start = self._cpu_time()
+        self._task = asyncio.create_task(self._sample_forever())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self.cpu_seconds = self._cpu_time() - self._cpu_at_start
+        if not self.peak_rss:
+            # No /proc: fall back to this process's own peak (ru_maxrss is in KiB on Linux)
+            self.peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    async def _sample_forever(self):
+        while True:
+            self.peak_rss = max(self.peak_rss, self._tree_rss())
+            await asyncio.sleep(self.interval)
+
+    @staticmethod
+    def _cpu_time() -> float:
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+    @staticmethod
+    def _tree_rss() -> int:
+        children: dict[int, list[int]] = {}
+        for stat_path in glob.glob("/proc/[0-9]*/stat"):
+            try:
+                with open(stat_path, encoding="utf-8") as file:
+                    # The command name may hold spaces; the fields after its closing parenthesis do not
+                    fields = file.read().rsplit(")", 1)[1].split()
+                children.setdefault(int(fields[1]), []).append(int(stat_path.split("/")[2]))
+            except (OSError, IndexError, ValueError):
+                continue
+
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        total, pending = 0, [os.getpid()]
+        while pending:
+            pid = pending.pop()
+            pending.extend(children.get(pid, []))
+            try:
+                with open(f"/proc/{pid}/statm", encoding="utf-8") as file:
+                    total += int(file.read().split()[1]) * page_size
+            except (OSError, IndexError, ValueError):
+                continue
+        return total
+
+
+def recorded_match_links(har_dir: str) -> list[str]:
+    """The match pages loaded by a recorded run, in the order they were first requested."""
+    links = []
+    for har_path in sorted(glob.glob(os.path.join(har_dir, HarArchive.HAR_FILE_PATTERN))):
+        with open(har_path, encoding="utf-8") as file:
+            entries = json.load(file).get("log", {}).get("entries", [])
+        links.extend(entry["request"]["url"] for entry in entries if _RECORDED_MATCH_URL.match(entry["request"]["url"]))
+    return list(dict.fromkeys(links))
+
+
+def build_scraper(args: argparse.Namespace) -> OddsPortalScraper:
+    # The site is local: the rate limit only has to stay out of the way
+    rate_limiter = RequestRateLimiter(rate=args.requests_per_second, burst=args.concurrency)
+    page_readiness = PageReadiness()
+    browser_helper = BrowserHelper(page_readiness=page_readiness)
+    market_extractor = OddsPortalMarketExtractor(
+        browser_helper=browser_helper, page_readiness=page_readiness, rate_limiter=rate_limiter, metrics=ScrapeMetrics()
+    )
+    return OddsPortalScraper(
+        playwright_manager=PlaywrightManager(),
+        browser_helper=browser_helper,
+        market_extractor=market_extractor,
+        concurrency_tasks=args.concurrency,
+        use_odds_feed=args.use_odds_feed,
+        link_collection_tabs=args.concurrency,
+        rate_limiter=rate_limiter,
+        tracer=PageTracer() if args.trace else None,
+    )
+
+
+async def run_scenario(
+    scenario: str, args: argparse.Namespace, standin: SiteStandIn | None, match_links: list[str]
+) -> dict[str, Any]:
+    scraper = build_scraper(args)
+    har_archive = HarArchive(har_dir=args.replay_har, replay=True) if args.replay_har else None
+
+    async with ProcessTreeSampler() as usage:
+        started_at = time.perf_counter()
+        await scraper.start_playwright(headless=True, har_archive=har_archive)
+        try:
+            if standin:
+                for context in scraper.playwright_manager.contexts:
+                    await standin.attach(context)
+
+            if scenario == "historic":
+                results = await scraper.scrape_historic(
+                    sport=SPORT, league=args.league, season=args.season, markets=args.markets, max_pages=args.pages
+                )
+            else:
+                results = await scraper.scrape_matches(match_links=match_links, sport=SPORT, markets=args.markets)
+        finally:
+            await scraper.stop_playwright()
+        elapsed = time.perf_counter() - started_at
+
+    trace = None
+    if scraper.tracer:
+        scraper.tracer.write(os.path.join(args.trace, f"{scenario}.json"))
+        trace = scraper.tracer.describe_slowest(args.trace_top)
+
+    scraped = len(results or [])
+    latency = ((scraper.last_pipeline_metrics or {}).get("stages") or {}).get("scrape", {})
+    return {
+        "scenario": scenario,
+        "matches": scraped,
+        "seconds": elapsed,
+        "matches_per_min": scraped / elapsed * 60 if elapsed else 0.0,
+        "p50": latency.get("p50", float("nan")),
+        "p95": latency.get("p95", float("nan")),
+        "cpu_seconds": usage.cpu_seconds,
+        "peak_rss_mib": usage.peak_rss / 1024 / 1024,
+        "stages": scraper.metrics.summary()["stages"],
+        "trace": trace,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> list[dict[str, Any]]:
+    SportMarketRegistrar.register_all_markets()
+    scenarios = SCENARIOS if args.scenario == "all" else [args.scenario]
+
+    if args.replay_har:
+        return [
+            await run_scenario(scenario, args, None, recorded_match_links(args.replay_har)[: args.matches])
+            for scenario in scenarios
+        ]
+
+    league_url = URLBuilder.get_historic_matches_url(sport=SPORT, league=args.league, season=args.season)
+    league_path = urlparse(league_url).path.strip("/").removesuffix("/results")
+    with SiteStandIn(
+        pages_dir=args.pages_dir,
+        results_pages=args.pages,
+        matches_per_page=math.ceil(args.matches / args.pages),
+        bookmakers=args.bookmakers,
+    ) as standin:
+        match_links = standin.match_links(league_path)[: args.matches]
+        return [await run_scenario(scenario, args, standin, match_links) for scenario in scenarios]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "all"], default="all", help="Scenario(s) to run.")
+    parser.add_argument("--pages", type=int, default=2, help="Results pages scraped by the historic scenario.")
+    parser.add_argument("--matches", type=int, default=40, help="Matches per scenario.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent match tabs (and link tabs).")
+    parser.add_argument("--markets", type=lambda value: value.split(","), default=["1x2"], help="Markets to scrape.")
+    parser.add_argument("--use_odds_feed", action="store_true", help="Decode odds from the feed when possible.")
+    parser.add_argument("--bookmakers", type=int, default=30, help="Bookmaker rows of the stand-in match pages.")
+    parser.add_argument("--pages_dir", type=str, default=None, help="Saved pages the stand-in serves first.")
+    parser.add_argument("--replay_har", type=str, default=None, help="Replay a recorded run instead of the stand-in.")
+    parser.add_argument("--league", type=str, default="england-premier-league", help="League of the historic run.")
+    parser.add_argument("--season", type=str, default="2023-2024", help="Season of the historic run.")
+    parser.add_argument("--requests_per_second", type=float, default=1000.0, help="Rate limit of the offline site.")
+    parser.add_argument("--stages", action="store_true", help="Also report the timings of every match stage.")
+    parser.add_argument("--trace", type=str, default=None, help="Directory to write page call traces to.")
+    parser.add_argument("--trace_top", type=int, default=10, help="Slowest traced calls listed per scenario.")
+    parser.add_argument("--verbose", action="store_true", help="Show the scraper's logs.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    reports = asyncio.run(run_benchmark(args))
+
+    source = f"HAR replay of {args.replay_har}" if args.replay_har else "site stand-in"
+    print(f"{source}, concurrency {args.concurrency}, markets {','.join(args.markets)}:")
+    for report in reports:
+        print(
+            f"  {report['scenario']:<9} {report['matches']:>4} matches in {report['seconds']:6.1f}s  "
+            f"{report['matches_per_min']:7.1f} matches/min  p50 {report['p50']:5.2f}s  p95 {report['p95']:5.2f}s  "
+            f"CPU {report['cpu_seconds']:6.1f}s  peak RSS {report['peak_rss_mib']:7.1f} MiB"
+        )
+        if args.stages:
+            for stage, timings in report["stages"].items():
+                print(
+                    f"    {stage:<18} {timings['count']:>5} x  p50 {timings['p50']:6.3f}s  p95 {timings['p95']:6.3f}s  "
+                    f"total {timings['total']:7.1f}s"
+                )
+        if report["trace"]:
+            print(report["trace"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+Local HTTP stand-in for the OddsPortal pages the scraper reads, for offline runs and benchmarks.
+
+Serves the home page, league results listings (`/<sport>/<country>/<league>-<season>/results/`), match pages
+(`/<sport>/<country>/<league>-<season>/<home>-<away>-<id>/`) and their odds feed (`/feed/match-event/<id>.dat`).
+Saved pages placed in `pages_dir` by URL path (e.g. `football/england/premier-league-2023-2024/results/index.html`)
+are served as they are; every other page is generated deterministically from its URL with the structure the
+scraper's selectors expect: paginated event rows, the react event header, market tabs, bookmaker rows, an odds
+movement modal shown on hover and a JSON odds feed.
+
+`SiteStandIn.attach` points a browser context at the stand-in: requests to the site are answered by it and every
+other request is aborted, so a run never leaves the machine.
+
+Usage:
+    python -m benchmarks.site_standin [--port 8765] [--pages_dir DIR]
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any
+from urllib.parse import urlparse
+import zlib
+
+from playwright.async_api import BrowserContext, Request, Route
+
+from src.utils.constants import ODDSPORTAL_BASE_URL
+
+SITE_HOST = urlparse(ODDSPORTAL_BASE_URL).netloc
+MARKET_TABS = ["1X2", "Home/Away", "Both Teams to Score", "Double Chance", "Draw No Bet"]
+# Betting type ids of the tabs in the odds feed (see `OddsFeedDecoder.BETTING_TYPE_IDS`), full time scope
+FEED_BETTING_TYPES = {"1X2": 1, "Home/Away": 3, "Double Chance": 4, "Draw No Bet": 6, "Both Teams to Score": 13}
+
+_RESULTS_PATH = re.compile(r"^/(?P<league_path>[^/]+/[^/]+/[^/]+)/results/$")
+_MATCH_PATH = re.compile(r"^/(?P<league_path>[^/]+/[^/]+/[^/]+)/[a-z0-9-]+-(?P<match_id>[A-Za-z0-9]{8})/$")
+_FEED_PATH = re.compile(r"^/feed/match-event/(?P<match_id>[A-Za-z0-9]{8})\.dat$")
+
+_ODDS_ROW = (
+    '<div class="border-black-borders flex h-9 border-b border-l border-r text-xs">'
+    '<div class="flex w-full items-center justify-start pl-3">'
+    '<a href="/bookmaker/bookmaker-{index}/link/" class="flex items-center gap-[6px]">'
+    '<img class="bookmaker-logo h-[20px] w-[60px]" title="Bookmaker {index}" alt="Bookmaker {index}"></a></div>'
+    "{cells}</div>"
+)
+_ODDS_CELL = (
+    '<div class="flex-center min-w-[60px] flex-col gap-1 pb-0.5 pt-0.5">'
+    '<div class="flex-center flex-col font-bold"><p class="height-content">{odds:.2f}</p></div></div>'
+)
+
+_PAGE_SHELL = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<header>
+  <div class="group"><button class="gap-2">Decimal Odds</button>
+    <div class="dropdown-content"><ul>
+      <li><a>Decimal Odds</a></li><li><a>Fractional Odds</a></li><li><a>Money Line Odds</a></li>
+    </ul></div>
+  </div>
+</header>
+<main>{body}</main>
+<div id="onetrust-banner-sdk"><button id="onetrust-accept-btn-handler">I Accept</button></div>
+<script>
+  const banner = document.getElementById("onetrust-banner-sdk");
+  if (document.cookie.includes("OptanonAlertBoxClosed=")) banner.remove();
+  document.getElementById("onetrust-accept-btn-handler").addEventListener("click", () => {{
+    document.cookie = "OptanonAlertBoxClosed=1; path=/";
+    banner.remove();
+  }});
+</script>
+{scripts}
+</body></html>
+"""
+
+_RESULTS_SCRIPT = """<script>
+  const MATCHES = {matches};
+  const PER_PAGE = {per_page};
+  function renderRows() {{
+    const found = location.hash.match(/#\\/page\\/(\\d+)/);
+    const page = found ? parseInt(found[1]) : 1;
+    document.getElementById("event-rows").innerHTML = MATCHES.slice((page - 1) * PER_PAGE, page * PER_PAGE)
+      .map(([href, home, away, score]) =>
+        `<div class="eventRow flex w-full flex-col text-xs"><a href="${{href}}">${{home}} - ${{away}}</a>` +
+        `<div class="font-bold">${{score}}</div></div>`)
+      .join("");
+  }}
+  renderRows();
+  window.addEventListener("hashchange", renderRows);
+</script>"""
+
+_MATCH_SCRIPT = """<script>
+  const MODAL = {modal};
+  document.querySelectorAll("ul.odds-tabs > li").forEach((tab) => tab.addEventListener("click", () => {{
+    document.querySelectorAll("ul.odds-tabs > li").forEach((other) => other.classList.remove("active"));
+    tab.classList.add("active");
+    const rows = document.getElementById("odds-rows");
+    rows.innerHTML = rows.innerHTML;
+    bindHistory();
+  }}));
+  function bindHistory() {{
+    document.querySelectorAll("div.flex-center.flex-col.font-bold").forEach((cell) => {{
+      cell.addEventListener("mouseenter", () => {{
+        const modal = document.createElement("div");
+        modal.id = "odds-movement";
+        modal.innerHTML = MODAL;
+        document.body.appendChild(modal);
+      }});
+      cell.addEventListener("mouseleave", () => {{
+        document.querySelectorAll("#odds-movement").forEach((modal) => modal.remove());
+      }});
+    }});
+  }}
+  bindHistory();
+  fetch("/feed/match-event/{match_id}.dat");
+</script>"""
+
+
+def match_id_for(league_path: str, index: int) -> str:
+    """Deterministic 8 character id of the `index`-th match of a league season."""
+    return f"{zlib.crc32(f'{league_path}/{index}'.encode()):08x}"
+
+
+def build_match_links(league_path: str, count: int) -> list[str]:
+    """
+    The match URLs of a generated league season, in the order its results pages list them.
+
+    Args:
+        league_path (str): Sport, country and league-season path, e.g. "football/england/premier-league-2023-2024".
+        count (int): Number of matches.
+
+    Returns:
+        List[str]: Absolute match URLs on the site's host.
+    """
+    return [
+        f"{ODDSPORTAL_BASE_URL}/{league_path}/home-fc-{index}-away-fc-{index}-{match_id_for(league_path, index)}/"
+        for index in range(count)
+    ]
+
+
+def build_odds_rows(match_id: str, bookmakers: int) -> str:
+    """Bookmaker rows of a match, three odds each, with the markup `OddsParser` reads."""
+    seed = zlib.crc32(match_id.encode())
+    return "".join(
+        _ODDS_ROW.format(
+            index=index,
+            cells="".join(
+                _ODDS_CELL.format(odds=1.2 + ((seed + (index + 1) * 7 + outcome * 13) % 400) / 100)
+                for outcome in range(3)
+            ),
+        )
+        for index in range(bookmakers)
+    )
+
+
+def build_odds_history_modal(points: int = 12) -> str:
+    """Inner HTML of an odds movement modal with `points` odds changes, as `OddsParser` expects it."""
+    timestamps = "".join(
+        f'<div class="flex gap-3"><div class="font-normal">{1 + index % 28:02d} Mar, {index % 24:02d}:05</div></div>'
+        for index in range(points)
+    )
+    odds = "".join(f'<div class="font-bold">{1.8 + index / 50:.2f}</div>' for index in range(points))
+    return (
+        "<h3>Odds movement</h3>"
+        f'<div class="flex flex-col gap-1">{timestamps}</div>'
+        f'<div class="flex flex-col gap-1">{odds}</div>'
+        '<div class="mt-2 gap-1"><div class="flex gap-1"><div>01 Mar, 09:00</div>'
+        '<div class="font-bold">2.30</div></div></div>'
+    )
+
+
+def build_odds_feed(match_id: str, bookmakers: int) -> dict[str, Any]:
+    """
+    Odds feed payload of a match in the shape `OddsFeedDecoder` reads, for every tab of `MARKET_TABS`.
+
+    The odds match the bookmaker rows of `build_odds_rows`, so both extraction paths return the same data.
+    """
+    seed = zlib.crc32(match_id.encode())
+    outcome_groups = {}
+    for betting_type_id in FEED_BETTING_TYPES.values():
+        outcome_groups[f"E-{betting_type_id}-2-0-0-0"] = {
+            "odds": {
+                str(provider): [1.2 + ((seed + provider * 7 + outcome * 13) % 400) / 100 for outcome in range(3)]
+                for provider in range(1, bookmakers + 1)
+            }
+        }
+    return {
+        "d": {
+            "oddsdata": {"back": outcome_groups},
+            "providersNames": {str(provider): f"Bookmaker {provider - 1}" for provider in range(1, bookmakers + 1)},
+        }
+    }
+
+
+class SiteStandIn:
+    """
+    Threaded local HTTP server answering for the site, plus the browser routing that sends the site's requests to it.
+    """
+
+    def __init__(
+        self,
+        pages_dir: str | None = None,
+        results_pages: int = 3,
+        matches_per_page: int = 50,
+        bookmakers: int = 30,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            pages_dir (Optional[str]): Directory of saved pages, served instead of the generated ones.
+            results_pages (int): Number of results pages of every generated league season.
+            matches_per_page (int): Matches listed per results page.
+            bookmakers (int): Bookmaker rows of every generated match page.
+            host (str): Interface to listen on.
+            port (int): Port to listen on; 0 picks a free one.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.pages_dir = pages_dir
+        self.results_pages = results_pages
+        self.matches_per_page = matches_per_page
+        self.bookmakers = bookmakers
+        self.counters = {"served": 0, "not_found": 0, "aborted": 0}
+        self._server = ThreadingHTTPServer((host, port), _StandInRequestHandler)
+        self._server.standin = self
+        self._thread: threading.Thread | None = None
+        self.origin = f"http://{host}:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "SiteStandIn":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Site stand-in listening on {self.origin}")
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def match_links(self, league_path: str) -> list[str]:
+        """
+        The match URLs listed by the results pages of a league season.
+
+        Args:
+            league_path (str): Sport, country and league-season path, e.g. "football/england/premier-league-2023-2024".
+
+        Returns:
+            List[str]: Absolute match URLs on the site's host.
+        """
+        return build_match_links(league_path, self.results_pages * self.matches_per_page)
+
+    async def attach(self, context: BrowserContext):
+        """
+        Answer the site's requests of every page of a browser context from the stand-in and abort all others.
+
+        Args:
+            context (BrowserContext): The context.
+        """
+        await context.route("**/*", self._handle_route)
+
+    def render(self, path: str) -> tuple[int, str, bytes]:
+        """
+        Build the response to a GET of a site path.
+
+        Args:
+            path (str): The URL path, without query string or fragment.
+
+        Returns:
+            Tuple[int, str, bytes]: HTTP status, content type and body.
+        """
+        saved = self._saved_page(path)
+        if saved is not None:
+            return 200, "text/html; charset=utf-8", saved
+
+        if path == "/":
+            return 200, "text/html; charset=utf-8", self._render_home()
+        if match := _RESULTS_PATH.match(path):
+            return 200, "text/html; charset=utf-8", self._render_results(match["league_path"])
+        if match := _MATCH_PATH.match(path):
+            return 200, "text/html; charset=utf-8", self._render_match(match["match_id"])
+        if match := _FEED_PATH.match(path):
+            body = json.dumps(build_odds_feed(match["match_id"], self.bookmakers)).encode()
+            return 200, "application/json", body
+        return 404, "text/plain", b"Not found"
+
+    async def _handle_route(self, route: Route, request: Request):
+        url = urlparse(request.url)
+        if url.netloc != SITE_HOST:
+            self.counters["aborted"] += 1
+            await route.abort()
+            return
+
+        response = await route.fetch(url=f"{self.origin}{url.path}{'?' + url.query if url.query else ''}")
+        await route.fulfill(response=response)
+
+    def _saved_page(self, path: str) -> bytes | None:
+        if not self.pages_dir:
+            return None
+
+        relative_path = path.strip("/")
+        for candidate in (
+            os.path.join(self.pages_dir, relative_path, "index.html"),
+            os.path.join(self.pages_dir, relative_path),
+        ):
+            if os.path.isfile(candidate):
+                with open(candidate, "rb") as file:
+                    return file.read()
+        return None
+
+    def _render_home(self) -> bytes:
+        return _PAGE_SHELL.format(title="OddsPortal stand-in", body="<h1>Stand-in</h1>", scripts="").encode()
+
+    def _render_results(self, league_path: str) -> bytes:
+        matches = [
+            [urlparse(link).path, f"Home FC {index}", f"Away FC {index}", f"{index % 4}:{index % 3}"]
+            for index, link in enumerate(self.match_links(league_path))
+        ]
+        pagination = "".join(
+            f'<a class="pagination-link" href="#/page/{page}/">{page}</a>' for page in range(1, self.results_pages + 1)
+        )
+        body = f'<div id="event-rows"></div><div class="pagination">{pagination}</div>'
+        scripts = _RESULTS_SCRIPT.format(matches=json.dumps(matches), per_page=self.matches_per_page)
+        return _PAGE_SHELL.format(title=f"{league_path} results", body=body, scripts=scripts).encode()
+
+    def _render_match(self, match_id: str) -> bytes:
+        seed = zlib.crc32(match_id.encode())
+        home, away = f"Home {match_id}", f"Away {match_id}"
+        header = {
+            "eventBody": {
+                "startDate": 1_700_000_000 + seed % 10_000_000,
+                "homeResult": str(seed % 4),
+                "awayResult": str(seed % 3),
+                "partialresult": f"({seed % 2}:{seed % 2}, {seed % 3}:{seed % 2})",
+                "venue": "Stand-in Stadium",
+                "venueTown": "Localhost",
+                "venueCountry": "Nowhere",
+            },
+            "eventData": {"home": home, "away": away, "tournamentName": "Stand-in League"},
+        }
+        tabs = "".join(
+            f'<li class="{"active" if index == 0 else ""}">{name}</li>' for index, name in enumerate(MARKET_TABS)
+        )
+        body = (
+            f"<div id=\"react-event-header\" data='{json.dumps(header).replace(chr(39), '&#39;')}'></div>"
+            f'<ul class="visible-links bg-black-main odds-tabs">{tabs}</ul>'
+            f'<div id="odds-rows">{build_odds_rows(match_id, self.bookmakers)}</div>'
+        )
+        scripts = _MATCH_SCRIPT.format(modal=json.dumps(build_odds_history_modal()), match_id=match_id)
+        return _PAGE_SHELL.format(title=f"{home} - {away}", body=body, scripts=scripts).encode()
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    server: ThreadingHTTPServer
+
+    def do_GET(self):
+        standin: SiteStandIn = self.server.standin
+        status, content_type, body = standin.render(urlparse(self.path).path)
+        standin.counters["served" if status == 200 else "not_found"] += 1
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on.")
+    parser.add_argument("--pages_dir", type=str, default=None, help="Directory of saved pages to serve.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    standin = SiteStandIn(pages_dir=args.pages_dir, port=args.port)
+    league_path = "football/england/premier-league-2023-2024"
+    print(f"Serving on {standin.origin}, e.g. {standin.origin}/{league_path}/results/")
+    try:
+        standin.start()
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        standin.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,9 @@ class CLIArgumentHandler:
             "storage_type": args.storage,
             "storage_format": getattr(args, "format", None),
             "file_path": getattr(args, "file_path", None),
+            "stream_results": getattr(args, "stream_results", False),
+            "compact_json": getattr(args, "compact_json", False),
+            "csv_layout": getattr(args, "csv_layout", "wide"),
             "max_pages": getattr(args, "max_pages", None),
             "max_matches": getattr(args, "max_matches", None),
             "proxies": getattr(args, "proxies", None),
@@ -49,4 +52,26 @@ class CLIArgumentHandler:
             "scrape_odds_history": getattr(args, "scrape_odds_history", False),
             "preview_submarkets_only": getattr(args, "preview_submarkets_only", False),
             "concurrency_tasks": getattr(args, "concurrency_tasks", 3),
+            "max_concurrency_tasks": getattr(args, "max_concurrency_tasks", None),
+            "use_odds_feed": getattr(args, "use_odds_feed", False),
+            "checkpoint_path": getattr(args, "checkpoint_path", None),
+            "parallel_jobs": getattr(args, "parallel_jobs", 1),
+            "browser_contexts": getattr(args, "browser_contexts", 1),
+            "block_resources": getattr(args, "block_resources", False),
+            "blocked_resource_types": getattr(args, "blocked_resource_types", None),
+            "blocked_domains": getattr(args, "blocked_domains", None),
+            "allowed_domains": getattr(args, "allowed_domains", None),
+            "asset_cache_dir": getattr(args, "asset_cache_dir", None),
+            "asset_cache_size_mb": getattr(args, "asset_cache_size_mb", 500),
+            "link_collection_tabs": getattr(args, "link_collection_tabs", 3),
+            "requests_per_second": getattr(args, "requests_per_second", 1.0),
+            "request_burst": getattr(args, "request_burst", 3),
+            "per_proxy_rate_limit": getattr(args, "per_proxy_rate_limit", False),
+            "record_har": getattr(args, "record_har", None),
+            "replay_har": getattr(args, "replay_har", None),
+            "metrics_json": getattr(args, "metrics_json", None),
+            "metrics_port": getattr(args, "metrics_port", None),
+            "metrics_host": getattr(args, "metrics_host", "127.0.0.1"),
+            "trace_file": getattr(args, "trace_file", None),
+            "trace_top": getattr(args, "trace_top", 20),
         }
@@ -1,6 +1,7 @@
 import argparse
 
 from src.cli.cli_help_message_generator import CLIHelpMessageGenerator
+from src.storage.csv_layout import CsvLayout
 from src.storage.storage_format import StorageFormat
 from src.storage.storage_type import StorageType
 from src.utils.odds_format_enum import OddsFormat
@@ -47,10 +48,18 @@ class CLIArgumentParser:
         parser.add_argument(
             "--season",
             type=str,
-            help="📅 Season to scrape (format: YYYY, YYYY-YYYY, e.g., 2023 or 2022-2023).",
+            help=(
+                "📅 Season(s) to scrape, comma-separated (format: YYYY, YYYY-YYYY, e.g., 2023 or 2022-2023,2023-2024)."
+            ),
         )
         parser.add_argument("--max_pages", type=int, help="📑 Maximum number of pages to scrape (optional).")
         parser.add_argument("--max_matches", type=int, help="🎯 Maximum number of matches to scrape (optional).")
+        parser.add_argument(
+            "--link_collection_tabs",
+            type=int,
+            default=3,
+            help="🗂️ Number of result pages loaded concurrently while collecting match links (default: 3).",
+        )
 
     def _add_common_arguments(self, parser):
         parser.add_argument(
@@ -103,7 +112,27 @@ class CLIArgumentParser:
             type=str,
             choices=[f.value for f in StorageFormat],
             default="json",
-            help="📝 Storage format (json or csv, default: json).",
+            help="📝 Storage format (json, csv, jsonl or parquet, default: json).",
+        )
+        parser.add_argument(
+            "--stream_results",
+            action="store_true",
+            help=(
+                "🌊 Write each match to --file_path as soon as it is scraped instead of at the end of the run "
+                "(local storage only)."
+            ),
+        )
+        parser.add_argument(
+            "--compact_json",
+            action="store_true",
+            help="🗜️ Write JSON output without indentation (smaller files, faster saves).",
+        )
+        parser.add_argument(
+            "--csv_layout",
+            type=str,
+            choices=[f.value for f in CsvLayout],
+            default=CsvLayout.WIDE.value,
+            help="🧾 CSV rows: one per match (wide) or one per match, market and bookmaker (long) (default: wide).",
         )
         parser.add_argument(
             "--proxies",
@@ -150,7 +179,16 @@ class CLIArgumentParser:
             "--concurrency_tasks",
             type=int,
             default=3,
-            help="⚡ Number of concurrent tasks for scraping (default: 3).",
+            help="⚡ Number of concurrent tasks for scraping to start with (default: 3).",
+        )
+        parser.add_argument(
+            "--max_concurrency_tasks",
+            type=int,
+            default=None,
+            help=(
+                "📈 Ceiling the concurrency may grow to while scraping stays healthy; it backs off on timeouts, "
+                "empty odds and CPU/memory pressure (default: --concurrency_tasks)."
+            ),
         )
         parser.add_argument(
             "--preview_submarkets_only",
@@ -160,6 +198,135 @@ class CLIArgumentParser:
                 "individual bookmaker details (faster, limited data)."
             ),
         )
+        parser.add_argument(
+            "--use_odds_feed",
+            action="store_true",
+            help=(
+                "📡 Read market odds from the match page's odds feed responses in a single page load, "
+                "falling back to tab navigation for markets the feed does not carry."
+            ),
+        )
+        parser.add_argument(
+            "--checkpoint_path",
+            type=str,
+            default=None,
+            help=(
+                "💾 SQLite file recording finished matches and markets; rerunning with the same arguments "
+                "resumes where the previous run stopped."
+            ),
+        )
+        parser.add_argument(
+            "--parallel_jobs",
+            type=int,
+            default=1,
+            help="🧵 Number of league/season jobs scraped at the same time, each in its own browser (default: 1).",
+        )
+        parser.add_argument(
+            "--browser_contexts",
+            type=int,
+            default=1,
+            help=(
+                "🪟 Number of isolated browser contexts (own cookies, proxy, viewport and user agent) the "
+                "concurrent tabs are spread over (default: 1)."
+            ),
+        )
+        parser.add_argument(
+            "--block_resources",
+            action="store_true",
+            help="🚫 Block images, media, fonts, ads and trackers the scraper does not need.",
+        )
+        parser.add_argument(
+            "--blocked_resource_types",
+            type=str,
+            default=None,
+            help="🧱 Comma-separated resource types blocked with --block_resources (default: image,media,font).",
+        )
+        parser.add_argument(
+            "--blocked_domains",
+            type=str,
+            default=None,
+            help="⛔ Comma-separated extra domains blocked with --block_resources (subdomains included).",
+        )
+        parser.add_argument(
+            "--allowed_domains",
+            type=str,
+            default=None,
+            help="✅ Comma-separated domains never blocked by --block_resources (subdomains included).",
+        )
+        parser.add_argument(
+            "--asset_cache_dir",
+            type=str,
+            default=None,
+            help="🗄️ Directory of a disk cache for scripts, stylesheets, fonts and images, reused across runs.",
+        )
+        parser.add_argument(
+            "--asset_cache_size_mb",
+            type=int,
+            default=500,
+            help="📦 Size limit of the asset cache in MB; least recently used assets are evicted (default: 500).",
+        )
+        parser.add_argument(
+            "--requests_per_second",
+            type=float,
+            default=1.0,
+            help="🐢 Page navigations per second allowed per host, across all tabs and browsers (default: 1.0).",
+        )
+        parser.add_argument(
+            "--request_burst",
+            type=int,
+            default=3,
+            help="🚀 Navigations allowed back to back before --requests_per_second applies (default: 3).",
+        )
+        parser.add_argument(
+            "--per_proxy_rate_limit",
+            action="store_true",
+            help="🧭 Apply --requests_per_second to every proxy separately instead of to all of them together.",
+        )
+        parser.add_argument(
+            "--record_har",
+            type=str,
+            default=None,
+            help="📼 Directory to record the run's traffic to as HAR files, for later offline replay.",
+        )
+        parser.add_argument(
+            "--replay_har",
+            type=str,
+            default=None,
+            help="⏪ Directory of HAR files recorded with --record_har to replay the run from, without the network.",
+        )
+        parser.add_argument(
+            "--metrics_json",
+            type=str,
+            default=None,
+            help="⏱️ JSON file to write the per-stage timing histograms and counters of every match to after the run.",
+        )
+        parser.add_argument(
+            "--metrics_port",
+            type=int,
+            default=None,
+            help="📈 Port to serve the same metrics on while running, in Prometheus text format at /metrics.",
+        )
+        parser.add_argument(
+            "--metrics_host",
+            type=str,
+            default="127.0.0.1",
+            help=(
+                "🔌 Interface the metrics endpoint listens on (default: 127.0.0.1, this machine only). "
+                "Use 0.0.0.0 to expose it on all interfaces."
+            ),
+        )
+        parser.add_argument(
+            "--trace_file",
+            type=str,
+            default=None,
+            help="🔬 Trace the Playwright calls of every match page to this file, in Chrome trace format.",
+        )
+        parser.add_argument(
+            "--trace_top",
+            type=int,
+            default=20,
+            help="🐌 Number of slowest traced calls (and callers) logged at the end of a traced run (default: 20).",
+        )
 
     def get_parser(self) -> argparse.ArgumentParser:
         return self.parser
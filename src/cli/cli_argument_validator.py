@@ -1,5 +1,6 @@
 import argparse
 from datetime import datetime
+import os
 import re
 
 from src.storage.storage_format import StorageFormat
@@ -22,6 +23,13 @@ class CLIArgumentValidator:
         if isinstance(args.leagues, str):
             args.leagues = [league.strip() for league in args.leagues.split(",")]
 
+        for list_argument in ("blocked_resource_types", "blocked_domains", "allowed_domains"):
+            if isinstance(getattr(args, list_argument, None), str):
+                setattr(args, list_argument, [item.strip() for item in getattr(args, list_argument).split(",")])
+
+        if isinstance(getattr(args, "season", None), str):
+            args.season = [season.strip() for season in args.season.split(",")]
+
         errors = []
 
         if hasattr(args, "match_links"):
@@ -43,7 +51,8 @@ class CLIArgumentValidator:
             errors.extend(self._validate_leagues(sport=args.sport, leagues=args.leagues))
 
         if hasattr(args, "season"):
-            errors.extend(self._validate_season(command=args.command, season=args.season))
+            for season in args.season or [None]:
+                errors.extend(self._validate_season(command=args.command, season=season))
 
         if hasattr(args, "date"):
             errors.extend(
@@ -76,6 +85,37 @@ class CLIArgumentValidator:
         if hasattr(args, "concurrency_tasks"):
             errors.extend(self._validate_concurrency_tasks(concurrency_tasks=args.concurrency_tasks))
 
+        if getattr(args, "max_concurrency_tasks", None) is not None:
+            errors.extend(self._validate_max_concurrency_tasks(args.max_concurrency_tasks, args.concurrency_tasks))
+
+        if hasattr(args, "parallel_jobs"):
+            errors.extend(self._validate_parallel_jobs(parallel_jobs=args.parallel_jobs))
+
+        if hasattr(args, "browser_contexts"):
+            errors.extend(self._validate_browser_contexts(browser_contexts=args.browser_contexts))
+
+        if hasattr(args, "asset_cache_size_mb") and (
+            not isinstance(args.asset_cache_size_mb, int) or args.asset_cache_size_mb <= 0
+        ):
+            errors.append(
+                f"Invalid asset cache size: '{args.asset_cache_size_mb}'. It must be a positive number of MB."
+            )
+
+        if hasattr(args, "requests_per_second") and args.requests_per_second <= 0:
+            errors.append(f"Invalid requests per second: '{args.requests_per_second}'. It must be a positive number.")
+
+        if hasattr(args, "request_burst") and args.request_burst <= 0:
+            errors.append(f"Invalid request burst: '{args.request_burst}'. It must be a positive integer.")
+
+        if getattr(args, "replay_har", None):
+            errors.extend(self._validate_replay_har(args))
+
+        if getattr(args, "metrics_port", None) is not None and not 0 < args.metrics_port < 65536:
+            errors.append(f"Invalid metrics port: '{args.metrics_port}'. It must be between 1 and 65535.")
+
+        if hasattr(args, "trace_top") and args.trace_top <= 0:
+            errors.append(f"Invalid trace top: '{args.trace_top}'. It must be a positive integer.")
+
         errors.extend(
             self._validate_browser_settings(
                 user_agent=args.browser_user_agent,
@@ -85,6 +125,9 @@ class CLIArgumentValidator:
         )
         errors.extend(self._validate_storage(storage=args.storage))
 
+        if getattr(args, "stream_results", False):
+            errors.extend(self._validate_stream_results(storage=args.storage, storage_format=args.format))
+
         if errors:
             raise ValueError("\n".join(errors))
 
@@ -256,6 +299,21 @@ class CLIArgumentValidator:
             ]
         return []
 
+    def _validate_stream_results(self, storage: str, storage_format: str | None) -> list[str]:
+        """Validates that results can be streamed with the chosen storage and format."""
+        errors = []
+        streaming_formats = [f.value for f in StorageFormat]
+
+        if storage != StorageType.LOCAL.value:
+            errors.append("'--stream_results' is only supported with local storage.")
+
+        if storage_format not in streaming_formats:
+            errors.append(
+                f"Format '{storage_format}' cannot be streamed. Use one of: {', '.join(streaming_formats)}."
+            )
+
+        return errors
+
     def _validate_file_args(self, args: argparse.Namespace) -> list[str]:
         """Validates the file_path and file_format arguments."""
         errors = []
@@ -357,3 +415,38 @@ class CLIArgumentValidator:
         if not isinstance(concurrency_tasks, int) or concurrency_tasks <= 0:
             errors.append(f"Invalid concurrency tasks value: '{concurrency_tasks}'. It must be a positive integer.")
         return errors
+
+    def _validate_max_concurrency_tasks(self, max_concurrency_tasks: int, concurrency_tasks: int) -> list[str]:
+        """Validates the max concurrency tasks argument."""
+        errors = []
+        if not isinstance(max_concurrency_tasks, int) or max_concurrency_tasks < concurrency_tasks:
+            errors.append(
+                f"Invalid max concurrency tasks value: '{max_concurrency_tasks}'. "
+                f"It must be an integer no lower than --concurrency_tasks ({concurrency_tasks})."
+            )
+        return errors
+
+    def _validate_parallel_jobs(self, parallel_jobs: int) -> list[str]:
+        """Validates the parallel jobs argument."""
+        errors = []
+        if not isinstance(parallel_jobs, int) or parallel_jobs <= 0:
+            errors.append(f"Invalid parallel jobs value: '{parallel_jobs}'. It must be a positive integer.")
+        return errors
+
+    def _validate_replay_har(self, args: argparse.Namespace) -> list[str]:
+        """Validates a HAR replay: a recorded directory, and no option that would load pages from elsewhere."""
+        errors = []
+        if not os.path.isdir(args.replay_har):
+            errors.append(f"HAR replay directory '{args.replay_har}' does not exist.")
+        if getattr(args, "record_har", None):
+            errors.append("'--record_har' and '--replay_har' cannot be used together.")
+        if getattr(args, "asset_cache_dir", None):
+            errors.append("'--asset_cache_dir' cannot be used with '--replay_har': cache misses go to the network.")
+        return errors
+
+    def _validate_browser_contexts(self, browser_contexts: int) -> list[str]:
+        """Validates the browser contexts argument."""
+        errors = []
+        if not isinstance(browser_contexts, int) or browser_contexts <= 0:
+            errors.append(f"Invalid browser contexts value: '{browser_contexts}'. It must be a positive integer.")
+        return errors
@@ -11,7 +11,10 @@ class CLIHelpMessageGenerator:
             "   --markets                   💰 Betting markets to scrape (comma-separated, e.g., 1x2, btts).\n"
             "   --storage                   💾 Storage type (local or remote; default: local).\n"
             "   --file_path                 📂 File path for saving data locally (default: scraped_data.json).\n"
-            "   --format                    📝 Data storage format (json or csv; default: json).\n"
+            "   --format                    📝 Data storage format (json, csv, jsonl or parquet; default: json).\n"
+            "   --stream_results            🌊 Write each match to --file_path as soon as it is scraped.\n"
+            "   --compact_json              🗜️ Write JSON output without indentation.\n"
+            "   --csv_layout                🧾 CSV rows per match (wide) or per match x market x bookmaker (long).\n"
             "   --proxies                   🌐 List of proxies ('server user pass' format). "
             "Supports multiple proxies.\n"
             "   --headless                  🕶️ Run browser in headless mode (default: False).\n"
@@ -24,17 +27,43 @@ class CLIHelpMessageGenerator:
             "   --target_bookmaker           🎯 Filter scraping for a specific bookmaker (e.g., Betclic.fr).\n"
             "   --scrape_odds_history        📈 Include odds movement history by hovering modals (default: False).\n"
             "   --odds_format                💰 Odds format to display (default: Decimal Odds).\n"
-            "   --concurrency_tasks          ⚡ Number of concurrent tasks for scraping (default: 3).\n\n"
+            "   --concurrency_tasks          ⚡ Number of concurrent tasks for scraping to start with (default: 3).\n"
+            "   --max_concurrency_tasks      📈 Adaptive concurrency ceiling (default: --concurrency_tasks).\n"
+            "   --use_odds_feed              📡 Read odds from the page's odds feed instead of clicking market tabs.\n"
+            "   --checkpoint_path            💾 SQLite checkpoint file to resume interrupted runs (optional).\n"
+            "   --parallel_jobs              🧵 League/season jobs scraped at the same time (default: 1).\n"
+            "   --browser_contexts           🪟 Isolated browser contexts the tabs are spread over (default: 1).\n"
+            "   --block_resources            🚫 Block images, media, fonts, ads and trackers.\n"
+            "   --blocked_resource_types     🧱 Resource types to block (default: image,media,font).\n"
+            "   --blocked_domains            ⛔ Extra domains to block (comma-separated).\n"
+            "   --allowed_domains            ✅ Domains never blocked (comma-separated).\n"
+            "   --asset_cache_dir            🗄️ Disk cache for static assets, shared across runs (optional).\n"
+            "   --asset_cache_size_mb        📦 Asset cache size limit in MB (default: 500).\n"
+            "   --requests_per_second        🐢 Navigations per second allowed per host (default: 1.0).\n"
+            "   --request_burst              🚀 Navigations allowed back to back (default: 3).\n"
+            "   --per_proxy_rate_limit       🧭 Rate limit every proxy separately.\n"
+            "   --record_har                 📼 Record the run's traffic to HAR files (directory).\n"
+            "   --replay_har                 ⏪ Replay a recorded run offline (directory).\n"
+            "   --metrics_json               ⏱️ Write per-stage timings of every match to a JSON file.\n"
+            "   --metrics_port               📈 Serve the timings in Prometheus format on /metrics.\n"
+            "   --metrics_host               🔌 Metrics endpoint interface (default: 127.0.0.1; 0.0.0.0 for all).\n"
+            "   --trace_file                 🔬 Trace page calls to a Chrome trace file (optional).\n"
+            "   --trace_top                  🐌 Slowest traced calls to log at the end (default: 20).\n\n"
             "🔹 **scrape_historic** - Scrape historical odds and match results.\n"
             "   --sport                     🏆 The sport to scrape (default: football).\n"
             "   --leagues                   ⚽ The leagues to scrape (comma-separated, "
             "e.g., england-premier-league,spain-primera-division).\n"
-            "   --season                    📅 Season to scrape (format: YYYY, YYYY-YYYY, e.g., 2023 or 2022-2023).\n"
+            "   --season                    📅 Season(s) to scrape, comma-separated (format: YYYY, YYYY-YYYY, "
+            "e.g., 2023 or 2022-2023,2023-2024).\n"
             "   --markets                   💰 Betting markets to scrape (comma-separated, e.g., 1x2, btts).\n"
             "   --storage                   💾 Storage type (local or remote; default: local).\n"
             "   --file_path                 📂 File path for saving data locally (default: scraped_data.json).\n"
-            "   --format                    📝 Data storage format (json or csv; default: json).\n"
+            "   --format                    📝 Data storage format (json, csv, jsonl or parquet; default: json).\n"
+            "   --stream_results            🌊 Write each match to --file_path as soon as it is scraped.\n"
+            "   --compact_json              🗜️ Write JSON output without indentation.\n"
+            "   --csv_layout                🧾 CSV rows per match (wide) or per match x market x bookmaker (long).\n"
             "   --max_pages                 📑 Maximum number of pages to scrape (optional).\n"
+            "   --link_collection_tabs      🗂️ Result pages loaded concurrently when collecting links (default: 3).\n"
             "   --proxies                   🌐 List of proxies ('server user pass' format). "
             "Supports multiple proxies.\n"
             "   --headless                  🕶️ Run browser in headless mode (default: False).\n"
@@ -47,7 +76,28 @@ class CLIHelpMessageGenerator:
             "   --target_bookmaker           🎯 Filter scraping for a specific bookmaker (e.g., Betclic.fr).\n"
             "   --scrape_odds_history        📈 Include odds movement history by hovering modals (default: False).\n"
             "   --odds_format                💰 Odds format to display (default: Decimal Odds).\n"
-            "   --concurrency_tasks          ⚡ Number of concurrent tasks for scraping (default: 3).\n\n"
+            "   --concurrency_tasks          ⚡ Number of concurrent tasks for scraping to start with (default: 3).\n"
+            "   --max_concurrency_tasks      📈 Adaptive concurrency ceiling (default: --concurrency_tasks).\n"
+            "   --use_odds_feed              📡 Read odds from the page's odds feed instead of clicking market tabs.\n"
+            "   --checkpoint_path            💾 SQLite checkpoint file to resume interrupted runs (optional).\n"
+            "   --parallel_jobs              🧵 League/season jobs scraped at the same time (default: 1).\n"
+            "   --browser_contexts           🪟 Isolated browser contexts the tabs are spread over (default: 1).\n"
+            "   --block_resources            🚫 Block images, media, fonts, ads and trackers.\n"
+            "   --blocked_resource_types     🧱 Resource types to block (default: image,media,font).\n"
+            "   --blocked_domains            ⛔ Extra domains to block (comma-separated).\n"
+            "   --allowed_domains            ✅ Domains never blocked (comma-separated).\n"
+            "   --asset_cache_dir            🗄️ Disk cache for static assets, shared across runs (optional).\n"
+            "   --asset_cache_size_mb        📦 Asset cache size limit in MB (default: 500).\n"
+            "   --requests_per_second        🐢 Navigations per second allowed per host (default: 1.0).\n"
+            "   --request_burst              🚀 Navigations allowed back to back (default: 3).\n"
+            "   --per_proxy_rate_limit       🧭 Rate limit every proxy separately.\n"
+            "   --record_har                 📼 Record the run's traffic to HAR files (directory).\n"
+            "   --replay_har                 ⏪ Replay a recorded run offline (directory).\n"
+            "   --metrics_json               ⏱️ Write per-stage timings of every match to a JSON file.\n"
+            "   --metrics_port               📈 Serve the timings in Prometheus format on /metrics.\n"
+            "   --metrics_host               🔌 Metrics endpoint interface (default: 127.0.0.1; 0.0.0.0 for all).\n"
+            "   --trace_file                 🔬 Trace page calls to a Chrome trace file (optional).\n"
+            "   --trace_top                  🐌 Slowest traced calls to log at the end (default: 20).\n\n"
             "📌 **Examples:**\n"
             "✅ **Scrape upcoming football matches for a specific date:**\n"
             "   `python main.py scrape_upcoming --sport football --date 20250101 --markets 1x2,btts,dnb "
@@ -0,0 +1,170 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import os
+import statistics
+from typing import Any, ClassVar
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD (additive increase, multiplicative decrease) limit on the number of matches scraped at the same time.
+
+    Workers hold a `slot` while they scrape and report each attempt with `record_success` or `record_failure`. Every
+    `window_size` attempts the limit is re-evaluated: it is halved when the failure rate (timeouts, pages without
+    odds) exceeds `FAILURE_RATE_THRESHOLD`, when the median latency grows past `LATENCY_TOLERANCE` times the best
+    median seen, or when the machine is under CPU or memory pressure; otherwise it grows by one, as long as the
+    current limit was actually reached during the window. The limit stays within `[min_limit, max_limit]`.
+    """
+
+    FAILURE_RATE_THRESHOLD: ClassVar[float] = 0.2
+    LATENCY_TOLERANCE: ClassVar[float] = 2.0
+    DECREASE_FACTOR: ClassVar[float] = 0.5
+    # Load average per CPU, and share of memory still available, beyond which the machine counts as saturated
+    CPU_LOAD_THRESHOLD: ClassVar[float] = 1.0
+    MIN_AVAILABLE_MEMORY: ClassVar[float] = 0.1
+
+    def __init__(self, initial_limit: int, max_limit: int | None = None, min_limit: int = 1, window_size: int = 10):
+        """
+        Args:
+            initial_limit (int): Concurrency to start with.
+            max_limit (Optional[int]): Concurrency never exceeded. Defaults to `initial_limit`, so the limit only
+                drops under trouble and recovers up to where it started.
+            min_limit (int): Concurrency never gone below.
+            window_size (int): Number of reported attempts between two adjustments.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit or initial_limit)
+        self.limit = min(max(initial_limit, self.min_limit), self.max_limit)
+        self.window_size = max(1, window_size)
+
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._window_latencies: list[float] = []
+        self._window_failures: dict[str, int] = {}
+        self._window_saturated = False
+        self._best_median_latency: float | None = None
+        self._counters = {"increases": 0, "decreases": 0, "peak_limit": self.limit}
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait until fewer than `limit` scrapes are running and hold a place for the duration of the block."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            if self._in_flight >= self.limit:
+                self._window_saturated = True
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    async def record_success(self, latency: float):
+        """
+        Report an attempt that returned match odds.
+
+        Args:
+            latency (float): Duration of the attempt in seconds.
+        """
+        self._window_latencies.append(latency)
+        await self._end_of_window_check()
+
+    async def record_failure(self, reason: str):
+        """
+        Report an attempt that timed out, errored or came back without odds.
+
+        Args:
+            reason (str): Short failure category (e.g. "timeout", "empty odds"), counted in the adjustment log.
+        """
+        self._window_failures[reason] = self._window_failures.get(reason, 0) + 1
+        await self._end_of_window_check()
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Controller metrics.
+
+        Returns:
+            Dict[str, Any]: The current `limit`, its bounds, the scrapes `in_flight`, the number of `increases` and
+            `decreases` so far and the `peak_limit` reached.
+        """
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            **self._counters,
+        }
+
+    async def _end_of_window_check(self):
+        failures = sum(self._window_failures.values())
+        attempts = len(self._window_latencies) + failures
+        if attempts < self.window_size:
+            return
+
+        failure_rate = failures / attempts
+        median_latency = statistics.median(self._window_latencies) if self._window_latencies else None
+        pressure = self._system_pressure()
+
+        if failure_rate > self.FAILURE_RATE_THRESHOLD:
+            self._decrease(f"{failure_rate:.0%} failed attempts {self._window_failures}")
+        elif pressure:
+            self._decrease(pressure)
+        elif (
+            median_latency is not None
+            and self._best_median_latency is not None
+            and median_latency > self.LATENCY_TOLERANCE * self._best_median_latency
+        ):
+            self._decrease(f"median latency {median_latency:.1f}s vs best {self._best_median_latency:.1f}s")
+        elif self._window_saturated:
+            await self._increase()
+
+        if median_latency is not None and failure_rate <= self.FAILURE_RATE_THRESHOLD:
+            self._best_median_latency = min(self._best_median_latency or median_latency, median_latency)
+
+        self._window_latencies = []
+        self._window_failures = {}
+        self._window_saturated = self._in_flight >= self.limit
+
+    async def _increase(self):
+        if self.limit >= self.max_limit:
+            return
+        self.limit += 1
+        self._counters["increases"] += 1
+        self._counters["peak_limit"] = max(self._counters["peak_limit"], self.limit)
+        self.logger.info(f"Raising concurrency to {self.limit}")
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _decrease(self, reason: str):
+        new_limit = max(self.min_limit, int(self.limit * self.DECREASE_FACTOR))
+        if new_limit == self.limit:
+            return
+        self.limit = new_limit
+        self._counters["decreases"] += 1
+        self.logger.warning(f"Lowering concurrency to {self.limit}: {reason}")
+
+    @classmethod
+    def _system_pressure(cls) -> str | None:
+        """Describe CPU or memory saturation of the machine, or None. Best effort: unsupported platforms skip it."""
+        try:
+            load_per_cpu = os.getloadavg()[0] / (os.cpu_count() or 1)
+            if load_per_cpu > cls.CPU_LOAD_THRESHOLD:
+                return f"CPU load {load_per_cpu:.2f} per core"
+        except (AttributeError, OSError):
+            pass
+
+        try:
+            with open("/proc/meminfo", encoding="utf-8") as file:
+                meminfo = {line.split(":")[0]: int(line.split()[1]) for line in file if len(line.split()) >= 2}
+            available = meminfo["MemAvailable"] / meminfo["MemTotal"]
+            if available < cls.MIN_AVAILABLE_MEMORY:
+                return f"only {available:.0%} memory available"
+        except (OSError, KeyError, ValueError, ZeroDivisionError):
+            pass
+
+        return None
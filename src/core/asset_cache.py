@@ -0,0 +1,196 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, ClassVar
+
+from playwright.async_api import BrowserContext, Request, Route
+
+
+class AssetCache:
+    """
+    Disk-backed cache of static assets (scripts, stylesheets, fonts, images) served through `context.route`.
+
+    Responses are stored by URL with their ETag, bodies as files and the index in SQLite, so one cache directory is
+    shared by every context of a run and reused by later runs. Entries younger than `revalidate_after` seconds are
+    served without touching the network; older ones carrying an ETag are revalidated with `If-None-Match` and
+    served from disk on a 304. The least recently used entries are evicted when the cache exceeds `max_bytes`.
+    Requests that are not cacheable are passed on with `route.fallback()`.
+    """
+
+    CACHEABLE_RESOURCE_TYPES: ClassVar[set[str]] = {"script", "stylesheet", "font", "image"}
+
+    # Headers describing the transfer rather than the content; the stored body is already decoded
+    _DROPPED_HEADERS: ClassVar[set[str]] = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS assets (
+            url_key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            etag TEXT,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            stored_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        )
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 500 * 1024 * 1024, revalidate_after: float = 3600.0):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache (created if missing).
+            max_bytes (int): Total size of cached bodies above which the least recently used entries are evicted.
+            revalidate_after (float): Age in seconds after which an entry with an ETag is revalidated before use.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+        self.counters = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "bytes_from_cache": 0,
+            "bytes_from_network": 0,
+            "evictions": 0,
+        }
+
+        os.makedirs(os.path.join(cache_dir, "bodies"), exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(cache_dir, "index.sqlite"))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(self._SCHEMA)
+        self.connection.commit()
+
+        entries, size = self._totals()
+        self.logger.info(f"Using asset cache {cache_dir}: {entries} entries, {size / 1024 / 1024:.1f} MiB")
+
+    async def attach(self, context: BrowserContext):
+        """
+        Serve the cacheable requests of every page of a browser context from the cache.
+
+        Args:
+            context (BrowserContext): The context to serve.
+        """
+        await context.route("**/*", self._handle_route)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Cache counters since the cache was opened.
+
+        Returns:
+            Dict[str, Any]: `hits` (served from disk without a request), `revalidated` (served from disk after a
+            304), `misses`, `bytes_from_cache`, `bytes_from_network`, `evictions`, `entries` and `size`.
+        """
+        entries, size = self._totals()
+        return {**self.counters, "entries": entries, "size": size}
+
+    def close(self):
+        """Close the cache index."""
+        self.connection.close()
+
+    async def _handle_route(self, route: Route, request: Request):
+        if request.method != "GET" or request.resource_type not in self.CACHEABLE_RESOURCE_TYPES:
+            await route.fallback()
+            return
+
+        try:
+            await self._serve(route, request.url)
+        except Exception as e:
+            self.logger.debug(f"Asset cache failed for {request.url}, loading it directly: {e}")
+            await route.fallback()
+
+    async def _serve(self, route: Route, url: str):
+        url_key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        entry = self._get_entry(url_key)
+
+        if entry and time.time() - entry["stored_at"] < self.revalidate_after:
+            await self._fulfill_from_cache(route, url_key, entry, counter="hits")
+            return
+
+        fetch_headers = None
+        if entry and entry["etag"]:
+            fetch_headers = {**route.request.headers, "If-None-Match": entry["etag"]}
+        response = await route.fetch(headers=fetch_headers)
+
+        if response.status == 304 and entry:
+            self.connection.execute("UPDATE assets SET stored_at = ? WHERE url_key = ?", (time.time(), url_key))
+            await self._fulfill_from_cache(route, url_key, entry, counter="revalidated")
+            return
+
+        body = await response.body()
+        self.counters["misses"] += 1
+        self.counters["bytes_from_network"] += len(body)
+
+        if self._is_storable(response.status, response.headers):
+            self._store(url_key, url, response.status, response.headers, body)
+
+        await route.fulfill(response=response, body=body)
+
+    async def _fulfill_from_cache(self, route: Route, url_key: str, entry: dict[str, Any], counter: str):
+        with open(self._body_path(url_key), "rb") as file:
+            body = file.read()
+
+        self.connection.execute("UPDATE assets SET last_access = ? WHERE url_key = ?", (time.time(), url_key))
+        self.connection.commit()
+        self.counters[counter] += 1
+        self.counters["bytes_from_cache"] += len(body)
+        await route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+
+    def _get_entry(self, url_key: str) -> dict[str, Any] | None:
+        row = self.connection.execute(
+            "SELECT etag, status, headers, stored_at FROM assets WHERE url_key = ?", (url_key,)
+        ).fetchone()
+        if row is None or not os.path.exists(self._body_path(url_key)):
+            return None
+        return {"etag": row[0], "status": row[1], "headers": json.loads(row[2]), "stored_at": row[3]}
+
+    def _is_storable(self, status: int, headers: dict[str, str]) -> bool:
+        cache_control = headers.get("cache-control", "").lower()
+        return status == 200 and "no-store" not in cache_control and "private" not in cache_control
+
+    def _store(self, url_key: str, url: str, status: int, headers: dict[str, str], body: bytes):
+        stored_headers = {name: value for name, value in headers.items() if name.lower() not in self._DROPPED_HEADERS}
+        temp_path = f"{self._body_path(url_key)}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(body)
+        os.replace(temp_path, self._body_path(url_key))
+
+        now = time.time()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO assets (url_key, url, etag, status, headers, size, stored_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (url_key, url, headers.get("etag"), status, json.dumps(stored_headers), len(body), now, now),
+        )
+        self.connection.commit()
+        self._evict()
+
+    def _evict(self):
+        _, size = self._totals()
+        if size <= self.max_bytes:
+            return
+
+        rows = self.connection.execute("SELECT url_key, size FROM assets ORDER BY last_access").fetchall()
+        evicted = []
+        for url_key, entry_size in rows:
+            if size <= self.max_bytes:
+                break
+            size -= entry_size
+            evicted.append(url_key)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._body_path(url_key))
+
+        self.connection.executemany("DELETE FROM assets WHERE url_key = ?", [(url_key,) for url_key in evicted])
+        self.connection.commit()
+        self.counters["evictions"] += len(evicted)
+
+    def _totals(self) -> tuple[int, int]:
+        entries, size = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM assets").fetchone()
+        return entries, size
+
+    def _body_path(self, url_key: str) -> str:
+        return os.path.join(self.cache_dir, "bodies", url_key)
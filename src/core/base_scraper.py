@@ -1,19 +1,46 @@
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+import inspect
 import json
 import logging
 import re
-from typing import Any
+import time
+from typing import Any, ClassVar
 
-from bs4 import BeautifulSoup
-from playwright.async_api import Page, TimeoutError
+from playwright.async_api import BrowserContext, Page, TimeoutError
 
+from src.core.adaptive_concurrency import AdaptiveConcurrencyController
 from src.core.browser_helper import BrowserHelper
+from src.core.crawl_checkpoint import CrawlCheckpoint
+from src.core.market_extraction import OddsFeedClient
 from src.core.odds_portal_market_extractor import OddsPortalMarketExtractor
+from src.core.odds_portal_selectors import OddsPortalSelectors
+from src.core.page_pool import PagePool
+from src.core.page_readiness import PageReadiness
+from src.core.page_tracer import PageTracer
 from src.core.playwright_manager import PlaywrightManager
+from src.core.request_rate_limiter import RequestRateLimiter
+from src.core.retry_policy import RetryPolicy
+from src.core.scrape_errors import (
+    BLOCKED_STATUSES,
+    BlockedError,
+    EmptyMarketError,
+    NavigationTimeoutError,
+    NetworkError,
+    ParseError,
+    ScrapeError,
+    as_scrape_error,
+    classify_error,
+)
+from src.core.scrape_metrics import ScrapeMetrics
+from src.core.scrape_pipeline import ScrapePipeline
+from src.storage.streaming_sink import StreamingSink
 from src.utils.constants import ODDSPORTAL_BASE_URL
 from src.utils.odds_format_enum import OddsFormat
-from src.utils.utils import clean_html_text
+from src.utils.proxy_manager import ProxyManager
+from src.utils.utils import clean_html_text, parse_html
 
 
 class BaseScraper:
@@ -21,6 +48,12 @@ class BaseScraper:
     Base class for scraping match data from OddsPortal.
     """
 
+    MATCH_NAVIGATION_TIMEOUT = 30000
+    ODDS_FEED_TIMEOUT = 5.0
+    # Failures caused by the connection or the site's reaction to it rather than by the page
+    PROXY_FAILURES: ClassVar[set[type[ScrapeError]]] = {NetworkError, NavigationTimeoutError, BlockedError}
+    BAN_SIGNALS: ClassVar[set[type[ScrapeError]]] = {BlockedError, ParseError, EmptyMarketError}
+
     def __init__(
         self,
         playwright_manager: PlaywrightManager,
@@ -28,21 +61,66 @@ class BaseScraper:
         market_extractor: OddsPortalMarketExtractor,
         preview_submarkets_only: bool = False,
         concurrency_tasks: int = 3,
+        max_concurrency_tasks: int | None = None,
+        page_readiness: PageReadiness | None = None,
+        use_odds_feed: bool = False,
+        crawl_checkpoint: CrawlCheckpoint | None = None,
+        result_sink: StreamingSink | None = None,
+        proxy_manager: ProxyManager | None = None,
+        rate_limiter: RequestRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        metrics: ScrapeMetrics | None = None,
+        tracer: PageTracer | None = None,
     ):
         """
         Args:
             playwright_manager (PlaywrightManager): Handles Playwright lifecycle.
             browser_helper (BrowserHelper): Helper class for browser interactions.
             market_extractor (OddsPortalMarketExtractor): Handles market scraping.
-            preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets without loading individual bookmaker details.
-            concurrency_tasks (int): Number of concurrent tasks for scraping (default: 3).
+            preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets without loading
+                individual bookmaker details.
+            concurrency_tasks (int): Number of concurrent tasks for scraping to start with (default: 3).
+            max_concurrency_tasks (Optional[int]): Ceiling the adaptive concurrency may grow to while scraping stays
+                healthy. Defaults to `concurrency_tasks`, so concurrency only drops under trouble and recovers.
+            page_readiness (Optional[PageReadiness]): Waits on DOM conditions instead of fixed sleeps.
+            use_odds_feed (bool): If True, read market odds from the page's odds feed responses and only fall back
+                to tab navigation for markets the feed does not carry.
+            crawl_checkpoint (Optional[CrawlCheckpoint]): If set, completed matches and markets are recorded as
+                they finish and skipped when the same run is resumed.
+            result_sink (Optional[StreamingSink]): If set, every scraped match is written to the sink as soon as it
+                completes and is not kept in memory; the scrape methods then return an empty list.
+            proxy_manager (Optional[ProxyManager]): If set, the outcome of every match is recorded against the proxy
+                of the context it was scraped in, and contexts whose proxy gets quarantined switch to a healthier one.
+            rate_limiter (Optional[RequestRateLimiter]): Rate limit every navigation goes through; share one between
+                scrapers so they count against the same limit. Defaults to a limiter of this scraper only.
+            retry_policy (Optional[RetryPolicy]): Retry budgets and backoff per error class for whole matches.
+            metrics (Optional[ScrapeMetrics]): Stage timings of every match. Defaults to the market extractor's, so
+                page and market stages end up in the same histograms.
+            tracer (Optional[PageTracer]): If set, the Playwright calls made on every match page are traced.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.playwright_manager = playwright_manager
         self.concurrency_tasks = concurrency_tasks
+        self.concurrency_controller = AdaptiveConcurrencyController(
+            initial_limit=concurrency_tasks, max_limit=max_concurrency_tasks
+        )
         self.browser_helper = browser_helper
         self.market_extractor = market_extractor
         self.preview_submarkets_only = preview_submarkets_only
+        self.page_readiness = page_readiness or market_extractor.page_readiness
+        self.use_odds_feed = use_odds_feed
+        self.crawl_checkpoint = crawl_checkpoint
+        self.result_sink = result_sink
+        self.proxy_manager = proxy_manager
+        self.rate_limiter = rate_limiter or RequestRateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metrics = metrics or market_extractor.metrics
+        self.tracer = tracer
+        # Metrics of the last odds pipeline run (see `ScrapePipeline.metrics`), e.g. for benchmarks
+        self.last_pipeline_metrics: dict[str, Any] | None = None
+        # Contexts whose consent and odds format are already set, and the locks warming up the others
+        self._warmed_contexts: set[BrowserContext] = set()
+        self._context_warm_up_locks: dict[BrowserContext, asyncio.Lock] = {}
 
     async def set_odds_format(self, page: Page, odds_format: OddsFormat = OddsFormat.DECIMAL_ODDS):
         """
@@ -54,7 +132,7 @@ class BaseScraper:
         """
         try:
             self.logger.info(f"Setting odds format: {odds_format.value}")
-            button_selector = "div.group > button.gap-2"
+            button_selector = OddsPortalSelectors.ODDS_FORMAT_BUTTON
             await page.wait_for_selector(button_selector, state="attached", timeout=8000)
             dropdown_button = await page.query_selector(button_selector)
 
@@ -67,9 +145,8 @@ class BaseScraper:
                 return
 
             await dropdown_button.click()
-            await page.wait_for_timeout(10000)
-            format_option_selector = "div.group > div.dropdown-content > ul > li > a"
-            format_options = await page.query_selector_all(format_option_selector)
+            await self.page_readiness.wait_for_dropdown_options(page)
+            format_options = await page.query_selector_all(OddsPortalSelectors.ODDS_FORMAT_OPTIONS)
 
             for option in format_options:
                 option_text = await option.inner_text()
@@ -77,8 +154,10 @@ class BaseScraper:
                 if odds_format.value.lower() in option_text.lower():
                     self.logger.info(f"Selecting odds format: {option_text}")
                     await option.click()
-                    await page.wait_for_timeout(10000)
-                    self.logger.info(f"Odds format changed to '{odds_format.value}'.")
+                    if await self.page_readiness.wait_for_odds_format(page, odds_format.value):
+                        self.logger.info(f"Odds format changed to '{odds_format.value}'.")
+                    else:
+                        self.logger.warning(f"Odds format change to '{odds_format.value}' was not confirmed.")
                     return
 
             self.logger.warning(f"Desired odds format '{odds_format.value}' not found in dropdown options.")
@@ -101,9 +180,9 @@ class BaseScraper:
         """
         try:
             # Wait for content to load and scroll to trigger lazy loading
-            await page.wait_for_timeout(3000)  # Increased wait time
+            await self.page_readiness.wait_for_event_rows(page)
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await page.wait_for_timeout(2000)
+            await self.page_readiness.wait_for_dom_settled(page)
             
             # Get current page URL to extract league context
             current_url = page.url
@@ -172,13 +251,15 @@ class BaseScraper:
                                 filtered_links.append(link)
                     
                     match_links.update(filtered_links)
-                    self.logger.info(f"JavaScript found {len(filtered_links)} match links (filtered from {len(js_links)})")
+                    self.logger.info(
+                        f"JavaScript found {len(filtered_links)} match links (filtered from {len(js_links)})"
+                    )
             except Exception as e:
                 self.logger.debug(f"JavaScript extraction failed: {e}")
             
             # Strategy 2: BeautifulSoup parsing with improved filtering
             html_content = await page.content()
-            soup = BeautifulSoup(html_content, "lxml")
+            soup = parse_html(html_content)
             
             # Try multiple selectors
             event_rows = soup.find_all(class_=re.compile("^eventRow"))
@@ -217,8 +298,9 @@ class BaseScraper:
         markets: list[str] | None = None,
         scrape_odds_history: bool = False,
         target_bookmaker: str | None = None,
-        concurrent_scraping_task: int = 3,
+        concurrent_scraping_task: int | None = None,
         preview_submarkets_only: bool = False,
+        on_result: Callable[[dict[str, Any]], Awaitable[None] | None] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Extract odds for a list of match links concurrently.
@@ -229,77 +311,388 @@ class BaseScraper:
             markets (Optional[List[str]]: The list of markets to scrape.
             scrape_odds_history (bool): Whether to scrape and attach odds history.
             target_bookmaker (str): If set, only scrape odds for this bookmaker.
-            concurrent_scraping_task (int): Controls how many pages are processed simultaneously.
-            preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets without loading individual bookmaker details.
+            concurrent_scraping_task (Optional[int]): Upper bound on the pages processed simultaneously; defaults to
+                the concurrency controller's maximum.
+            preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets without loading
+                individual bookmaker details.
+            on_result (Optional[Callable]): Called (and awaited if async) with each match as soon as it is scraped.
 
         Returns:
-            List[Dict[str, Any]]: A list of dictionaries containing scraped odds data.
+            List[Dict[str, Any]]: A list of dictionaries containing scraped odds data, or an empty list when a
+            result sink is set (the matches were written to it instead).
         """
         self.logger.info(f"Starting to scrape odds for {len(match_links)} match links...")
-        # Use instance concurrency_tasks instead of parameter
-        actual_concurrency = min(concurrent_scraping_task, self.concurrency_tasks)
-        self.logger.info(f"Using concurrency: {actual_concurrency}")
-        semaphore = asyncio.Semaphore(actual_concurrency)
-        failed_links = []
-
-        async def scrape_with_semaphore(link):
-            async with semaphore:
-                tab = None
-                max_retries = 2
-                retry_delay = 5
-
-                for attempt in range(max_retries + 1):
-                    try:
-                        tab = await self.playwright_manager.context.new_page()
-                        data = await self._scrape_match_data(
-                            page=tab,
-                            sport=sport,
-                            match_link=link,
-                            markets=markets,
-                            scrape_odds_history=scrape_odds_history,
-                            target_bookmaker=target_bookmaker,
-                            preview_submarkets_only=preview_submarkets_only,
-                        )
-                        if data:
-                            self.logger.info(f"Successfully scraped match link: {link} (attempt {attempt + 1})")
-                            return data
-                        elif attempt < max_retries:
-                            self.logger.warning(f"No data returned for {link}, retrying... (attempt {attempt + 1}/{max_retries + 1})")
-                            await asyncio.sleep(retry_delay)
-                        
-                    except Exception as e:
-                        if attempt < max_retries:
-                            self.logger.warning(f"Error scraping link {link}: {e}. Retrying... (attempt {attempt + 1}/{max_retries + 1})")
-                            await asyncio.sleep(retry_delay)
-                        else:
-                            self.logger.error(f"Failed to scrape link {link} after {max_retries + 1} attempts: {e}")
-                            failed_links.append(link)
-                            return None
-
-                    finally:
-                        if tab:
-                            await tab.close()
-                            tab = None
-                
-                # If we get here, all retries failed with no data
-                self.logger.error(f"Failed to get data for {link} after {max_retries + 1} attempts")
-                failed_links.append(link)
-                return None
 
-        tasks = [scrape_with_semaphore(link) for link in match_links]
-        results = await asyncio.gather(*tasks)
-        odds_data = [result for result in results if result is not None]
-        
+        async with self.match_odds_pipeline(
+            sport=sport,
+            markets=markets,
+            scrape_odds_history=scrape_odds_history,
+            target_bookmaker=target_bookmaker,
+            concurrent_scraping_task=concurrent_scraping_task,
+            preview_submarkets_only=preview_submarkets_only,
+            on_result=on_result,
+        ) as pipeline:
+            await pipeline.submit_many(match_links)
+
+        return self.get_pipeline_odds_data(pipeline)
+
+    @asynccontextmanager
+    async def match_odds_pipeline(
+        self,
+        sport: str,
+        markets: list[str] | None = None,
+        scrape_odds_history: bool = False,
+        target_bookmaker: str | None = None,
+        concurrent_scraping_task: int | None = None,
+        preview_submarkets_only: bool = False,
+        on_result: Callable[[dict[str, Any]], Awaitable[None] | None] | None = None,
+        max_matches: int | None = None,
+    ) -> AsyncIterator[ScrapePipeline]:
+        """
+        Open a pipeline of odds workers that match links can be submitted to while they are being discovered.
+
+        Each submitted link is scraped as soon as a worker and a pooled page are free; when the queue is full,
+        `submit` waits (backpressure) and links submitted twice are scraped once. Leaving the `async with` block
+        waits for every submitted link, then logs the success statistics and pipeline metrics.
+
+        Usage:
+            async with scraper.match_odds_pipeline(sport, markets) as pipeline:
+                await pipeline.submit_many(links)
+            odds_data = scraper.get_pipeline_odds_data(pipeline)
+
+        Args:
+            sport (str): The sport to scrape odds for.
+            markets (Optional[List[str]]: The list of markets to scrape.
+            scrape_odds_history (bool): Whether to scrape and attach odds history.
+            target_bookmaker (str): If set, only scrape odds for this bookmaker.
+            concurrent_scraping_task (Optional[int]): Upper bound on the pages processed simultaneously; defaults to
+                the concurrency controller's maximum. Within it, the controller adapts the actual concurrency.
+            preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets without loading
+                individual bookmaker details.
+            on_result (Optional[Callable]): Called (and awaited if async) with each match as soon as it is scraped.
+            max_matches (Optional[int]): Stop accepting links once this many were submitted.
+
+        Yields:
+            ScrapePipeline: The pipeline to submit match links to.
+        """
+        controller = self.concurrency_controller
+        # Workers and pages are sized for the highest limit; the controller decides how many of them scrape at once
+        capacity = min(concurrent_scraping_task or controller.max_limit, controller.max_limit)
+        self.logger.info(f"Using adaptive concurrency: {controller.limit} (up to {capacity})")
+        self.metrics.set_gauge("concurrency_limit", controller.limit)
+        checkpoint = self.crawl_checkpoint
+        skipped_links = []
+
+        async def scrape_attempt(link, link_markets):
+            tab_context = None
+            data = None
+            error = None
+
+            async with controller.slot():
+                started_at = time.monotonic()
+                try:
+                    async with page_pool.page() as tab:
+                        tab_context = tab.context
+                        with self.metrics.stage("match"):
+                            data = await self._scrape_match_data(
+                                page=self.tracer.wrap(tab) if self.tracer else tab,
+                                sport=sport,
+                                match_link=link,
+                                markets=link_markets,
+                                scrape_odds_history=scrape_odds_history,
+                                target_bookmaker=target_bookmaker,
+                                preview_submarkets_only=preview_submarkets_only,
+                            )
+                        self._log_blocked_resources(tab, link)
+                except Exception as e:
+                    error = as_scrape_error(e)
+
+            await self._record_attempt(tab_context, time.monotonic() - started_at, data, link_markets, error)
+            return data, error
+
+        async def scrape_with_page_pool(link, _payload):
+            link_markets = markets
+
+            if checkpoint:
+                checkpoint.register([link], markets)
+                pending = checkpoint.get_pending_markets([link], markets)
+                if link not in pending:
+                    self.logger.info(f"Checkpoint: {link} already done, skipping.")
+                    skipped_links.append(link)
+                    return checkpoint.get_result(link) or {}
+                link_markets = pending[link]
+
+            # Markets are retried inside the match; here the whole match is retried, within its error class budget
+            retry_state = self.retry_policy.start()
+            attempt = 0
+
+            while True:
+                attempt += 1
+                with PageTracer.annotate(match_url=link, attempt=attempt):
+                    data, error = await scrape_attempt(link, link_markets)
+
+                if data:
+                    self.logger.info(f"Successfully scraped match link: {link} (attempt {attempt})")
+                    if checkpoint:
+                        # Emit the match with the markets earlier runs scraped, then mark it done
+                        data = {**(checkpoint.get_result(link) or {}), **data}
+                    await self._emit_result(data, on_result)
+                    if checkpoint:
+                        checkpoint.record_result(link, data, link_markets)
+                    return data
+
+                error = error or ParseError("no data returned")
+                delay = retry_state.next_delay(error)
+                if delay is None:
+                    self.logger.error(f"Failed to scrape link {link} after {attempt} attempts ({error.label}): {error}")
+                    if checkpoint:
+                        checkpoint.record_failure(link, link_markets, str(error))
+                    return None
+
+                self.logger.warning(
+                    f"Error scraping link {link} ({error.label}): {error}. "
+                    f"Retrying in {delay:.1f}s ({retry_state.describe(error)})"
+                )
+                await asyncio.sleep(delay)
+
+        # The pool bounds concurrency: pages are only opened when a worker first needs one
+        async with (
+            PagePool(
+                contexts=self.playwright_manager.contexts,
+                size=capacity,
+                page_initializer=self._initialize_pooled_page,
+            ) as page_pool,
+            ScrapePipeline(
+                worker=scrape_with_page_pool,
+                worker_count=capacity,
+                max_links=max_matches,
+                # Streamed matches are not kept in memory
+                keep_results=self.result_sink is None and checkpoint is None,
+            ) as pipeline,
+        ):
+            yield pipeline
+
+        self.last_pipeline_metrics = pipeline.metrics()
+        match_links = pipeline.submitted
+        failed_links = pipeline.failed_links()
+        # Matches finished by earlier runs are counted as scraped
+        scraped_count = len(match_links) - len(failed_links)
+
+        if checkpoint:
+            self.logger.info(
+                f"Checkpoint: {len(skipped_links)} of {len(match_links)} matches were already done. "
+                f"Status: {checkpoint.summary()}"
+            )
+
         # Log success statistics
-        success_rate = (len(odds_data) / len(match_links) * 100) if match_links else 0
-        self.logger.info(f"Successfully scraped odds data for {len(odds_data)} matches out of {len(match_links)} ({success_rate:.1f}% success rate)")
+        success_rate = (scraped_count / len(match_links) * 100) if match_links else 0
+        self.logger.info(
+            f"Successfully scraped odds data for {scraped_count} matches out of {len(match_links)} "
+            f"({success_rate:.1f}% success rate)"
+        )
+        self.logger.info(f"Concurrency: {controller.metrics()}")
+        self.logger.info(f"Market tab cache: {self.browser_helper.market_tab_cache_stats()}")
 
         if failed_links:
             self.logger.warning(f"Failed to scrape data for {len(failed_links)} links after retries: {failed_links}")
             for link in failed_links:
                 self.logger.error(f"Permanently failed: {link}")
 
-        return odds_data
+    def get_pipeline_odds_data(self, pipeline: ScrapePipeline) -> list[dict[str, Any]]:
+        """
+        The scraped matches of a finished `match_odds_pipeline`.
+
+        Args:
+            pipeline (ScrapePipeline): The drained pipeline.
+
+        Returns:
+            List[Dict[str, Any]]: The scraped matches in submission order, or an empty list when a result sink is
+            set (the matches were written to it instead).
+        """
+        if self.result_sink:
+            # Streamed matches are not kept in memory; earlier runs already wrote the ones they finished
+            return []
+        if self.crawl_checkpoint:
+            # Matches finished by earlier runs (and partial results of failed ones) come from the store
+            return self.crawl_checkpoint.get_results(pipeline.submitted)
+        return pipeline.results()
+
+    async def _emit_result(
+        self, data: dict[str, Any], on_result: Callable[[dict[str, Any]], Awaitable[None] | None] | None
+    ):
+        """
+        Hand a scraped match to the result sink and the caller's callback.
+
+        Args:
+            data (Dict[str, Any]): The scraped match data.
+            on_result (Optional[Callable]): The callback passed to `extract_match_odds`.
+        """
+        if self.result_sink:
+            self.result_sink.write(data)
+
+        if on_result:
+            callback_result = on_result(data)
+            if inspect.isawaitable(callback_result):
+                await callback_result
+
+    async def _record_attempt(
+        self,
+        context: BrowserContext | None,
+        latency: float,
+        data: dict[str, Any] | None,
+        markets: list[str] | None,
+        error: ScrapeError | None,
+    ):
+        """
+        Report a match attempt to the concurrency controller and to the proxy health of its context, and record the
+        concurrency limit it leads to.
+
+        Args:
+            context (Optional[BrowserContext]): The context the match was scraped in, if a page was obtained.
+            latency (float): Duration of the attempt in seconds.
+            data (Optional[Dict[str, Any]]): The scraped match data, if any.
+            markets (Optional[List[str]]): The markets requested for the match.
+            error (Optional[ScrapeError]): The error the attempt failed with, if any.
+        """
+        failure = self._classify_attempt_failure(data, markets, error)
+        if failure is None:
+            await self.concurrency_controller.record_success(latency)
+        else:
+            await self.concurrency_controller.record_failure(failure.label)
+        # The controller only adjusts its limit when reporting an attempt, so the gauge follows every change
+        self.metrics.set_gauge("concurrency_limit", self.concurrency_controller.limit)
+
+        await self._report_proxy_outcome(context, latency, failure, error)
+
+    @staticmethod
+    def _classify_attempt_failure(
+        data: dict[str, Any] | None, markets: list[str] | None, error: ScrapeError | None
+    ) -> type[ScrapeError] | None:
+        """
+        The error class a match attempt failed with, or None if it succeeded.
+
+        Pages served without match details, or without odds for any requested market, are failures even though the
+        scrape itself did not raise: they are what throttling and bans look like.
+
+        Returns:
+            Optional[Type[ScrapeError]]: The error's class, `ParseError` without match details, `EmptyMarketError`
+            without odds, or None.
+        """
+        if error:
+            return type(error)
+        if not data:
+            return ParseError
+        if markets and not any(data.get(f"{market}_market") for market in markets):
+            return EmptyMarketError
+        return None
+
+    async def _report_proxy_outcome(
+        self,
+        context: BrowserContext | None,
+        latency: float,
+        failure: type[ScrapeError] | None,
+        error: ScrapeError | None,
+    ):
+        """
+        Record a match attempt against the proxy of its context, and switch the context to a healthier proxy if this
+        attempt got its proxy quarantined.
+
+        Only network errors, timeouts and blocks count against the proxy; blocks, and pages without match details
+        or odds, are ban signals.
+
+        Args:
+            context (Optional[BrowserContext]): The context the match was scraped in.
+            latency (float): Duration of the attempt in seconds.
+            failure (Optional[Type[ScrapeError]]): The failure class from `_classify_attempt_failure`.
+            error (Optional[ScrapeError]): The error the attempt failed with, if any.
+        """
+        if not self.proxy_manager or context is None:
+            return
+
+        proxy = self.playwright_manager.get_context_proxy(context)
+        if proxy is None:
+            return
+
+        if failure is None:
+            self.proxy_manager.record_success(proxy, latency=latency)
+            return
+        if failure not in self.PROXY_FAILURES | self.BAN_SIGNALS:
+            return
+
+        quarantined = self.proxy_manager.record_failure(
+            proxy, reason=str(error) if error else failure.label, banned=failure in self.BAN_SIGNALS
+        )
+
+        if not quarantined:
+            return
+
+        replacement = self.proxy_manager.rotate_proxy(proxy)
+        if replacement:
+            try:
+                await self.playwright_manager.replace_context(context, replacement)
+            except Exception as e:
+                self.logger.error(f"Failed to switch a browser context to proxy {replacement['server']}: {e}")
+
+    def _log_blocked_resources(self, page: Page, match_link: str):
+        """
+        Log what the resource blocker saved while a match page was scraped.
+
+        Args:
+            page (Page): The page the match was scraped on.
+            match_link (str): The match link, for the log line.
+        """
+        resource_blocker = self.playwright_manager.resource_blocker
+        if not resource_blocker:
+            return
+
+        stats = resource_blocker.pop_page_stats(page)
+        self.logger.debug(
+            f"Blocked {stats['blocked_requests']} requests (~{stats['estimated_bytes_saved'] / 1024:.0f} KiB) "
+            f"on {match_link}: {stats['blocked_by_type']}"
+        )
+
+    async def _initialize_pooled_page(self, page: Page):
+        """
+        Pre-configure a page before it joins the page pool.
+
+        The first page opened in a context also warms the context up (see `_warm_up_context`), so every pooled
+        page starts with the cookie banner dismissed and the odds format set.
+
+        Args:
+            page (Page): The freshly opened Playwright page.
+        """
+        page.set_default_navigation_timeout(self.MATCH_NAVIGATION_TIMEOUT)
+        await self._warm_up_context(page)
+
+    async def _warm_up_context(self, page: Page):
+        """
+        Dismiss the cookie banner and set the odds format once per browser context.
+
+        Both settings are kept by the context, so this runs on the first page opened in each context (including
+        contexts replaced after a proxy switch) and is skipped for contexts already prepared. Pages opened meanwhile
+        in the same context wait for the warm-up instead of repeating it.
+
+        Args:
+            page (Page): A page of the context to warm up.
+        """
+        context = page.context
+        if context in self._warmed_contexts:
+            return
+
+        async with self._context_warm_up_locks.setdefault(context, asyncio.Lock()):
+            if context in self._warmed_contexts:
+                return
+
+            self.logger.info("Warming up browser context: dismissing cookie banner and setting odds format")
+            try:
+                await self.rate_limiter.goto(page, ODDSPORTAL_BASE_URL, timeout=20000, wait_until="domcontentloaded")
+            except Exception as e:
+                # The next page opened in this context tries again
+                self.logger.warning(f"Failed to warm up browser context: {e}")
+                return
+            await self.browser_helper.dismiss_cookie_banner(page=page)
+            await self.set_odds_format(page=page)
+            self._warmed_contexts.add(context)
 
     async def _scrape_match_data(
         self,
@@ -321,21 +714,37 @@ class BaseScraper:
             markets (Optional[List[str]]): A list of markets to scrape (e.g., ['1x2', 'over_under_2_5']).
             scrape_odds_history (bool): Whether to scrape and attach odds history.
             target_bookmaker (str): If set, only scrape odds for this bookmaker.
-            preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets without loading individual bookmaker details.
+            preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets without loading
+                individual bookmaker details.
 
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing scraped data, or None if scraping fails.
         """
         self.logger.info(f"Scraping match: {match_link}")
 
+        # Odds history is only available by hovering the rendered odds, so it keeps the page extraction path
+        odds_feed_client = None
+        if self.use_odds_feed and markets and not scrape_odds_history and not preview_submarkets_only:
+            odds_feed_client = OddsFeedClient(page)
+            odds_feed_client.attach()
+
         try:
             # Navigate to the match page with extended timeout
-            await page.goto(match_link, timeout=30000, wait_until="domcontentloaded")
+            with self.metrics.stage("goto"):
+                response = await self.rate_limiter.goto(
+                    page, match_link, timeout=self.MATCH_NAVIGATION_TIMEOUT, wait_until="domcontentloaded"
+                )
+            if response and response.status in BLOCKED_STATUSES:
+                raise BlockedError(f"HTTP {response.status} on {match_link}")
 
-            # Wait a bit for dynamic content to load
-            await page.wait_for_timeout(3000)
+            # Wait for the event header to be populated instead of a fixed delay
+            with self.metrics.stage("header_wait"):
+                header_ready = await self.page_readiness.wait_for_event_header(page)
+            if not header_ready:
+                self.logger.warning("React event header not ready, attempting to parse existing content")
 
-            match_details = await self._extract_match_details_event_header(page)
+            with self.metrics.stage("header_parse"):
+                match_details = await self._extract_match_details_event_header(page)
 
             if not match_details:
                 self.logger.warning(
@@ -346,15 +755,36 @@ class BaseScraper:
             if markets:
                 self.logger.info(f"Scraping markets: {markets}")
                 try:
-                    market_data = await self.market_extractor.scrape_markets(
-                        page=page,
-                        sport=sport,
-                        markets=markets,
-                        period="FullTime",
-                        scrape_odds_history=scrape_odds_history,
-                        target_bookmaker=target_bookmaker,
-                        preview_submarkets_only=preview_submarkets_only,
-                    )
+                    market_data = {}
+                    remaining_markets = markets
+
+                    if odds_feed_client:
+                        with self.metrics.stage("feed_wait"):
+                            payloads = await odds_feed_client.wait_for_payloads(timeout=self.ODDS_FEED_TIMEOUT)
+                            bookmaker_names = await odds_feed_client.get_bookmaker_names()
+                        with self.metrics.stage("feed_decode"):
+                            market_data, remaining_markets = self.market_extractor.extract_markets_from_feed(
+                                payloads=payloads,
+                                sport=sport,
+                                markets=markets,
+                                period="FullTime",
+                                target_bookmaker=target_bookmaker,
+                                bookmaker_names=bookmaker_names,
+                            )
+
+                    if remaining_markets:
+                        market_data.update(
+                            await self.market_extractor.scrape_markets(
+                                page=page,
+                                sport=sport,
+                                markets=remaining_markets,
+                                period="FullTime",
+                                scrape_odds_history=scrape_odds_history,
+                                target_bookmaker=target_bookmaker,
+                                preview_submarkets_only=preview_submarkets_only,
+                            )
+                        )
+
                     if market_data:
                         # Validate market data for empty odds
                         has_valid_data = False
@@ -388,9 +818,16 @@ class BaseScraper:
             return match_details
 
         except Exception as e:
+            if classify_error(e) in self.PROXY_FAILURES:
+                # Let the worker retry it under its error class budget and charge it to the proxy
+                raise as_scrape_error(e) from e
             self.logger.error(f"Error scraping match data from {match_link}: {e}")
             return None
 
+        finally:
+            if odds_feed_client:
+                odds_feed_client.detach()
+
     async def _extract_match_details_event_header(self, page: Page) -> dict[str, Any] | None:
         """
         Extract match details such as date, teams, and scores from the react event header.
@@ -402,25 +839,11 @@ class BaseScraper:
             Optional[Dict[str, Any]]: A dictionary containing match details, or None if header is not found.
         """
         try:
-            # Wait for the react event header to be loaded
-            try:
-                await page.wait_for_selector("#react-event-header", timeout=10000)
-            except Exception:
-                # If we can't find the selector, try to get the content anyway
-                self.logger.warning("React event header selector not found, attempting to parse existing content")
-
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-            event_header_div = soup.find("div", id="react-event-header")
-
-            if not event_header_div:
-                self.logger.warning("React event header div not found in page content")
-                return None
+            # Read the header's data attribute in the page instead of serializing and parsing the whole document
+            data_attribute = await self.market_extractor.page_content_fetcher.fetch_event_header_data(page)
 
-            # Check if the div has the 'data' attribute
-            data_attribute = event_header_div.get("data")
             if not data_attribute:
-                self.logger.warning("React event header div found but 'data' attribute is missing")
+                self.logger.warning("React event header div not found or its 'data' attribute is missing")
                 return None
 
             try:
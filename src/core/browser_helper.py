@@ -1,9 +1,14 @@
+from collections.abc import Awaitable, Callable
+import inspect
 import logging
 import time
+from typing import Any
+from urllib.parse import urlparse
 
 from playwright.async_api import Page
 
 from src.core.odds_portal_selectors import OddsPortalSelectors
+from src.core.page_readiness import PageReadiness
 
 
 class BrowserHelper:
@@ -15,13 +20,23 @@ class BrowserHelper:
     - Market navigation (including hidden markets)
     - Scrolling operations
     - Element interaction utilities
+
+    Where each market tab was found (visible or under "More", and with which selectors) is remembered per sport, so
+    later matches go straight to it instead of probing every selector; a location that stops working is forgotten.
     """
 
-    def __init__(self):
+    def __init__(self, page_readiness: PageReadiness | None = None):
         """
         Initialize the BrowserHelper class.
+
+        Args:
+            page_readiness (Optional[PageReadiness]): Waits on DOM conditions instead of fixed sleeps.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.page_readiness = page_readiness or PageReadiness()
+        # (sport, market tab name) -> where the tab was last found, see `navigate_to_market_tab`
+        self.market_tab_locations: dict[tuple[str, str], dict[str, str]] = {}
+        self.market_tab_cache_counters = {"hits": 0, "misses": 0, "probes": 0}
 
     # =============================================================================
     # COOKIE BANNER MANAGEMENT
@@ -66,6 +81,10 @@ class BrowserHelper:
         Navigate to a specific market tab by its name.
         Now supports hidden markets under the "More" dropdown.
 
+        The location the tab was last found at for the page's sport is tried first; it only counts as a hit once an
+        active tab indicator shows the market. If it no longer works it is forgotten and every selector is probed
+        again.
+
         Args:
             page: The Playwright page instance.
             market_tab_name: The name of the market tab to navigate to (e.g., 'Over/Under', 'Draw No Bet').
@@ -75,6 +94,23 @@ class BrowserHelper:
             bool: True if the market tab was successfully selected, False otherwise.
         """
         self.logger.info(f"Attempting to navigate to market tab: {market_tab_name}")
+        cache_key = (self._sport_of(page), market_tab_name)
+        location = self.market_tab_locations.get(cache_key)
+
+        if location:
+            # Strict check only: the page-content fallback of `_verify_tab_is_active` would confirm a wrong tab
+            if await self._click_market_tab_at(page, market_tab_name, location, timeout) and (
+                await self.page_readiness.wait_for_active_tab(page, market_tab_name)
+            ):
+                self.market_tab_cache_counters["hits"] += 1
+                self.logger.info(f"Successfully navigated to {market_tab_name} tab (cached {location['location']}).")
+                return True
+
+            self.market_tab_cache_counters["misses"] += 1
+            self.market_tab_locations.pop(cache_key, None)
+            self.logger.info(f"Cached location of {market_tab_name} tab no longer works, probing every selector.")
+
+        self.market_tab_cache_counters["probes"] += 1
 
         # First attempt: Try to find the market directly in visible tabs
         market_found = False
@@ -87,16 +123,19 @@ class BrowserHelper:
             # Verify that the tab is actually active
             if await self._verify_tab_is_active(page, market_tab_name):
                 self.logger.info(f"Successfully navigated to {market_tab_name} tab (directly visible).")
+                self.market_tab_locations[cache_key] = {"location": "visible", "selector": selector}
                 return True
             else:
                 self.logger.warning(f"Tab {market_tab_name} was clicked but is not active.")
 
         # Second attempt: Try to find the market in the "More" dropdown
         self.logger.info(f"Market '{market_tab_name}' not found in visible tabs. Checking 'More' dropdown...")
-        if await self._click_more_if_market_hidden(page, market_tab_name, timeout):
+        location = await self._click_more_if_market_hidden(page, market_tab_name, timeout)
+        if location:
             # Verify that the tab is actually active
             if await self._verify_tab_is_active(page, market_tab_name):
                 self.logger.info(f"Successfully navigated to {market_tab_name} tab (via 'More' dropdown).")
+                self.market_tab_locations[cache_key] = location
                 return True
             else:
                 self.logger.warning(f"Tab {market_tab_name} was clicked but is not active.")
@@ -106,6 +145,16 @@ class BrowserHelper:
         )
         return False
 
+    def market_tab_cache_stats(self) -> dict[str, Any]:
+        """
+        Counters of the market tab location cache.
+
+        Returns:
+            Dict[str, Any]: Navigations served from a cached location (`hits`), cached locations that no longer
+            worked (`misses`), navigations that probed every selector (`probes`) and the locations now known.
+        """
+        return {**self.market_tab_cache_counters, "known_locations": len(self.market_tab_locations)}
+
     # =============================================================================
     # SCROLLING OPERATIONS
     # =============================================================================
@@ -117,6 +166,7 @@ class BrowserHelper:
         scroll_pause_time=3,
         max_scroll_attempts=5,
         content_check_selector: str | None = None,
+        on_new_content: Callable[[], Awaitable[None] | None] | None = None,
     ):
         """
         Scrolls down the page until no new content is loaded or a timeout is reached.
@@ -132,6 +182,9 @@ class BrowserHelper:
             scroll_pause_time (int): The time (in seconds) to pause between scrolls (default: 3).
             max_scroll_attempts (int): The maximum number of attempts to detect new content (default: 5).
             content_check_selector (str): Optional CSS selector to check for new content after scrolling.
+            on_new_content (Optional[Callable]): Called (and awaited if async) with the content present before the
+                first scroll and again every time scrolling loads more, so callers can consume it while scrolling
+                continues.
 
         Returns:
             bool: True if scrolling completed successfully, False otherwise.
@@ -149,6 +202,7 @@ class BrowserHelper:
             self.logger.info(f"Initial element count: {last_element_count}")
 
         self.logger.info(f"Initial page height: {last_height}")
+        await self._notify_new_content(on_new_content)
 
         while time.time() < end_time:
             # Scroll to bottom
@@ -175,6 +229,7 @@ class BrowserHelper:
                 else:
                     stable_count_attempts = 0  # Reset if content changed
                     last_element_count = new_element_count
+                    await self._notify_new_content(on_new_content)
             else:
                 # Fallback to height-based detection
                 if new_height == last_height:
@@ -186,12 +241,20 @@ class BrowserHelper:
                         return True
                 else:
                     stable_count_attempts = 0
+                    await self._notify_new_content(on_new_content)
 
             last_height = new_height
 
         self.logger.info("Reached scrolling timeout. Stopping scroll.")
         return False
 
+    async def _notify_new_content(self, on_new_content: Callable[[], Awaitable[None] | None] | None):
+        """Run the `scroll_until_loaded` content callback, if any."""
+        if on_new_content:
+            callback_result = on_new_content()
+            if inspect.isawaitable(callback_result):
+                await callback_result
+
     async def scroll_until_visible_and_click_parent(
         self, page, selector, text: str | None = None, timeout=20, scroll_pause_time=3
     ):
@@ -310,7 +373,15 @@ class BrowserHelper:
             self.logger.error(f"Error clicking element with text '{text}': {e}")
             return False
 
-    async def _click_more_if_market_hidden(self, page: Page, market_tab_name: str, timeout: int = 10000):
+    async def _click_more_if_market_hidden(
+        self,
+        page: Page,
+        market_tab_name: str,
+        timeout: int = 10000,
+        more_selectors: list[str] | None = None,
+        dropdown_selectors: list[str] | None = None,
+        debug_dropdown: bool = True,
+    ) -> dict[str, str] | None:
         """
         Attempts to find and click a market tab hidden in the "More" dropdown.
 
@@ -318,13 +389,17 @@ class BrowserHelper:
             page (Page): The Playwright page instance.
             market_tab_name (str): The name of the market tab to find.
             timeout (int): Timeout in milliseconds.
+            more_selectors (Optional[List[str]]): "More" button selectors to try; defaults to all known ones.
+            dropdown_selectors (Optional[List[str]]): Dropdown entry selectors to try; defaults to all known ones.
+            debug_dropdown (bool): Log the dropdown's entries when the market is not among them.
 
         Returns:
-            bool: True if the market was found and clicked in the "More" dropdown, False otherwise.
+            Optional[Dict[str, str]]: Where the market was found (`location` "more", `more_selector` and
+            `selector` of the dropdown entry), or None if it was not found and clicked in the "More" dropdown.
         """
         try:
-            more_clicked = False
-            for selector in OddsPortalSelectors.MORE_BUTTON_SELECTORS:
+            more_clicked = None
+            for selector in more_selectors or OddsPortalSelectors.MORE_BUTTON_SELECTORS:
                 try:
                     more_element = await page.query_selector(selector)
                     if more_element:
@@ -332,7 +407,7 @@ class BrowserHelper:
                         if text and ("more" in text.lower() or "..." in text):
                             self.logger.info(f"Clicking 'More' button: '{text.strip()}'")
                             await more_element.click()
-                            more_clicked = True
+                            more_clicked = selector
                             break
                 except Exception as e:
                     self.logger.debug(f"Exception while searching for 'More' button with selector '{selector}': {e}")
@@ -340,11 +415,13 @@ class BrowserHelper:
 
             if not more_clicked:
                 self.logger.warning("Could not find or click 'More' button")
-                return False
+                return None
 
-            await page.wait_for_timeout(1000)
-
-            dropdown_selectors = OddsPortalSelectors.get_dropdown_selectors_for_market(market_tab_name)
+            dropdown_selectors = dropdown_selectors or OddsPortalSelectors.get_dropdown_selectors_for_market(
+                market_tab_name
+            )
+            if not await self.page_readiness.wait_for_dropdown_entry(page, market_tab_name):
+                self.logger.info(f"No visible '{market_tab_name}' entry in the 'More' dropdown.")
             for selector in dropdown_selectors:
                 try:
                     dropdown_element = await page.query_selector(selector)
@@ -353,7 +430,7 @@ class BrowserHelper:
                         if text and market_tab_name.lower() in text.lower():
                             self.logger.info(f"Found '{market_tab_name}' in dropdown. Clicking...")
                             await dropdown_element.click()
-                            return True
+                            return {"location": "more", "more_selector": more_clicked, "selector": selector}
                 except Exception as e:
                     self.logger.debug(
                         f"Exception while searching for market '{market_tab_name}' in dropdown with selector "
@@ -361,6 +438,9 @@ class BrowserHelper:
                     )
                     continue
 
+            if not debug_dropdown:
+                return None
+
             self.logger.info("Debugging dropdown content:")
             dropdown_items = await page.query_selector_all(OddsPortalSelectors.DROPDOWN_DEBUG_ELEMENTS)
             for item in dropdown_items[:10]:  # Limit to first 10 items
@@ -372,11 +452,47 @@ class BrowserHelper:
                     self.logger.debug(f"Exception while logging dropdown item: {e}")
                     continue
 
-            return False
+            return None
 
         except Exception as e:
             self.logger.error(f"Error in _click_more_if_market_hidden: {e}")
-            return False
+            return None
+
+    async def _click_market_tab_at(
+        self, page: Page, market_tab_name: str, location: dict[str, str], timeout: int
+    ) -> bool:
+        """
+        Click a market tab at the location it was last found at, without probing the other selectors.
+
+        Args:
+            page (Page): The Playwright page instance.
+            market_tab_name (str): The name of the market tab.
+            location (Dict[str, str]): The cached location, see `navigate_to_market_tab`.
+            timeout (int): Timeout in milliseconds.
+
+        Returns:
+            bool: True if the tab was clicked, False otherwise.
+        """
+        if location["location"] == "visible":
+            return await self._wait_and_click(
+                page=page, selector=location["selector"], text=market_tab_name, timeout=timeout
+            )
+
+        return bool(
+            await self._click_more_if_market_hidden(
+                page,
+                market_tab_name,
+                timeout,
+                more_selectors=[location["more_selector"]],
+                dropdown_selectors=[location["selector"]],
+                debug_dropdown=False,
+            )
+        )
+
+    @staticmethod
+    def _sport_of(page: Page) -> str:
+        """The sport of a match page, from the first segment of its URL path (empty if there is none)."""
+        return urlparse(page.url).path.strip("/").split("/", 1)[0]
 
     async def _verify_tab_is_active(self, page: Page, market_tab_name: str) -> bool:
         """
@@ -390,27 +506,16 @@ class BrowserHelper:
             bool: True if the tab is active, False otherwise.
         """
         try:
-            # Wait a bit for the tab switch to complete
-            await page.wait_for_timeout(500)
-
-            # Check for active tab indicators
-            active_selectors = ["li.active", "li[class*='active']", ".active", "[class*='active']"]
-
-            for selector in active_selectors:
-                try:
-                    active_element = await page.query_selector(selector)
-                    if active_element:
-                        text = await active_element.text_content()
-                        if text and market_tab_name.lower() in text.lower():
-                            self.logger.info(f"Tab '{market_tab_name}' is confirmed active")
-                            return True
-                except Exception as e:
-                    self.logger.debug(f"Exception checking active selector '{selector}': {e}")
-                    continue
+            # Returns as soon as an active tab indicator shows the market
+            if await self.page_readiness.wait_for_active_tab(page, market_tab_name):
+                self.logger.info(f"Tab '{market_tab_name}' is confirmed active")
+                return True
 
-            # Alternative: check if the market name appears in the current URL or page content
-            page_content = await page.content()
-            if market_tab_name and market_tab_name.lower() in page_content.lower():
+            # Alternative: check if the market name appears in the page content (searched in the page to avoid
+            # serializing the whole document)
+            if market_tab_name and await page.evaluate(
+                "(name) => document.documentElement.innerHTML.toLowerCase().includes(name)", market_tab_name.lower()
+            ):
                 self.logger.info(f"Market '{market_tab_name}' found in page content")
                 return True
 
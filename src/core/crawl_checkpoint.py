@@ -0,0 +1,268 @@
+from datetime import UTC, datetime
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, ClassVar
+
+
+class CrawlCheckpoint:
+    """
+    SQLite-backed crawl state so an interrupted run can resume where it stopped.
+
+    Work is tracked per (match URL, market) with a `pending`, `done` or `failed` status, and the scraped match
+    data is stored as soon as a match finishes. Rerunning with the same arguments (the same `run_key`) skips
+    every market already done and only scrapes what is left; the final result set is rebuilt from the store,
+    so matches scraped before the interruption are not lost.
+    """
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+    # Task name used when no markets are requested and only the match details are scraped.
+    MATCH_DETAILS_TASK = "match_details"
+    # Match URLs per `IN (...)` lookup, below SQLite's historical limit of 999 bound parameters
+    LOOKUP_BATCH_SIZE = 500
+
+    _SCHEMA: ClassVar[list[str]] = [
+        """
+        CREATE TABLE IF NOT EXISTS checkpoint_tasks (
+            run_key TEXT NOT NULL,
+            match_url TEXT NOT NULL,
+            market TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (run_key, match_url, market)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS checkpoint_results (
+            run_key TEXT NOT NULL,
+            match_url TEXT NOT NULL,
+            result TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (run_key, match_url)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS checkpoint_link_sets (
+            run_key TEXT NOT NULL,
+            scope TEXT NOT NULL,
+            links TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (run_key, scope)
+        )
+        """,
+    ]
+
+    def __init__(self, db_path: str, run_key: str):
+        """
+        Args:
+            db_path (str): Path of the SQLite database file (created if missing).
+            run_key (str): Identifies the run; see `build_run_key`.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.db_path = db_path
+        self.run_key = run_key
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(db_path)
+        # WAL keeps every committed result on disk even if the process is killed mid-run
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in self._SCHEMA:
+            self.connection.execute(statement)
+        self.connection.commit()
+
+        self.logger.info(f"Using crawl checkpoint {db_path} (run key {run_key}): {self.summary()}")
+
+    @staticmethod
+    def build_run_key(**run_args: Any) -> str:
+        """
+        Derive a stable run key from the arguments that define what a run scrapes.
+
+        Args:
+            **run_args: e.g. command, sport, leagues, season, markets. Order does not matter.
+
+        Returns:
+            str: A short hash; identical arguments always give the same key.
+        """
+        canonical = json.dumps(run_args, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    def register(self, match_links: list[str], markets: list[str] | None):
+        """
+        Add a pending task for every (match, market) pair not tracked yet. Existing tasks keep their status.
+
+        Args:
+            match_links (List[str]): The match URLs to scrape.
+            markets (Optional[List[str]]): The markets to scrape, or None for match details only.
+        """
+        now = self._now()
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO checkpoint_tasks (run_key, match_url, market, status, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (self.run_key, link, market, self.PENDING, now)
+                for link in match_links
+                for market in self._task_markets(markets)
+            ],
+        )
+        self.connection.commit()
+
+    def get_pending_markets(self, match_links: list[str], markets: list[str] | None) -> dict[str, list[str] | None]:
+        """
+        Work left to do for each match.
+
+        Args:
+            match_links (List[str]): The match URLs of this run.
+            markets (Optional[List[str]]): The markets requested for this run.
+
+        Returns:
+            Dict[str, Optional[List[str]]]: Match URL to the markets still to scrape (None meaning match details
+            only), for matches with unfinished work. Matches whose tasks are all done are left out.
+        """
+        task_markets = self._task_markets(markets)
+        done = self._done_tasks(match_links)
+        pending = {}
+
+        for link in match_links:
+            remaining = [market for market in task_markets if (link, market) not in done]
+            if remaining:
+                pending[link] = [market for market in remaining if market != self.MATCH_DETAILS_TASK] or None
+
+        return pending
+
+    def record_result(self, match_link: str, result: dict[str, Any], markets: list[str] | None) -> dict[str, Any]:
+        """
+        Store a scraped match and mark its markets done (or failed when they came back empty).
+
+        The result is merged over what an earlier run stored for the match, so resuming with a subset of
+        markets keeps the previously scraped ones.
+
+        Args:
+            match_link (str): The match URL.
+            result (Dict[str, Any]): The scraped match data.
+            markets (Optional[List[str]]): The markets that were scraped for this match.
+
+        Returns:
+            Dict[str, Any]: The merged match data.
+        """
+        merged = {**(self.get_result(match_link) or {}), **result}
+        now = self._now()
+
+        for market in self._task_markets(markets):
+            # Markets keyed differently (e.g. preview submarkets) count as done with the match
+            market_key = f"{market}_market"
+            empty = market_key in result and not result[market_key]
+            self._update_task(match_link, market, self.FAILED if empty else self.DONE, "empty odds" if empty else None)
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO checkpoint_results (run_key, match_url, result, updated_at) VALUES (?, ?, ?, ?)",
+            (self.run_key, match_link, json.dumps(merged, default=str), now),
+        )
+        self.connection.commit()
+        return merged
+
+    def record_failure(self, match_link: str, markets: list[str] | None, error: str | None = None):
+        """
+        Mark the markets of a match that could not be scraped as failed so the next run retries them.
+
+        Args:
+            match_link (str): The match URL.
+            markets (Optional[List[str]]): The markets that were attempted.
+            error (Optional[str]): Why scraping failed.
+        """
+        for market in self._task_markets(markets):
+            self._update_task(match_link, market, self.FAILED, error)
+        self.connection.commit()
+
+    def get_result(self, match_link: str) -> dict[str, Any] | None:
+        """Return the stored data of a match, or None if nothing was stored for it yet."""
+        row = self.connection.execute(
+            "SELECT result FROM checkpoint_results WHERE run_key = ? AND match_url = ?", (self.run_key, match_link)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_results(self, match_links: list[str]) -> list[dict[str, Any]]:
+        """Return the stored data of the given matches, in the given order, skipping matches without data."""
+        results = []
+        for link in match_links:
+            result = self.get_result(link)
+            if result is not None:
+                results.append(result)
+        return results
+
+    def save_links(self, scope: str, links: list[str]):
+        """
+        Remember the match links collected for a listing (e.g. a league season URL).
+
+        Args:
+            scope (str): What the links were collected from.
+            links (List[str]): The collected match links.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO checkpoint_link_sets (run_key, scope, links, updated_at) VALUES (?, ?, ?, ?)",
+            (self.run_key, scope, json.dumps(links), self._now()),
+        )
+        self.connection.commit()
+
+    def get_links(self, scope: str) -> list[str] | None:
+        """Return the match links saved for a listing, or None if it was not collected yet."""
+        row = self.connection.execute(
+            "SELECT links FROM checkpoint_link_sets WHERE run_key = ? AND scope = ?", (self.run_key, scope)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def summary(self) -> dict[str, int]:
+        """Count the tasks of this run by status."""
+        rows = self.connection.execute(
+            "SELECT status, COUNT(*) FROM checkpoint_tasks WHERE run_key = ? GROUP BY status", (self.run_key,)
+        ).fetchall()
+        counts = {self.PENDING: 0, self.DONE: 0, self.FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def _task_markets(self, markets: list[str] | None) -> list[str]:
+        return list(markets) if markets else [self.MATCH_DETAILS_TASK]
+
+    def _done_tasks(self, match_links: list[str]) -> set[tuple[str, str]]:
+        # Only the rows of the given matches are read, through the (run_key, match_url, market) primary key index,
+        # so checking one match costs the same however many tasks the run holds
+        links = list(dict.fromkeys(match_links))
+        done = set()
+        for start in range(0, len(links), self.LOOKUP_BATCH_SIZE):
+            batch = links[start : start + self.LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            # Only the placeholders are interpolated, the values stay bound
+            query = (
+                "SELECT match_url, market FROM checkpoint_tasks "  # noqa: S608
+                f"WHERE run_key = ? AND match_url IN ({placeholders}) AND status = ?"
+            )
+            rows = self.connection.execute(query, (self.run_key, *batch, self.DONE)).fetchall()
+            done.update(rows)
+        return done
+
+    def _update_task(self, match_link: str, market: str, status: str, error: str | None):
+        self.connection.execute(
+            "INSERT INTO checkpoint_tasks (run_key, match_url, market, status, attempts, last_error, updated_at) "
+            "VALUES (?, ?, ?, ?, 1, ?, ?) "
+            "ON CONFLICT (run_key, match_url, market) DO UPDATE SET "
+            "status = excluded.status, attempts = attempts + 1, last_error = excluded.last_error, "
+            "updated_at = excluded.updated_at",
+            (self.run_key, match_link, market, status, error, self._now()),
+        )
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(UTC).isoformat()
@@ -0,0 +1,81 @@
+import glob
+import logging
+import os
+from typing import Any
+
+from playwright.async_api import BrowserContext, Request, Route
+
+
+class HarArchive:
+    """
+    Records the traffic of a run to HAR files, or replays a run from them without touching the network.
+
+    When recording, every browser context writes what it loads to its own `context-NNN.har` file in `har_dir`
+    (through `context.route_from_har(update=True)`); the files are written when the contexts close. When replaying,
+    every context answers its requests from all the HAR files of `har_dir` with `context.route_from_har`. Requests
+    missing from the archive are aborted and counted instead of going out, so a replayed run never reaches the site.
+
+    A recorded run can be replayed any number of times with the same pages, which makes parser changes and
+    performance work comparable run to run (see `benchmarks/`).
+    """
+
+    HAR_FILE_PATTERN = "context-*.har"
+
+    def __init__(self, har_dir: str, replay: bool = False):
+        """
+        Args:
+            har_dir (str): Directory the HAR files are written to or replayed from.
+            replay (bool): Serve requests from the archive instead of recording them.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.har_dir = har_dir
+        self.replay = replay
+        self.counters = {"contexts": 0, "missing_requests": 0}
+
+        if replay:
+            self.har_files = sorted(glob.glob(os.path.join(har_dir, self.HAR_FILE_PATTERN)))
+            if not self.har_files:
+                raise ValueError(f"No HAR files matching '{self.HAR_FILE_PATTERN}' to replay in '{har_dir}'.")
+            self.logger.info(f"Replaying traffic from {len(self.har_files)} HAR file(s) in {har_dir}")
+        else:
+            os.makedirs(har_dir, exist_ok=True)
+            self.har_files = []
+            self.logger.info(f"Recording traffic to {har_dir}")
+
+    async def attach(self, context: BrowserContext):
+        """
+        Record or replay the requests of every page of a browser context.
+
+        When replaying, attach the archive before any other route handler: handlers registered later run first and
+        only the requests they pass on with `route.fallback()` reach the archive.
+
+        Args:
+            context (BrowserContext): The context.
+        """
+        self.counters["contexts"] += 1
+
+        if not self.replay:
+            har_name = self.HAR_FILE_PATTERN.replace("*", f"{self.counters['contexts']:03d}")
+            har_path = os.path.join(self.har_dir, har_name)
+            await context.route_from_har(har_path, update=True, update_content="embed", update_mode="minimal")
+            self.har_files.append(har_path)
+            return
+
+        await context.route("**/*", self._abort_missing)
+        for har_path in self.har_files:
+            await context.route_from_har(har_path, not_found="fallback")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Archive counters since it was created.
+
+        Returns:
+            Dict[str, Any]: The `mode`, the `har_files` used, the `contexts` attached and, when replaying, the
+            `missing_requests` aborted because the archive did not hold them.
+        """
+        return {"mode": "replay" if self.replay else "record", "har_files": len(self.har_files), **self.counters}
+
+    async def _abort_missing(self, route: Route, request: Request):
+        self.counters["missing_requests"] += 1
+        self.logger.debug(f"Not in the HAR archive, aborting: {request.method} {request.url}")
+        await route.abort()
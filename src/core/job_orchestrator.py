@@ -0,0 +1,154 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from src.core.odds_portal_scraper import OddsPortalScraper
+
+
+class JobOrchestrator:
+    """
+    Runs scraping jobs (one league and season each) in parallel browser lanes.
+
+    A lane owns one started scraper, and so one browser and context, and runs its jobs one after the other,
+    reusing the browser across them. At most `max_parallel_jobs` lanes run at once. Lanes are expected to share
+    a `RequestRateLimiter` (see `create_scraper`) so parallel jobs stay within the per-host request rate. Results are
+    merged in job order whatever order the jobs finish in.
+    """
+
+    def __init__(
+        self,
+        create_scraper: Callable[[], Awaitable[OddsPortalScraper]],
+        max_parallel_jobs: int = 1,
+        scrapers: list[OddsPortalScraper] | None = None,
+    ):
+        """
+        Args:
+            create_scraper (Callable): Coroutine function returning a new, started scraper for a lane. Scrapers it
+                creates are stopped when the orchestrator closes.
+            max_parallel_jobs (int): Global cap on the number of jobs (and lanes) running at the same time.
+            scrapers (Optional[List[OddsPortalScraper]]): Already started scrapers to use as the first lanes. They
+                are left running on close.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.create_scraper = create_scraper
+        self.max_parallel_jobs = max(1, max_parallel_jobs)
+        self._provided_scrapers = list(scrapers or [])
+        self._created_scrapers: list[OddsPortalScraper] = []
+
+    @staticmethod
+    def build_jobs(
+        sport: str, leagues: list[str], seasons: list[str | None] | None = None, **job_kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """
+        Build one job per league and season.
+
+        Args:
+            sport (str): The sport to scrape.
+            leagues (List[str]): The leagues to scrape.
+            seasons (Optional[List[Optional[str]]]): The seasons to scrape; omit for jobs without a season (upcoming
+                matches).
+            **job_kwargs: Extra keyword arguments copied into every job (e.g. `date`).
+
+        Returns:
+            List[Dict[str, Any]]: The jobs, league by league, each holding the scrape function's keyword arguments.
+        """
+        jobs = []
+        for league in leagues:
+            for season in seasons or [None]:
+                job = {"sport": sport, "league": league, **job_kwargs}
+                if season is not None:
+                    job["season"] = season
+                jobs.append(job)
+        return jobs
+
+    async def run(
+        self,
+        jobs: list[dict[str, Any]],
+        run_job: Callable[[OddsPortalScraper, dict[str, Any]], Awaitable[list[dict[str, Any]] | None]],
+    ) -> list[dict[str, Any]]:
+        """
+        Run every job and merge their results.
+
+        Args:
+            jobs (List[Dict[str, Any]]): The jobs to run.
+            run_job (Callable): Coroutine function scraping one job with the lane's scraper and returning its matches.
+
+        Returns:
+            List[Dict[str, Any]]: The matches of all jobs, in job order.
+        """
+        lane_count = min(self.max_parallel_jobs, len(jobs))
+        self.logger.info(f"Starting {len(jobs)} job(s) on {lane_count} parallel lane(s)")
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index in range(len(jobs)):
+            queue.put_nowait(index)
+
+        results: dict[int, list[dict[str, Any]]] = {}
+        failed_jobs: list[dict[str, Any]] = []
+
+        async def run_lane(lane: int):
+            scraper = None
+
+            while not queue.empty():
+                index = queue.get_nowait()
+                job = jobs[index]
+                label = self._describe(job)
+
+                try:
+                    if scraper is None:
+                        scraper = await self._get_lane_scraper(lane)
+
+                    self.logger.info(f"[lane {lane}] [{index + 1}/{len(jobs)}] Processing {label}")
+                    job_data = await run_job(scraper, job)
+
+                    if job_data:
+                        results[index] = job_data
+                        self.logger.info(f"[lane {lane}] Successfully scraped {len(job_data)} matches from {label}")
+                    elif scraper.result_sink is not None:
+                        # Streamed matches are written to the sink as they complete, so jobs return none
+                        self.logger.info(f"[lane {lane}] Finished {label}; matches were streamed to the result sink")
+                    else:
+                        self.logger.warning(f"[lane {lane}] No data returned for {label}")
+
+                except Exception as e:
+                    self.logger.error(f"[lane {lane}] Failed to scrape {label}: {e}")
+                    failed_jobs.append(job)
+
+        await asyncio.gather(*(run_lane(lane) for lane in range(lane_count)))
+
+        merged = [match for index in sorted(results) for match in results[index]]
+
+        if failed_jobs:
+            self.logger.warning(
+                f"Failed to scrape {len(failed_jobs)} job(s): {[self._describe(job) for job in failed_jobs]}"
+            )
+
+        self.logger.info(
+            f"Job orchestration completed: {len(jobs) - len(failed_jobs)}/{len(jobs)} jobs successful, "
+            f"{len(merged)} total matches scraped"
+        )
+        return merged
+
+    async def close(self):
+        """Stop the scrapers created for the lanes."""
+        for scraper in self._created_scrapers:
+            try:
+                await scraper.stop_playwright()
+            except Exception as e:
+                self.logger.warning(f"Failed to stop a lane scraper: {e}")
+        self._created_scrapers = []
+
+    async def _get_lane_scraper(self, lane: int) -> OddsPortalScraper:
+        if lane < len(self._provided_scrapers):
+            return self._provided_scrapers[lane]
+
+        self.logger.info(f"[lane {lane}] Starting a browser for this lane")
+        scraper = await self.create_scraper()
+        self._created_scrapers.append(scraper)
+        return scraper
+
+    @staticmethod
+    def _describe(job: dict[str, Any]) -> str:
+        season = f" {job['season']}" if job.get("season") else ""
+        return f"{job.get('league')}{season}"
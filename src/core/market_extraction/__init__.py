@@ -1,13 +1,24 @@
+from .market_execution_planner import MarketExecutionPlan, MarketExecutionPlanner
 from .market_grouping import MarketGrouping
 from .navigation_manager import NavigationManager
+from .odds_feed_client import OddsFeedClient
+from .odds_feed_decoder import OddsFeedDecoder
 from .odds_history_extractor import OddsHistoryExtractor
 from .odds_parser import OddsParser
+from .page_content_fetcher import PageContentFetcher
+from .parser_patterns import ParserPatterns
 from .submarket_extractor import SubmarketExtractor
 
 __all__ = [
+    "MarketExecutionPlan",
+    "MarketExecutionPlanner",
     "MarketGrouping",
     "NavigationManager",
+    "OddsFeedClient",
+    "OddsFeedDecoder",
     "OddsHistoryExtractor",
     "OddsParser",
+    "PageContentFetcher",
+    "ParserPatterns",
     "SubmarketExtractor",
 ]
@@ -0,0 +1,121 @@
+import logging
+import re
+from typing import Any
+
+from .market_grouping import MarketGrouping
+
+
+class MarketExecutionPlan:
+    """
+    An ordered plan of market tab visits for one match.
+
+    Each main market tab is visited once; the submarkets requested under it are expanded in page order
+    while the tab stays open.
+    """
+
+    def __init__(self, tab_groups: dict[str, list[dict[str, Any]]], unsupported_markets: list[str]):
+        """
+        Args:
+            tab_groups (Dict[str, List[Dict[str, Any]]]): Main market name to the ordered list of steps to run
+                on that tab. Each step holds `market`, `specific_market` and `odds_labels`.
+            unsupported_markets (List[str]): Requested markets that are not registered for the sport.
+        """
+        self.tab_groups = tab_groups
+        self.unsupported_markets = unsupported_markets
+
+    def stats(self) -> dict[str, int]:
+        """
+        Count the navigations and waits of this plan against visiting one tab per market.
+
+        Returns:
+            Dict[str, int]: Planned and per-market (naive) tab navigations, submarket clicks and waits.
+        """
+        markets = sum(len(steps) for steps in self.tab_groups.values())
+        submarkets = sum(1 for steps in self.tab_groups.values() for step in steps if step["specific_market"])
+        tabs = len(self.tab_groups)
+
+        # Every tab navigation is followed by a market switch wait, every submarket expansion by a page load
+        # wait and a click to collapse it again.
+        planned_clicks = tabs + 2 * submarkets
+        planned_waits = tabs + submarkets
+        naive_clicks = markets + 2 * submarkets
+        naive_waits = markets + submarkets
+
+        return {
+            "markets": markets,
+            "tab_navigations": tabs,
+            "naive_tab_navigations": markets,
+            "submarket_expansions": submarkets,
+            "clicks": planned_clicks,
+            "naive_clicks": naive_clicks,
+            "saved_clicks": naive_clicks - planned_clicks,
+            "waits": planned_waits,
+            "naive_waits": naive_waits,
+            "saved_waits": naive_waits - planned_waits,
+        }
+
+    def describe(self) -> str:
+        """Human-readable summary of the plan for logging."""
+        stats = self.stats()
+        tabs = ", ".join(
+            f"{main_market} [{', '.join(step['specific_market'] or step['market'] for step in steps)}]"
+            for main_market, steps in self.tab_groups.items()
+        )
+        return (
+            f"Market plan: {stats['markets']} markets over {stats['tab_navigations']} tab visits "
+            f"(saves {stats['saved_clicks']} clicks and {stats['saved_waits']} waits vs one visit per market): {tabs}"
+        )
+
+
+class MarketExecutionPlanner:
+    """Groups requested markets by main tab and submarket order so each tab is navigated only once."""
+
+    _LINE_PATTERN = re.compile(r"[+-]?\d+(?:\.\d+)?")
+
+    def __init__(self, market_grouping: MarketGrouping | None = None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.market_grouping = market_grouping or MarketGrouping()
+
+    def build_plan(self, markets: list[str], market_methods: dict) -> MarketExecutionPlan:
+        """
+        Build the execution plan for the requested markets.
+
+        Args:
+            markets (List[str]): Markets to scrape, in the order they were requested.
+            market_methods (dict): The sport's market mapping from `SportMarketRegistry`.
+
+        Returns:
+            MarketExecutionPlan: Tabs in first-requested order, each with its submarkets in page order.
+        """
+        tab_groups: dict[str, list[dict[str, Any]]] = {}
+        unsupported_markets = []
+
+        for market in markets:
+            market_info = (
+                self.market_grouping.get_main_market_info(market_methods[market]) if market in market_methods else None
+            )
+            if not market_info:
+                unsupported_markets.append(market)
+                continue
+
+            tab_groups.setdefault(market_info["main_market"], []).append(
+                {
+                    "market": market,
+                    "specific_market": market_info["specific_market"],
+                    "odds_labels": market_info["odds_labels"],
+                }
+            )
+
+        for steps in tab_groups.values():
+            steps.sort(key=self._submarket_order)
+
+        return MarketExecutionPlan(tab_groups=tab_groups, unsupported_markets=unsupported_markets)
+
+    def _submarket_order(self, step: dict[str, Any]) -> tuple:
+        """Markets without a submarket first, then submarket lines ascending as listed on the page."""
+        specific_market = step["specific_market"]
+        if not specific_market:
+            return (0, 0.0)
+
+        line = self._LINE_PATTERN.search(specific_market)
+        return (1, float(line.group())) if line else (2, 0.0)
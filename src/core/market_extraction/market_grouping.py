@@ -16,7 +16,7 @@ class MarketGrouping:
             market_method: The market method lambda function
 
         Returns:
-            dict | None: Dictionary with main_market and odds_labels, or None if not found
+            dict | None: Dictionary with main_market, specific_market and odds_labels, or None if not found
         """
         try:
             # The market method is a lambda that calls extract_market_odds with specific parameters
@@ -26,18 +26,21 @@ class MarketGrouping:
                 closure_vars = market_method.__code__.co_freevars
                 closure_values = [cell.cell_contents for cell in market_method.__closure__]
 
-                # Find main_market and odds_labels in the closure
+                # Find main_market, specific_market and odds_labels in the closure
                 main_market = None
+                specific_market = None
                 odds_labels = None
 
                 for var_name, var_value in zip(closure_vars, closure_values, strict=False):
                     if var_name == "main_market":
                         main_market = var_value
+                    elif var_name == "specific_market":
+                        specific_market = var_value
                     elif var_name == "odds_labels":
                         odds_labels = var_value
 
                 if main_market:
-                    return {"main_market": main_market, "odds_labels": odds_labels}
+                    return {"main_market": main_market, "specific_market": specific_market, "odds_labels": odds_labels}
         except Exception as e:
             self.logger.debug(f"Could not extract market info from method: {e}")
 
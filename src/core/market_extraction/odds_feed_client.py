@@ -0,0 +1,143 @@
+import asyncio
+import json
+import logging
+import re
+from typing import Any, ClassVar
+
+from playwright.async_api import Page, Response
+
+
+class OddsFeedClient:
+    """
+    Captures the odds feed responses a match page fetches while it loads.
+
+    Attach the client before navigating: every JSON response whose URL matches one of `FEED_URL_PATTERNS`
+    is decoded and kept, so the odds of all markets come from the single page load without clicking
+    through market tabs. Responses that are not plain JSON (e.g. obfuscated payloads) are ignored and
+    the caller falls back to DOM extraction.
+    """
+
+    FEED_URL_PATTERNS: ClassVar[list[re.Pattern]] = [
+        re.compile(r"/feed/match-event/"),
+        re.compile(r"/match-event/"),
+        re.compile(r"/feed/match/"),
+    ]
+
+    # Provider id -> bookmaker name mapping exposed by the page, when available.
+    _BOOKMAKER_NAMES_SCRIPT = """
+        () => {
+            const source = window.bookmakersData || (window.pageVar && window.pageVar.bookmakersData) || null;
+            if (!source) return null;
+            const names = {};
+            for (const [id, bookmaker] of Object.entries(source)) {
+                names[id] = typeof bookmaker === 'string' ? bookmaker : (bookmaker.WebName || bookmaker.name || id);
+            }
+            return names;
+        }
+    """
+
+    def __init__(self, page: Page):
+        """
+        Args:
+            page (Page): The Playwright page whose responses are captured.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.page = page
+        self.payloads: list[dict[str, Any]] = []
+        self._pending: set[asyncio.Task] = set()
+        self._payload_received = asyncio.Event()
+        self._attached = False
+
+    def attach(self):
+        """Start capturing odds feed responses."""
+        if not self._attached:
+            self.page.on("response", self._on_response)
+            self._attached = True
+
+    def detach(self):
+        """Stop capturing odds feed responses."""
+        if self._attached:
+            self.page.remove_listener("response", self._on_response)
+            self._attached = False
+
+    async def wait_for_payloads(self, timeout: float = 5.0) -> list[dict[str, Any]]:
+        """
+        Wait until at least one feed payload has been captured.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            List[Dict[str, Any]]: The payloads captured so far (possibly empty).
+        """
+        if not self.payloads:
+            try:
+                await asyncio.wait_for(self._payload_received.wait(), timeout=timeout)
+            except TimeoutError:
+                self.logger.info("No odds feed payload captured within the timeout.")
+
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+        return self.payloads
+
+    async def get_bookmaker_names(self) -> dict[str, str]:
+        """Read the provider id to bookmaker name mapping from the page, if it exposes one."""
+        try:
+            return await self.page.evaluate(self._BOOKMAKER_NAMES_SCRIPT) or {}
+        except Exception as e:
+            self.logger.debug(f"Could not read bookmaker names from the page: {e}")
+            return {}
+
+    @classmethod
+    def is_feed_url(cls, url: str) -> bool:
+        """Whether a response URL belongs to the odds feed."""
+        return any(pattern.search(url) for pattern in cls.FEED_URL_PATTERNS)
+
+    def _on_response(self, response: Response):
+        if not self.is_feed_url(response.url):
+            return
+
+        task = asyncio.ensure_future(self._capture(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _capture(self, response: Response):
+        try:
+            body = await response.text()
+        except Exception as e:
+            self.logger.debug(f"Could not read odds feed response {response.url}: {e}")
+            return
+
+        payload = self.decode_body(body)
+        if payload is None:
+            self.logger.debug(f"Odds feed response is not plain JSON, ignoring: {response.url}")
+            return
+
+        self.payloads.append(payload)
+        self._payload_received.set()
+
+    @staticmethod
+    def decode_body(body: str) -> dict[str, Any] | None:
+        """
+        Decode a feed response body, accepting plain JSON and JSONP-wrapped JSON.
+
+        Args:
+            body (str): The raw response body.
+
+        Returns:
+            Optional[Dict[str, Any]]: The decoded payload, or None if the body is not JSON.
+        """
+        text = body.strip()
+        if text and text[0] not in "{[":
+            start, end = text.find("("), text.rfind(")")
+            if start == -1 or end <= start:
+                return None
+            text = text[start + 1 : end]
+
+        try:
+            payload = json.loads(text)
+        except (TypeError, ValueError):
+            return None
+
+        return payload if isinstance(payload, dict) else None
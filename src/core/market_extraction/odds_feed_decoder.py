@@ -0,0 +1,178 @@
+import logging
+import re
+from typing import Any, ClassVar
+
+from .parser_patterns import ParserPatterns
+
+
+class OddsFeedDecoder:
+    """
+    Decodes OddsPortal match odds feed payloads into the per-bookmaker dict shape produced by `OddsParser`.
+
+    The match page fetches its odds as JSON. Odds live under `d.oddsdata.back`, keyed by an outcome group id
+    of the form `E-{bettingTypeId}-{scopeId}-{handicapTypeId}-{handicapValue}-{mixedParameterId}`, with the
+    odds of every bookmaker stored under its provider id, one value per outcome.
+    """
+
+    BETTING_TYPE_IDS: ClassVar[dict[str, int]] = {
+        "1X2": 1,
+        "Over/Under": 2,
+        "Home/Away": 3,
+        "Double Chance": 4,
+        "Asian Handicap": 5,
+        "Draw No Bet": 6,
+        "European Handicap": 12,
+        "Both Teams to Score": 13,
+    }
+
+    PERIOD_SCOPE_IDS: ClassVar[dict[str, int]] = {
+        "FullIncludingOT": 1,
+        "FullTime": 2,
+        "1stHalf": 3,
+        "2ndHalf": 4,
+    }
+
+    # Markets with a line (e.g. "Over/Under +2.5", "Asian Handicap -0.5"); suffixed lines such as tennis
+    # "Over/Under +2.5 Sets" share betting type ids with other lines and are left to the DOM extractor.
+    _LINE_PATTERN = re.compile(r"^(?P<main>.+?)\s+(?P<line>[+-]?\d+(?:\.\d+)?)$")
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def supports(self, main_market: str, specific_market: str | None = None, period: str = "FullTime") -> bool:
+        """
+        Whether a market can be decoded from the feed.
+
+        Args:
+            main_market (str): The main market name (e.g., "1X2", "Over/Under").
+            specific_market (Optional[str]): The specific market within the main market (e.g., "Over/Under +2.5").
+            period (str): The match period (e.g., "FullTime").
+
+        Returns:
+            bool: True if the feed carries this market in a decodable form.
+        """
+        if main_market not in self.BETTING_TYPE_IDS or period not in self.PERIOD_SCOPE_IDS:
+            return False
+
+        return specific_market is None or self._parse_line(main_market, specific_market) is not None
+
+    def decode_market(
+        self,
+        payload: dict[str, Any],
+        main_market: str,
+        specific_market: str | None,
+        period: str,
+        odds_labels: list[str],
+        target_bookmaker: str | None = None,
+        bookmaker_names: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Decode the odds of one market from a feed payload.
+
+        Args:
+            payload (dict): The decoded JSON body of an odds feed response.
+            main_market (str): The main market name (e.g., "1X2", "Over/Under").
+            specific_market (Optional[str]): The specific market within the main market (e.g., "Over/Under +2.5").
+            period (str): The match period (e.g., "FullTime").
+            odds_labels (list): Labels corresponding to the outcome order (e.g., ["odds_over", "odds_under"]).
+            target_bookmaker (Optional[str]): If set, only decode odds for this bookmaker (case-insensitive).
+            bookmaker_names (Optional[Dict[str, str]]): Provider id to bookmaker name mapping, merged over any
+                names carried by the payload itself.
+
+        Returns:
+            Optional[list[dict]]: Bookmaker odds in the `OddsParser.parse_market_odds` shape, or None if the
+            payload does not carry this market.
+        """
+        if not self.supports(main_market, specific_market, period):
+            return None
+
+        data = payload.get("d") if isinstance(payload.get("d"), dict) else payload
+        outcome_groups = (data.get("oddsdata") or {}).get("back") or {}
+        if not isinstance(outcome_groups, dict):
+            return None
+
+        names = {**self._extract_bookmaker_names(data), **(bookmaker_names or {})}
+        line = self._parse_line(main_market, specific_market) if specific_market else None
+        group = self._find_outcome_group(outcome_groups, main_market, period, line)
+
+        if group is None:
+            return None
+
+        odds_data = []
+        for provider_id, provider_odds in (group.get("odds") or {}).items():
+            bookmaker_name = names.get(str(provider_id), str(provider_id))
+
+            if not ParserPatterns.matches_target_bookmaker(bookmaker_name, target_bookmaker):
+                continue
+
+            outcome_values = self._ordered_outcome_values(provider_odds)
+            if len(outcome_values) < len(odds_labels):
+                self.logger.warning(f"Incomplete feed odds for bookmaker: {bookmaker_name}. Skipping...")
+                continue
+
+            extracted_odds = {label: self._format_odds(outcome_values[i]) for i, label in enumerate(odds_labels)}
+            extracted_odds["bookmaker_name"] = bookmaker_name
+            extracted_odds["period"] = period
+            odds_data.append(extracted_odds)
+
+        self.logger.info(f"Decoded feed odds for {len(odds_data)} bookmakers ({specific_market or main_market}).")
+        return odds_data
+
+    def _find_outcome_group(
+        self, outcome_groups: dict[str, Any], main_market: str, period: str, line: float | None
+    ) -> dict[str, Any] | None:
+        betting_type_id = self.BETTING_TYPE_IDS[main_market]
+        scope_id = self.PERIOD_SCOPE_IDS[period]
+
+        for group_key, group in outcome_groups.items():
+            if not isinstance(group, dict):
+                continue
+
+            parts = group_key.split("-")
+            group_betting_type = group.get("bettingTypeId", parts[1] if len(parts) > 1 else None)
+            group_scope = group.get("scopeId", parts[2] if len(parts) > 2 else None)
+
+            try:
+                if int(group_betting_type) != betting_type_id or int(group_scope) != scope_id:
+                    continue
+            except (TypeError, ValueError):
+                continue
+
+            if line is None:
+                return group
+
+            group_line = group.get("handicapValue", parts[4] if len(parts) > 4 else None)
+            try:
+                if group_line is not None and float(group_line) == line:
+                    return group
+            except (TypeError, ValueError):
+                continue
+
+        return None
+
+    def _parse_line(self, main_market: str, specific_market: str) -> float | None:
+        match = self._LINE_PATTERN.match(specific_market.strip())
+        if not match or match.group("main") != main_market:
+            return None
+        return float(match.group("line"))
+
+    @staticmethod
+    def _extract_bookmaker_names(data: dict[str, Any]) -> dict[str, str]:
+        names = data.get("providersNames") or data.get("bookmakerNames") or {}
+        return {str(provider_id): str(name) for provider_id, name in names.items()} if isinstance(names, dict) else {}
+
+    @staticmethod
+    def _ordered_outcome_values(provider_odds: Any) -> list[Any]:
+        if isinstance(provider_odds, list):
+            return provider_odds
+        if isinstance(provider_odds, dict):
+            outcome_keys = sorted(provider_odds, key=lambda k: (0, int(k), "") if str(k).isdigit() else (1, 0, str(k)))
+            return [provider_odds[key] for key in outcome_keys]
+        return []
+
+    @staticmethod
+    def _format_odds(value: Any) -> str:
+        try:
+            return f"{float(value):.2f}"
+        except (TypeError, ValueError):
+            return str(value)
@@ -2,67 +2,122 @@ import logging
 
 from playwright.async_api import Page
 
+from src.core.odds_portal_selectors import OddsPortalSelectors
+from src.core.page_readiness import PageReadiness
 
-class OddsHistoryExtractor:
-    """Handles extraction of odds history data by hovering over bookmaker odds."""
 
-    def __init__(self):
+class OddsHistoryExtractor:
+    """
+    Handles extraction of odds history data by hovering over bookmaker odds.
+
+    The odds movement of a cell is only rendered in a modal shown while the cell is hovered, so every cell still
+    has to be hovered. The bookmaker rows are walked once, in the page, for all bookmakers at once, tagging every
+    odds cell with a token; then each cell is hovered in turn and the modal anchored to its token is returned by the
+    wait for the modal itself, with no fixed delays.
+    """
+
+    HOVER_TIMEOUT = 2000
+    CELL_ATTRIBUTE = "data-history-cell"
+
+    # Tags the odds cells of every row whose bookmaker matches one of `names` (all rows if null) with their index,
+    # and returns the bookmaker name of each tagged cell in that order. A row goes to the name equal to its logo
+    # title, else to the first name the title contains.
+    _TAG_CELLS_SCRIPT = """
+        ([rowSelector, logoSelector, cellSelector, attribute, names]) => {
+            const cellNames = [];
+            document.querySelectorAll(`[${attribute}]`).forEach((cell) => cell.removeAttribute(attribute));
+            document.querySelectorAll(rowSelector).forEach((row) => {
+                const title = row.querySelector(logoSelector)?.getAttribute("title");
+                if (!title) {
+                    return;
+                }
+                const lowerTitle = title.toLowerCase();
+                const name = names === null
+                    ? title
+                    : names.find((candidate) => lowerTitle === candidate.toLowerCase())
+                        ?? names.find((candidate) => lowerTitle.includes(candidate.toLowerCase()));
+                if (name === undefined) {
+                    return;
+                }
+                row.querySelectorAll(cellSelector).forEach((cell) => {
+                    cell.setAttribute(attribute, String(cellNames.length));
+                    cellNames.push(name);
+                });
+            });
+            return cellNames;
+        }
+    """
+
+    def __init__(self, page_readiness: PageReadiness | None = None):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.page_readiness = page_readiness or PageReadiness()
 
-    async def extract_odds_history_for_bookmaker(self, page: Page, bookmaker_name: str) -> list[str]:
+    async def extract_odds_history(self, page: Page, bookmaker_names: list[str] | None = None) -> dict[str, list[str]]:
         """
-        Hover on odds for a specific bookmaker to trigger and capture the odds history modal.
+        Hover on the odds of several bookmakers to capture their odds history modals, walking the rows once.
 
         Args:
             page (Page): Playwright page instance.
-            bookmaker_name (str): Name of the bookmaker to match.
+            bookmaker_names (Optional[List[str]]): Bookmakers to capture, matched case-insensitively against the
+                bookmaker logo title of each row; all bookmakers if None.
 
         Returns:
-            List[str]: List of raw HTML content from modals triggered by hovering over matched odds blocks.
+            Dict[str, List[str]]: For each bookmaker name (as given, or the row's title when capturing all) with at
+            least one captured modal, the raw HTML of its modals in the order of its odds cells.
         """
-        self.logger.info(f"Extracting odds history for bookmaker: {bookmaker_name}")
-        await page.wait_for_timeout(2000)
+        if bookmaker_names is not None and not bookmaker_names:
+            return {}
 
-        modals_data = []
+        await self.page_readiness.wait_for_bookmaker_rows(page)
+        modals_data: dict[str, list[str]] = {}
 
         try:
-            # Find all bookmaker rows
-            rows = await page.query_selector_all("div.border-black-borders.flex.h-9")
-
-            for row in rows:
-                try:
-                    logo_img = await row.query_selector("img.bookmaker-logo")
-
-                    if logo_img:
-                        title = await logo_img.get_attribute("title")
-
-                        if title and bookmaker_name.lower() in title.lower():
-                            self.logger.info(f"Found matching bookmaker row: {title}")
-                            odds_blocks = await row.query_selector_all("div.flex-center.flex-col.font-bold")
-
-                            for odds in odds_blocks:
-                                await odds.hover()
-                                await page.wait_for_timeout(2000)
-
-                                odds_movement_element = await page.wait_for_selector(
-                                    "h3:text('Odds movement')", timeout=3000
-                                )
-                                modal_wrapper = await odds_movement_element.evaluate_handle(
-                                    "node => node.parentElement"
-                                )
-                                modal_element = modal_wrapper.as_element()
-
-                                if modal_element:
-                                    html = await modal_element.inner_html()
-                                    modals_data.append(html)
-                                else:
-                                    self.logger.warning(
-                                        "Unable to retrieve odds' evolution modal: modal_element is None"
-                                    )
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to process a bookmaker row: {e}")
+            cell_names = await page.evaluate(
+                self._TAG_CELLS_SCRIPT,
+                [
+                    OddsPortalSelectors.BOOKMAKER_ROW,
+                    OddsPortalSelectors.BOOKMAKER_LOGO,
+                    OddsPortalSelectors.ODDS_BLOCK,
+                    self.CELL_ATTRIBUTE,
+                    bookmaker_names,
+                ],
+            )
+            await self.page_readiness.watch_odds_history_modals(page, self.CELL_ATTRIBUTE)
         except Exception as e:
-            self.logger.warning(f"Failed to extract odds history for bookmaker {bookmaker_name}: {e}")
+            self.logger.warning(f"Failed to locate the odds cells for odds history: {e}")
+            return modals_data
+
+        self.logger.info(
+            f"Extracting odds history from {len(cell_names)} odds cells of {len(set(cell_names))} bookmakers"
+        )
+
+        for index, bookmaker_name in enumerate(cell_names):
+            token = str(index)
+            try:
+                await page.hover(f"[{self.CELL_ATTRIBUTE}='{token}']", timeout=self.HOVER_TIMEOUT)
+            except Exception as e:
+                self.logger.warning(f"Failed to hover odds cell {index} of {bookmaker_name}: {e}")
+                continue
+
+            modal_html = await self.page_readiness.capture_odds_history_modal(page, self.CELL_ATTRIBUTE, token)
+            if modal_html is None:
+                self.logger.warning(f"Odds movement modal did not appear after hovering odds of {bookmaker_name}.")
+                continue
+
+            modals_data.setdefault(bookmaker_name, []).append(modal_html)
 
         return modals_data
+
+    async def extract_odds_history_for_bookmaker(self, page: Page, bookmaker_name: str) -> list[str]:
+        """
+        Hover on odds for a specific bookmaker to trigger and capture the odds history modal.
+
+        Args:
+            page (Page): Playwright page instance.
+            bookmaker_name (str): Name of the bookmaker to match.
+
+        Returns:
+            List[str]: List of raw HTML content from modals triggered by hovering over matched odds blocks.
+        """
+        self.logger.info(f"Extracting odds history for bookmaker: {bookmaker_name}")
+        return (await self.extract_odds_history(page, [bookmaker_name])).get(bookmaker_name, [])
@@ -1,16 +1,25 @@
 from datetime import UTC, datetime
 import logging
-import re
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+
+from src.utils.html_parser_enum import HtmlParser
+from src.utils.utils import parse_html
+
+from .parser_patterns import ParserPatterns
 
 
 class OddsParser:
     """Handles parsing of odds data from HTML content."""
 
-    def __init__(self):
+    def __init__(self, html_parser: HtmlParser | None = None):
+        """
+        Args:
+            html_parser (Optional[HtmlParser]): Parser backend. Defaults to the fastest one installed.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.html_parser = html_parser or HtmlParser.default()
 
     def parse_market_odds(
         self, html_content: str, period: str, odds_labels: list, target_bookmaker: str | None = None
@@ -19,23 +28,39 @@ class OddsParser:
         Parses odds for a given market type in a generic way.
 
         Args:
-            html_content (str): The HTML content of the page.
+            html_content (str): The HTML of the bookmaker rows (or of the whole page).
             period (str): The match period (e.g., "FullTime").
             odds_labels (list): A list of labels defining the expected odds columns (e.g., ["odds_over", "odds_under"]).
-            target_bookmaker (str, optional): If set, only parse odds for this bookmaker.
+            target_bookmaker (str, optional): If set, only parse odds for this bookmaker (case-insensitive).
 
         Returns:
             list[dict]: A list of dictionaries containing bookmaker odds.
         """
         self.logger.info("Parsing odds from HTML content.")
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = parse_html(html_content, self.html_parser)
+        return self.parse_bookmaker_rows(soup, period, odds_labels, target_bookmaker)
+
+    def parse_bookmaker_rows(
+        self, soup: BeautifulSoup | Tag, period: str, odds_labels: list, target_bookmaker: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Extracts bookmaker odds from an already parsed document.
 
+        Args:
+            soup (BeautifulSoup | Tag): The parsed bookmaker rows (or whole page).
+            period (str): The match period (e.g., "FullTime").
+            odds_labels (list): A list of labels defining the expected odds columns.
+            target_bookmaker (str, optional): If set, only parse odds for this bookmaker (case-insensitive).
+
+        Returns:
+            list[dict]: A list of dictionaries containing bookmaker odds.
+        """
         # Try broader "border-black-borders" pattern first as it works better
-        bookmaker_blocks = soup.find_all("div", class_=re.compile(r"border-black-borders"))
+        bookmaker_blocks = soup.find_all(ParserPatterns.BOOKMAKER_ROW_MATCHER)
 
         if not bookmaker_blocks:
             # Fallback to broader selector
-            bookmaker_blocks = soup.find_all("div", class_=re.compile(r"^border-black-borders flex h-9"))
+            bookmaker_blocks = soup.find_all(ParserPatterns.BOOKMAKER_ROW_STRICT_MATCHER)
 
         if not bookmaker_blocks:
             self.logger.warning("No bookmaker blocks found.")
@@ -47,19 +72,19 @@ class OddsParser:
                 img_tag = block.find("img", class_="bookmaker-logo")
                 bookmaker_name = img_tag["title"] if img_tag and "title" in img_tag.attrs else "Unknown"
 
-                if not bookmaker_name or (target_bookmaker and bookmaker_name.lower() != target_bookmaker.lower()):
+                if not bookmaker_name or not ParserPatterns.matches_target_bookmaker(bookmaker_name, target_bookmaker):
                     continue
 
-                odds_blocks = block.find_all("div", class_=re.compile(r"flex-center.*flex-col.*font-bold"))
+                odds_blocks = block.find_all(ParserPatterns.ODDS_BLOCK_MATCHER)
 
                 if len(odds_blocks) < len(odds_labels):
                     self.logger.warning(f"Incomplete odds data for bookmaker: {bookmaker_name}. Skipping...")
                     continue
 
-                extracted_odds = {label: odds_blocks[i].get_text(strip=True) for i, label in enumerate(odds_labels)}
-
-                for key, value in extracted_odds.items():
-                    extracted_odds[key] = re.sub(r"(\d+\.\d+)\1", r"\1", value)
+                extracted_odds = {
+                    label: ParserPatterns.dedupe_odds(odds_blocks[i].get_text(strip=True))
+                    for i, label in enumerate(odds_labels)
+                }
 
                 extracted_odds["bookmaker_name"] = bookmaker_name
                 extracted_odds["period"] = period
@@ -83,7 +108,7 @@ class OddsParser:
             dict: Parsed odds history data, including historical odds and the opening odds.
         """
         self.logger.info("Parsing modal content for odds history.")
-        soup = BeautifulSoup(modal_html, "html.parser")
+        soup = parse_html(modal_html, self.html_parser)
 
         try:
             odds_history = []
@@ -0,0 +1,63 @@
+import logging
+
+from playwright.async_api import Page
+
+from src.core.odds_portal_selectors import OddsPortalSelectors
+
+
+class PageContentFetcher:
+    """
+    Pulls only the parts of a match page the parsers need, with a single `evaluate` call each.
+
+    Serializing the whole document with `page.content()` and parsing it in Python costs far more than the
+    bookmaker rows it contains; these helpers return just the relevant subtree instead.
+    """
+
+    # Outermost elements whose class contains `border-black-borders`, i.e. the bookmaker / submarket rows.
+    # Nested matches are skipped since they are already part of their ancestor's outerHTML.
+    _ODDS_ROWS_SCRIPT = """
+        (selector) => Array.from(document.querySelectorAll(selector))
+            .filter((element) => !element.parentElement || !element.parentElement.closest(selector))
+            .map((element) => element.outerHTML)
+            .join('')
+    """
+
+    _ATTRIBUTE_SCRIPT = """
+        ([selector, attribute]) => {
+            const element = document.querySelector(selector);
+            return element ? element.getAttribute(attribute) : null;
+        }
+    """
+
+    ODDS_ROWS_SELECTOR = "div[class*='border-black-borders']"
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def fetch_odds_rows_html(self, page: Page) -> str:
+        """
+        Return the outer HTML of the bookmaker / submarket rows currently rendered on the page.
+
+        Falls back to the full page content if the page cannot be evaluated, so callers always get
+        something the odds parser understands.
+
+        Args:
+            page (Page): The Playwright page instance.
+
+        Returns:
+            str: The concatenated row HTML (empty if no rows are rendered).
+        """
+        try:
+            return await page.evaluate(self._ODDS_ROWS_SCRIPT, self.ODDS_ROWS_SELECTOR)
+        except Exception as e:
+            self.logger.warning(f"Could not extract odds rows from the page, using full content: {e}")
+            return await page.content()
+
+    async def fetch_event_header_data(self, page: Page) -> str | None:
+        """
+        Return the raw `data` attribute of the react event header, or None if it is not rendered.
+
+        Args:
+            page (Page): The Playwright page instance.
+        """
+        return await page.evaluate(self._ATTRIBUTE_SCRIPT, [OddsPortalSelectors.EVENT_HEADER, "data"])
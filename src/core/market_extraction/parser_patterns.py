@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from functools import cache
+import re
+
+from bs4 import Tag
+
+TagMatcher = Callable[[Tag], bool]
+
+
+def _class_matcher(tag_name: str, pattern: re.Pattern) -> TagMatcher:
+    """
+    Build a `find_all` filter matching `tag_name` elements whose class string matches `pattern`.
+
+    Equivalent to `find_all(tag_name, class_=pattern)`, but the class list is joined and searched once per tag
+    instead of BeautifulSoup trying the regex against every single class value and then the joined string.
+    """
+
+    def matches(tag: Tag) -> bool:
+        return tag.name == tag_name and pattern.search(" ".join(tag.get("class") or ())) is not None
+
+    return matches
+
+
+class ParserPatterns:
+    """
+    Compiled regexes and element matchers shared by the odds parsers.
+
+    Everything here is built once at import time; the market-dependent matchers are built once per market
+    and memoized, so parsing a page never compiles a pattern.
+    """
+
+    BOOKMAKER_BLOCK = re.compile(r"border-black-borders")
+    BOOKMAKER_BLOCK_STRICT = re.compile(r"^border-black-borders flex h-9")
+    ODDS_BLOCK = re.compile(r"flex-center.*flex-col.*font-bold")
+    DUPLICATED_ODDS = re.compile(r"(\d+\.\d+)\1")
+    SUBMARKET_NAME_ROW = re.compile(r"flex.*items-center.*justify-start")
+    FONT_BOLD = re.compile(r"font-bold")
+
+    BOOKMAKER_ROW_MATCHER = staticmethod(_class_matcher("div", BOOKMAKER_BLOCK))
+    BOOKMAKER_ROW_STRICT_MATCHER = staticmethod(_class_matcher("div", BOOKMAKER_BLOCK_STRICT))
+    ODDS_BLOCK_MATCHER = staticmethod(_class_matcher("div", ODDS_BLOCK))
+    SUBMARKET_NAME_ROW_MATCHER = staticmethod(_class_matcher("div", SUBMARKET_NAME_ROW))
+    BOLD_TEXT_MATCHER = staticmethod(_class_matcher("p", FONT_BOLD))
+
+    @staticmethod
+    @cache
+    def submarket_name_box_matcher(main_market: str) -> TagMatcher:
+        """
+        Matcher for the collapsed option box holding the submarket name of a main market.
+
+        Args:
+            main_market (str): The main market name (e.g., "Over/Under").
+
+        Returns:
+            TagMatcher: Matches `div` elements whose `data-testid` contains e.g. `over-under-collapsed-option-box`.
+        """
+        market_key = main_market.lower().replace("/", "-").replace(" ", "-")
+        testid_pattern = re.compile(f"{re.escape(market_key)}-collapsed-option-box")
+
+        def matches(tag: Tag) -> bool:
+            return tag.name == "div" and testid_pattern.search(tag.get("data-testid") or "") is not None
+
+        return matches
+
+    @staticmethod
+    def matches_target_bookmaker(bookmaker_name: str, target_bookmaker: str | None) -> bool:
+        """
+        Whether a bookmaker passes the `--target_bookmaker` filter: no target, or the same name ignoring case.
+
+        The one rule for every path odds come through (DOM rows, odds feed, odds history), so a bookmaker kept for
+        its odds also gets its history.
+        """
+        return not target_bookmaker or bookmaker_name.strip().lower() == target_bookmaker.strip().lower()
+
+    @classmethod
+    def dedupe_odds(cls, value: str) -> str:
+        """
+        Collapse odds rendered twice in the same cell (e.g. "1.901.90" -> "1.90").
+
+        The regex only runs when the text holds more than one decimal point, which is the rare case.
+        """
+        return cls.DUPLICATED_ODDS.sub(r"\1", value) if value.count(".") > 1 else value
@@ -1,16 +1,29 @@
 import logging
-import re
 from typing import Any
 
-from bs4 import BeautifulSoup
 from playwright.async_api import Page
 
+from src.core.page_readiness import PageReadiness
+from src.utils.html_parser_enum import HtmlParser
+from src.utils.utils import parse_html
+
+from .page_content_fetcher import PageContentFetcher
+from .parser_patterns import ParserPatterns
+
 
 class SubmarketExtractor:
     """Handles extraction of visible submarkets in passive mode."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        page_readiness: PageReadiness | None = None,
+        page_content_fetcher: PageContentFetcher | None = None,
+        html_parser: HtmlParser | None = None,
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.page_readiness = page_readiness or PageReadiness()
+        self.page_content_fetcher = page_content_fetcher or PageContentFetcher()
+        self.html_parser = html_parser or HtmlParser.default()
 
     async def is_preview_compatible_market(self, page: Page, main_market: str) -> bool:
         """
@@ -27,9 +40,9 @@ class SubmarketExtractor:
             bool: True if the market supports preview mode, False otherwise.
         """
         try:
-            # Get current page HTML
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Get the submarket rows HTML
+            html_content = await self.page_content_fetcher.fetch_odds_rows_html(page)
+            soup = parse_html(html_content, self.html_parser)
 
             # Look for submarket containers
             submarket_containers = soup.find_all("div", class_="border-black-borders")
@@ -87,12 +100,13 @@ class SubmarketExtractor:
         self.logger.info(f"Extracting visible submarkets for {main_market} in passive mode")
 
         try:
-            await page.wait_for_timeout(2000)  # SCROLL_PAUSE_TIME
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
+            await self.page_readiness.wait_for_bookmaker_rows(page)
+            await self.page_readiness.wait_for_dom_settled(page)
+            html_content = await self.page_content_fetcher.fetch_odds_rows_html(page)
+            soup = parse_html(html_content, self.html_parser)
 
             # Find all submarket rows (these contain the handicap names and odds)
-            submarket_rows = soup.find_all("div", class_=re.compile(r"border-black-borders"))
+            submarket_rows = soup.find_all(ParserPatterns.BOOKMAKER_ROW_MATCHER)
 
             if not submarket_rows:
                 self.logger.warning("No submarket rows found in passive mode")
@@ -174,9 +188,7 @@ class SubmarketExtractor:
     def _extract_submarket_name(self, row, main_market: str) -> str | None:
         """Extract submarket name from a row using multiple strategies."""
         # First, try to find the div with data-testid pattern (for Over/Under markets)
-        market_key = main_market.lower().replace("/", "-").replace(" ", "-")
-        data_testid_pattern = f"{market_key}-collapsed-option-box"
-        submarket_name_element = row.find("div", attrs={"data-testid": re.compile(data_testid_pattern)})
+        submarket_name_element = row.find(ParserPatterns.submarket_name_box_matcher(main_market))
 
         if submarket_name_element:
             # For markets like Over/Under, look for the clean name in max-sm:!hidden class
@@ -190,7 +202,7 @@ class SubmarketExtractor:
                     return first_p.get_text(strip=True)
 
         # If not found, try to find any div with the flex classes (for other markets)
-        flex_div = row.find("div", class_=re.compile(r"flex.*items-center.*justify-start"))
+        flex_div = row.find(ParserPatterns.SUBMARKET_NAME_ROW_MATCHER)
         if flex_div:
             # Look for the clean name in max-sm:!hidden class first
             clean_name_p = flex_div.find("p", class_="max-sm:!hidden")
@@ -203,7 +215,7 @@ class SubmarketExtractor:
                     return first_p.get_text(strip=True)
 
         # If still not found, try to find any <p> with font-bold class
-        bold_p = row.find("p", class_=re.compile(r"font-bold"))
+        bold_p = row.find(ParserPatterns.BOLD_TEXT_MATCHER)
         if bold_p:
             return bold_p.get_text(strip=True)
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 
@@ -5,12 +6,22 @@ from playwright.async_api import Page
 
 from src.core.browser_helper import BrowserHelper
 from src.core.market_extraction import (
+    MarketExecutionPlanner,
     MarketGrouping,
     NavigationManager,
+    OddsFeedDecoder,
     OddsHistoryExtractor,
     OddsParser,
+    PageContentFetcher,
+    ParserPatterns,
     SubmarketExtractor,
 )
+from src.core.page_readiness import PageReadiness
+from src.core.page_tracer import PageTracer
+from src.core.request_rate_limiter import RequestRateLimiter
+from src.core.retry_policy import RetryPolicy
+from src.core.scrape_errors import EmptyMarketError, as_scrape_error
+from src.core.scrape_metrics import ScrapeMetrics
 from src.core.sport_market_registry import SportMarketRegistry
 
 
@@ -26,30 +37,40 @@ class OddsPortalMarketExtractor:
     SCROLL_PAUSE_TIME = 2000
     MARKET_SWITCH_WAIT_TIME = 3000
 
-    def __init__(self, browser_helper: BrowserHelper):
+    def __init__(
+        self,
+        browser_helper: BrowserHelper,
+        page_readiness: PageReadiness | None = None,
+        rate_limiter: RequestRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        metrics: ScrapeMetrics | None = None,
+    ):
         """
         Initialize OddsPortalMarketExtractor.
 
         Args:
             browser_helper (BrowserHelper): Helper class for browser interactions.
+            page_readiness (Optional[PageReadiness]): Waits on DOM conditions instead of fixed sleeps.
+            rate_limiter (Optional[RequestRateLimiter]): Rate limit the page reloads go through.
+            retry_policy (Optional[RetryPolicy]): Retry budgets and backoff of a single market.
+            metrics (Optional[ScrapeMetrics]): Stage timings and retry counters; share one across the run.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.browser_helper = browser_helper
+        self.page_readiness = page_readiness or PageReadiness()
+        self.rate_limiter = rate_limiter or RequestRateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metrics = metrics or ScrapeMetrics()
 
         # Initialize component classes
-        self.navigation_manager = NavigationManager(browser_helper)
+        self.navigation_manager = NavigationManager(browser_helper, self.page_readiness)
+        self.page_content_fetcher = PageContentFetcher()
         self.odds_parser = OddsParser()
-        self.submarket_extractor = SubmarketExtractor()
-        self.odds_history_extractor = OddsHistoryExtractor()
+        self.submarket_extractor = SubmarketExtractor(self.page_readiness, self.page_content_fetcher)
+        self.odds_history_extractor = OddsHistoryExtractor(self.page_readiness)
         self.market_grouping = MarketGrouping()
-        
-        # Statistics for retry tracking
-        self.retry_stats = {
-            "total_attempts": 0,
-            "retry_attempts": 0,
-            "successful_retries": 0,
-            "failed_after_retries": 0
-        }
+        self.market_planner = MarketExecutionPlanner(self.market_grouping)
+        self.odds_feed_decoder = OddsFeedDecoder()
 
     async def scrape_markets(
         self,
@@ -79,27 +100,41 @@ class OddsPortalMarketExtractor:
         market_data = {}
         market_methods = SportMarketRegistry.get_market_mapping(sport)
 
-        # Group markets by their main market type for optimization in preview mode
+        if not preview_submarkets_only:
+            # Normal mode: visit each main market tab once and expand its submarkets in sequence
+            plan = self.market_planner.build_plan(markets, market_methods)
+            self.logger.info(plan.describe())
+
+            for market in plan.unsupported_markets:
+                self.logger.warning(f"Market '{market}' is not supported for sport '{sport}'.")
+
+            for main_market_name, steps in plan.tab_groups.items():
+                market_data.update(
+                    await self.extract_tab_markets(
+                        page=page,
+                        main_market=main_market_name,
+                        steps=steps,
+                        period=period,
+                        scrape_odds_history=scrape_odds_history,
+                        target_bookmaker=target_bookmaker,
+                    )
+                )
+
+            return market_data
+
+        # Preview mode: group markets by their main market type and scrape each main market once
         market_groups = {}
 
         for market in markets:
             try:
                 if market in market_methods:
                     # For preview mode, group markets by their main market type
-                    if preview_submarkets_only:
-                        # Get the main market info from the existing market method
-                        main_market_info = self.market_grouping.get_main_market_info(market_methods[market])
-                        if main_market_info:
-                            main_market_name = main_market_info["main_market"]
-                            if main_market_name not in market_groups:
-                                market_groups[main_market_name] = []
-                            market_groups[main_market_name].append(market)
-                    else:
-                        # Normal mode: scrape each market individually
-                        self.logger.info(f"Scraping market: {market} (Period: {period})")
-                        market_data[f"{market}_market"] = await market_methods[market](
-                            self, page, period, scrape_odds_history, target_bookmaker, preview_submarkets_only
-                        )
+                    main_market_info = self.market_grouping.get_main_market_info(market_methods[market])
+                    if main_market_info:
+                        main_market_name = main_market_info["main_market"]
+                        if main_market_name not in market_groups:
+                            market_groups[main_market_name] = []
+                        market_groups[main_market_name].append(market)
                 else:
                     self.logger.warning(f"Market '{market}' is not supported for sport '{sport}'.")
 
@@ -108,7 +143,7 @@ class OddsPortalMarketExtractor:
                 market_data[f"{market}_market"] = None
 
         # Handle grouped markets in preview mode
-        if preview_submarkets_only and market_groups:
+        if market_groups:
             for main_market_name, grouped_markets in market_groups.items():
                 try:
                     self.logger.info(
@@ -122,16 +157,17 @@ class OddsPortalMarketExtractor:
                         odds_labels = main_market_info["odds_labels"] if main_market_info else None
 
                         # Scrape the main market once
-                        main_market_data = await self.extract_market_odds(
-                            page=page,
-                            main_market=main_market_name,
-                            specific_market=None,  # No specific market, scrape all submarkets
-                            period=period,
-                            odds_labels=odds_labels,
-                            scrape_odds_history=scrape_odds_history,
-                            target_bookmaker=target_bookmaker,
-                            preview_submarkets_only=preview_submarkets_only,
-                        )
+                        with PageTracer.annotate(market=main_market_name):
+                            main_market_data = await self.extract_market_odds(
+                                page=page,
+                                main_market=main_market_name,
+                                specific_market=None,  # No specific market, scrape all submarkets
+                                period=period,
+                                odds_labels=odds_labels,
+                                scrape_odds_history=scrape_odds_history,
+                                target_bookmaker=target_bookmaker,
+                                preview_submarkets_only=preview_submarkets_only,
+                            )
 
                         # Distribute the results to each specific market
                         for specific_market in grouped_markets:
@@ -144,6 +180,122 @@ class OddsPortalMarketExtractor:
 
         return market_data
 
+    def extract_markets_from_feed(
+        self,
+        payloads: list[dict[str, Any]],
+        sport: str,
+        markets: list[str],
+        period: str = "FullTime",
+        target_bookmaker: str | None = None,
+        bookmaker_names: dict[str, str] | None = None,
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Extract market data from captured odds feed payloads instead of the rendered page.
+
+        Args:
+            payloads (List[Dict[str, Any]]): Odds feed payloads captured while the match page loaded.
+            sport (str): The sport to scrape odds for.
+            markets (List[str]): A list of markets to extract (e.g., ['1x2', 'over_under_2_5']).
+            period (str): The match period (e.g., "FullTime").
+            target_bookmaker (str): If set, only extract odds for this bookmaker.
+            bookmaker_names (Optional[Dict[str, str]]): Provider id to bookmaker name mapping.
+
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: The market data decoded from the feed, and the markets that the
+            feed did not carry and still have to be scraped from the page.
+        """
+        market_data = {}
+        remaining_markets = []
+        market_methods = SportMarketRegistry.get_market_mapping(sport)
+
+        for market in markets:
+            market_info = (
+                self.market_grouping.get_main_market_info(market_methods[market]) if market in market_methods else None
+            )
+            odds_data = None
+
+            if market_info:
+                for payload in payloads:
+                    odds_data = self.odds_feed_decoder.decode_market(
+                        payload=payload,
+                        main_market=market_info["main_market"],
+                        specific_market=market_info["specific_market"],
+                        period=period,
+                        odds_labels=market_info["odds_labels"],
+                        target_bookmaker=target_bookmaker,
+                        bookmaker_names=bookmaker_names,
+                    )
+                    if odds_data:
+                        break
+
+            if odds_data:
+                market_data[f"{market}_market"] = odds_data
+            else:
+                remaining_markets.append(market)
+
+        self.logger.info(
+            f"Odds feed covered {len(market_data)}/{len(markets)} markets; "
+            f"falling back to page extraction for: {remaining_markets or 'none'}"
+        )
+        return market_data, remaining_markets
+
+    async def extract_tab_markets(
+        self,
+        page: Page,
+        main_market: str,
+        steps: list[dict[str, Any]],
+        period: str = "FullTime",
+        scrape_odds_history: bool = False,
+        target_bookmaker: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Extracts every requested market of one main market tab with a single tab navigation.
+
+        Args:
+            page (Page): The Playwright page instance.
+            main_market (str): The main market tab name (e.g., "Over/Under").
+            steps (list[dict]): Planned steps for this tab, each with `market`, `specific_market` and `odds_labels`.
+            period (str): The match period (e.g., "FullTime").
+            scrape_odds_history (bool): Whether to scrape and attach odds history.
+            target_bookmaker (str): If set, only scrape odds for this bookmaker.
+
+        Returns:
+            Dict[str, Any]: Market data keyed by `{market}_market`.
+        """
+        market_data = {}
+        self.logger.info(f"Scraping {len(steps)} market(s) on tab {main_market} (Period: {period})")
+
+        with self.metrics.stage("tab_navigation"), PageTracer.annotate(market=main_market):
+            tab_ready = await self.navigation_manager.navigate_to_market_tab(page=page, market_tab_name=main_market)
+            if tab_ready:
+                await self.navigation_manager.wait_for_market_switch(page, main_market)
+        if not tab_ready:
+            self.logger.warning(f"Could not open {main_market} tab up front, each market will retry navigation.")
+
+        for step in steps:
+            market = step["market"]
+            try:
+                self.logger.info(f"Scraping market: {market} (Period: {period})")
+                with PageTracer.annotate(market=market):
+                    market_data[f"{market}_market"] = await self.extract_market_odds(
+                        page=page,
+                        main_market=main_market,
+                        specific_market=step["specific_market"],
+                        period=period,
+                        odds_labels=step["odds_labels"],
+                        scrape_odds_history=scrape_odds_history,
+                        target_bookmaker=target_bookmaker,
+                        skip_tab_navigation=tab_ready,
+                    )
+            except Exception as e:
+                self.logger.error(f"Error scraping market '{market}': {e}")
+                market_data[f"{market}_market"] = None
+
+            # A reload during retries leaves the page on the default tab
+            tab_ready = tab_ready and await self.navigation_manager.is_market_tab_active(page, main_market)
+
+        return market_data
+
     async def extract_market_odds(
         self,
         page: Page,
@@ -154,6 +306,7 @@ class OddsPortalMarketExtractor:
         scrape_odds_history: bool = False,
         target_bookmaker: str | None = None,
         preview_submarkets_only: bool = False,
+        skip_tab_navigation: bool = False,
     ) -> list:
         """
         Extracts odds for a given main market and optional specific sub-market.
@@ -167,6 +320,8 @@ class OddsPortalMarketExtractor:
             scrape_odds_history (bool): Whether to scrape and attach odds history.
             target_bookmaker (str): If set, only scrape odds for this bookmaker.
             preview_submarkets_only (bool): If True, only scrape average odds from visible submarkets.
+            skip_tab_navigation (bool): If True, the main market tab is already open; it is only navigated to
+                again after a page reload.
 
         Returns:
             list[dict]: A list of dictionaries containing bookmaker odds.
@@ -175,97 +330,78 @@ class OddsPortalMarketExtractor:
             f"Scraping odds for market: {main_market}, specific: {specific_market}, period: {period}, "
             f"preview_mode: {preview_submarkets_only}"
         )
-        
-        # Retry logic for empty odds
-        max_empty_odds_retries = 2
-        
-        for retry_attempt in range(max_empty_odds_retries + 1):
+
+        # Market-level retries: re-open the tab first, reload the whole page only if that did not help
+        retry_state = self.retry_policy.start()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            PageTracer.update(market_attempt=attempt)
             try:
-                # Navigate to the main market tab
-                if not await self.navigation_manager.navigate_to_market_tab(page=page, market_tab_name=main_market):
-                    self.logger.error(f"Failed to find or click {main_market} tab")
-                    return []
+                if not (skip_tab_navigation and attempt == 1):
+                    with self.metrics.stage("tab_navigation"):
+                        # Navigate to the main market tab
+                        tab_ready = await self.navigation_manager.navigate_to_market_tab(
+                            page=page, market_tab_name=main_market
+                        )
+                        if tab_ready:
+                            # Wait for market switch to complete
+                            await self.navigation_manager.wait_for_market_switch(page, main_market)
 
-                # Wait for market switch to complete
-                await self.navigation_manager.wait_for_market_switch(page, main_market)
+                    if not tab_ready:
+                        self.logger.error(f"Failed to find or click {main_market} tab")
+                        return []
 
                 # Handle different scraping modes
                 if preview_submarkets_only:
                     # For preview mode, always try passive extraction first
                     self.logger.info(f"Using passive mode for {main_market} in preview mode")
-                    odds_data = await self.submarket_extractor.extract_visible_submarkets_passive(
-                        page=page, main_market=main_market, period=period, odds_labels=odds_labels
-                    )
+                    with self.metrics.stage("submarket_preview"):
+                        odds_data = await self.submarket_extractor.extract_visible_submarkets_passive(
+                            page=page, main_market=main_market, period=period, odds_labels=odds_labels
+                        )
 
                     # If no data was extracted passively, fall back to normal scraping
                     if not odds_data:
-                        self.logger.info(f"No data extracted passively for {main_market}, falling back to normal scraping")
-                        if specific_market and not await self.navigation_manager.select_specific_market(
-                            page=page, specific_market=specific_market
-                        ):
-                            self.logger.error(f"Failed to find or select {specific_market} within {main_market}")
-                            return []
-
-                        await self.navigation_manager.wait_for_page_load(page)
-                        html_content = await page.content()
-
-                        odds_data = self.odds_parser.parse_market_odds(
-                            html_content=html_content,
-                            period=period,
-                            odds_labels=odds_labels,
-                            target_bookmaker=target_bookmaker,
+                        self.logger.info(
+                            f"No data extracted passively for {main_market}, falling back to normal scraping"
+                        )
+                        odds_data = await self._extract_rendered_odds(
+                            page, main_market, specific_market, period, odds_labels, target_bookmaker
                         )
+                        if odds_data is None:
+                            return []
                 else:
                     # Active mode: click on specific submarket if provided
-                    if specific_market and not await self.navigation_manager.select_specific_market(
-                        page=page, specific_market=specific_market
-                    ):
-                        self.logger.error(f"Failed to find or select {specific_market} within {main_market}")
+                    odds_data = await self._extract_rendered_odds(
+                        page, main_market, specific_market, period, odds_labels, target_bookmaker
+                    )
+                    if odds_data is None:
                         return []
 
-                    await self.navigation_manager.wait_for_page_load(page)
-                    html_content = await page.content()
-
-                    odds_data = self.odds_parser.parse_market_odds(
-                        html_content=html_content, period=period, odds_labels=odds_labels, target_bookmaker=target_bookmaker
-                    )
-                
                 # Check for empty odds and retry if necessary
-                if not odds_data or odds_data == []:
-                    self.retry_stats["total_attempts"] += 1
-                    if retry_attempt < max_empty_odds_retries:
-                        self.retry_stats["retry_attempts"] += 1
-                        wait_time = 2000 * (retry_attempt + 1)  # Exponential backoff: 2s, 4s
-                        self.logger.warning(
-                            f"Empty odds detected for {main_market}/{specific_market}, "
-                            f"retrying... (attempt {retry_attempt + 2}/{max_empty_odds_retries + 1})"
-                        )
-                        # Reload the page to refresh data
-                        await page.reload(wait_until="domcontentloaded")
-                        await page.wait_for_timeout(wait_time)
-                        continue
-                    else:
-                        self.retry_stats["failed_after_retries"] += 1
-                        self.logger.error(
-                            f"Empty odds persisted for {main_market}/{specific_market} "
-                            f"after {max_empty_odds_retries + 1} attempts. "
-                            f"Stats - Total empty: {self.retry_stats['total_attempts']}, "
-                            f"Retries: {self.retry_stats['retry_attempts']}, "
-                            f"Success: {self.retry_stats['successful_retries']}, "
-                            f"Failed: {self.retry_stats['failed_after_retries']}"
-                        )
-                        return []
+                if not odds_data:
+                    self.metrics.increment("market_empty_results")
+                    raise EmptyMarketError(f"Empty odds detected for {main_market}/{specific_market}")
 
                 if scrape_odds_history:
                     self.logger.info("Fetching odds history for all parsed bookmakers.")
+                    bookmaker_names = [
+                        entry["bookmaker_name"]
+                        for entry in odds_data
+                        if entry.get("bookmaker_name")
+                        and ParserPatterns.matches_target_bookmaker(entry["bookmaker_name"], target_bookmaker)
+                    ]
+
+                    # One pass over the rows for every bookmaker instead of one per bookmaker
+                    with self.metrics.stage("history_hover"):
+                        history_modals = await self.odds_history_extractor.extract_odds_history(
+                            page, list(dict.fromkeys(bookmaker_names))
+                        )
 
                     for odds_entry in odds_data:
-                        bookmaker_name = odds_entry.get("bookmaker_name")
-
-                        if not bookmaker_name or (target_bookmaker and bookmaker_name.lower() != target_bookmaker.lower()):
-                            continue
-
-                        modals = await self.odds_history_extractor.extract_odds_history_for_bookmaker(page, bookmaker_name)
+                        modals = history_modals.get(odds_entry.get("bookmaker_name"))
 
                         if modals:
                             all_histories = []
@@ -279,32 +415,107 @@ class OddsPortalMarketExtractor:
                 # Close the sub-market after scraping to avoid duplicates
                 if specific_market:
                     await self.navigation_manager.close_specific_market(page, specific_market)
-                
+
                 # Successfully got non-empty odds
-                if retry_attempt > 0:
-                    self.retry_stats["successful_retries"] += 1
+                if attempt > 1:
+                    self.metrics.increment("market_retry_successes")
                     self.logger.info(
-                        f"Successfully retrieved odds for {main_market}/{specific_market} after {retry_attempt + 1} attempts. "
-                        f"Stats - Total empty: {self.retry_stats['total_attempts']}, "
-                        f"Retries: {self.retry_stats['retry_attempts']}, "
-                        f"Success: {self.retry_stats['successful_retries']}, "
-                        f"Failed: {self.retry_stats['failed_after_retries']}"
+                        f"Successfully retrieved odds for {main_market}/{specific_market} after {attempt} attempts. "
+                        f"{self._describe_retry_counters()}"
                     )
-                
+
                 return odds_data
 
             except Exception as e:
-                if retry_attempt < max_empty_odds_retries:
-                    wait_time = 2000 * (retry_attempt + 1)
-                    self.logger.warning(
-                        f"Error extracting odds for {main_market}/{specific_market}: {e}. "
-                        f"Retrying... (attempt {retry_attempt + 2}/{max_empty_odds_retries + 1})"
+                error = as_scrape_error(e)
+                delay = retry_state.next_delay(error)
+
+                if delay is None:
+                    if isinstance(error, EmptyMarketError):
+                        self.metrics.increment("market_retries_exhausted")
+                    self.logger.error(
+                        f"Error extracting odds for {main_market}/{specific_market} after {attempt} attempts "
+                        f"({error.label}): {error}. {self._describe_retry_counters()}"
                     )
-                    await page.wait_for_timeout(wait_time)
-                    continue
-                else:
-                    self.logger.error(f"Error extracting odds for {main_market}/{specific_market} after all retries: {e}")
                     return []
-        
-        # Should not reach here, but return empty list as fallback
-        return []
+
+                self.metrics.increment("market_retries")
+                self.logger.warning(
+                    f"{error.label} error extracting odds for {main_market}/{specific_market}: {error}. "
+                    f"Retrying in {delay:.1f}s ({retry_state.describe(error)})"
+                )
+                await asyncio.sleep(delay)
+                full_reload = retry_state.attempts(type(error)) > 1
+                await self._prepare_market_retry(page, specific_market, full_reload=full_reload)
+
+    async def _extract_rendered_odds(
+        self,
+        page: Page,
+        main_market: str,
+        specific_market: str | None,
+        period: str,
+        odds_labels: list | None,
+        target_bookmaker: str | None,
+    ) -> list | None:
+        """
+        Open the sub-market, if any, and parse the bookmaker rows rendered for it, timing each stage.
+
+        Args:
+            page (Page): The match page, on the main market tab.
+            main_market (str): The main market name.
+            specific_market (Optional[str]): The sub-market to open first.
+            period (str): The match period.
+            odds_labels (list): Labels corresponding to odds values in the extracted data.
+            target_bookmaker (Optional[str]): If set, only parse odds for this bookmaker.
+
+        Returns:
+            Optional[list[dict]]: The parsed odds, or None if the sub-market could not be opened.
+        """
+        if specific_market:
+            with self.metrics.stage("submarket_click"):
+                selected = await self.navigation_manager.select_specific_market(
+                    page=page, specific_market=specific_market
+                )
+            if not selected:
+                self.logger.error(f"Failed to find or select {specific_market} within {main_market}")
+                return None
+
+        with self.metrics.stage("rows_wait"):
+            await self.navigation_manager.wait_for_page_load(page)
+
+        with self.metrics.stage("content_fetch"):
+            html_content = await self.page_content_fetcher.fetch_odds_rows_html(page)
+
+        with self.metrics.stage("parse"):
+            return self.odds_parser.parse_market_odds(
+                html_content=html_content, period=period, odds_labels=odds_labels, target_bookmaker=target_bookmaker
+            )
+
+    def _describe_retry_counters(self) -> str:
+        return (
+            f"Stats - Total empty: {self.metrics.counter('market_empty_results')}, "
+            f"Retries: {self.metrics.counter('market_retries')}, "
+            f"Success: {self.metrics.counter('market_retry_successes')}, "
+            f"Failed: {self.metrics.counter('market_retries_exhausted')}"
+        )
+
+    async def _prepare_market_retry(self, page: Page, specific_market: str | None, full_reload: bool):
+        """
+        Reset the market view before retrying one market.
+
+        The first retry only closes the sub-market so the tab and sub-market are opened again; later ones reload
+        the page, which costs a full navigation.
+
+        Args:
+            page (Page): The match page.
+            specific_market (Optional[str]): The sub-market that may still be open.
+            full_reload (bool): Whether to reload the page.
+        """
+        try:
+            if full_reload:
+                await self.rate_limiter.reload(page, wait_until="domcontentloaded")
+                await self.page_readiness.wait_for_event_header(page)
+            elif specific_market:
+                await self.navigation_manager.close_specific_market(page, specific_market)
+        except Exception as e:
+            self.logger.debug(f"Failed to reset the market view before retrying: {e}")
@@ -1,10 +1,15 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import inspect
 import logging
-import random
 from typing import Any
 
 from playwright.async_api import Page
 
+from src.core.asset_cache import AssetCache
 from src.core.base_scraper import BaseScraper
+from src.core.har_archive import HarArchive
+from src.core.resource_blocker import ResourceBlocker
 from src.core.url_builder import URLBuilder
 from src.utils.constants import ODDSPORTAL_BASE_URL
 
@@ -14,9 +19,21 @@ class OddsPortalScraper(BaseScraper):
     Main class that manages the scraping workflow from OddsPortal.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        link_collection_tabs: int = 3,
+        **kwargs,
+    ):
+        """
+        Args:
+            *args: Positional arguments for `BaseScraper`.
+            link_collection_tabs (int): Number of result pages loaded concurrently while collecting match links.
+            **kwargs: Keyword arguments for `BaseScraper`.
+        """
         super().__init__(*args, **kwargs)
         self.link_logger = logging.getLogger("LinkLogger")
+        self.link_collection_tabs = max(1, link_collection_tabs)
 
     async def start_playwright(
         self,
@@ -25,6 +42,11 @@ class OddsPortalScraper(BaseScraper):
         browser_locale_timezone: str | None = None,
         browser_timezone_id: str | None = None,
         proxy: dict[str, str] | None = None,
+        browser_contexts: int = 1,
+        context_proxies: list[dict[str, str]] | None = None,
+        resource_blocker: ResourceBlocker | None = None,
+        asset_cache: AssetCache | None = None,
+        har_archive: HarArchive | None = None,
     ):
         """
         Initializes Playwright using PlaywrightManager.
@@ -32,6 +54,11 @@ class OddsPortalScraper(BaseScraper):
         Args:
             headless (bool): Whether to run Playwright in headless mode.
             proxy (Optional[Dict[str, str]]): Proxy configuration if needed.
+            browser_contexts (int): Number of isolated browser contexts scraping work is spread over.
+            context_proxies (Optional[List[Dict[str, str]]]): Proxies assigned round-robin to the contexts.
+            resource_blocker (Optional[ResourceBlocker]): If set, drops requests the scraper does not need.
+            asset_cache (Optional[AssetCache]): If set, serves static assets from a disk cache.
+            har_archive (Optional[HarArchive]): If set, records the run's traffic to HAR files or replays it.
         """
         await self.playwright_manager.initialize(
             headless=headless,
@@ -39,6 +66,12 @@ class OddsPortalScraper(BaseScraper):
             locale=browser_locale_timezone,
             timezone_id=browser_timezone_id,
             proxy=proxy,
+            context_count=browser_contexts,
+            context_proxies=context_proxies,
+            resource_blocker=resource_blocker,
+            asset_cache=asset_cache,
+            rate_limiter=self.rate_limiter,
+            har_archive=har_archive,
         )
 
     async def stop_playwright(self):
@@ -81,31 +114,52 @@ class OddsPortalScraper(BaseScraper):
         self.logger.info(f"Base URL: {base_url}")
         self.logger.info(f"Max pages parameter: {max_pages}")
 
-        # Navigate to the base URL
-        self.logger.info("Navigating to base URL...")
-        await current_page.goto(base_url)
-        await self._prepare_page_for_scraping(page=current_page)
-
-        # Analyze pagination and determine pages to scrape
-        self.logger.info("Step 1: Analyzing pagination information...")
-        pages_to_scrape = await self._get_pagination_info(page=current_page, max_pages=max_pages)
+        all_links = self.crawl_checkpoint.get_links(scope=base_url) if self.crawl_checkpoint else None
 
-        # Collect match links from all pages
-        self.logger.info("Step 2: Collecting match links from all pages...")
-        all_links = await self._collect_match_links(base_url=base_url, pages_to_scrape=pages_to_scrape, max_matches=max_matches)
+        if all_links is not None:
+            self.logger.info(f"Steps 1-2: Reusing {len(all_links)} match links collected by a previous run.")
+            await self.rate_limiter.goto(
+                current_page, ODDSPORTAL_BASE_URL, timeout=20000, wait_until="domcontentloaded"
+            )
+            await self._prepare_page_for_scraping(page=current_page)
+        else:
+            # Navigate to the base URL
+            self.logger.info("Navigating to base URL...")
+            await self.rate_limiter.goto(current_page, base_url)
+            await self._prepare_page_for_scraping(page=current_page)
 
-        # Extract odds from all collected links
-        self.logger.info("Step 3: Extracting odds from collected match links...")
-        self.logger.info(f"Total unique matches to process: {len(all_links)}")
+            # Analyze pagination and determine pages to scrape
+            self.logger.info("Step 1: Analyzing pagination information...")
+            pages_to_scrape = await self._get_pagination_info(page=current_page, max_pages=max_pages)
 
-        return await self.extract_match_odds(
+        # Links flow into the odds workers as soon as their page is collected
+        async with self.match_odds_pipeline(
             sport=sport,
-            match_links=all_links,
             markets=markets,
             scrape_odds_history=scrape_odds_history,
             target_bookmaker=target_bookmaker,
             preview_submarkets_only=self.preview_submarkets_only,
-        )
+            max_matches=max_matches,
+        ) as pipeline:
+            if all_links is not None:
+                self.logger.info("Step 3: Extracting odds from collected match links...")
+                await pipeline.submit_many(all_links)
+            else:
+                self.logger.info("Steps 2-3: Collecting match links from all pages, extracting odds as they arrive...")
+                with pipeline.stage_timer("link_collection"):
+                    all_links = await self._collect_match_links(
+                        base_url=base_url,
+                        pages_to_scrape=pages_to_scrape,
+                        max_matches=max_matches,
+                        on_page_links=lambda _page_number, links: pipeline.submit_many(links),
+                    )
+
+                if self.crawl_checkpoint and all_links:
+                    self.crawl_checkpoint.save_links(scope=base_url, links=all_links)
+
+            self.logger.info(f"Total unique matches to process: {len(all_links)}")
+
+        return self.get_pipeline_odds_data(pipeline)
 
     async def scrape_upcoming(
         self,
@@ -139,42 +193,47 @@ class OddsPortalScraper(BaseScraper):
         url = URLBuilder.get_upcoming_matches_url(sport=sport, date=date, league=league)
         self.logger.info(f"Fetching upcoming odds from {url}")
 
-        await current_page.goto(url, timeout=10000, wait_until="domcontentloaded")
+        await self.rate_limiter.goto(current_page, url, timeout=10000, wait_until="domcontentloaded")
         await self._prepare_page_for_scraping(page=current_page)
 
-        # Scroll to load all matches due to lazy loading
-        self.logger.info("Scrolling page to load all upcoming matches...")
-        await self.browser_helper.scroll_until_loaded(
-            page=current_page,
-            timeout=30,
-            scroll_pause_time=2,
-            max_scroll_attempts=3,
-            content_check_selector="div[class*='eventRow']",
-        )
-
-        match_links = await self.extract_match_links(page=current_page)
-
-        if not match_links:
-            self.logger.warning("No match links found for upcoming matches.")
-            return []
-        
-        # Apply max_matches limit if specified
-        if max_matches and len(match_links) > max_matches:
-            self.logger.info(f"Limiting results to {max_matches} matches (from {len(match_links)} found)")
-            match_links = match_links[:max_matches]
-
-        self.logger.info(f"Logging {len(match_links)} collected match links.")
-        for link in match_links:
-            self.link_logger.info(link)
-
-        return await self.extract_match_odds(
+        async with self.match_odds_pipeline(
             sport=sport,
-            match_links=match_links,
             markets=markets,
             scrape_odds_history=scrape_odds_history,
             target_bookmaker=target_bookmaker,
             preview_submarkets_only=self.preview_submarkets_only,
-        )
+            max_matches=max_matches,
+        ) as pipeline:
+
+            async def submit_visible_links():
+                if pipeline.is_full():
+                    return
+                with pipeline.stage_timer("link_discovery"):
+                    links = await self.extract_match_links(page=current_page)
+                for link in links:
+                    if await pipeline.submit(link):
+                        self.link_logger.info(link)
+
+            # Scroll to load all matches due to lazy loading; matches already loaded are scraped meanwhile
+            self.logger.info("Scrolling page to load all upcoming matches...")
+            await self.browser_helper.scroll_until_loaded(
+                page=current_page,
+                timeout=30,
+                scroll_pause_time=2,
+                max_scroll_attempts=3,
+                content_check_selector="div[class*='eventRow']",
+                on_new_content=submit_visible_links,
+            )
+            await submit_visible_links()
+
+            if not pipeline.submitted:
+                self.logger.warning("No match links found for upcoming matches.")
+            elif pipeline.is_full():
+                self.logger.info(f"Limited results to {max_matches} matches")
+
+            self.logger.info(f"Collected {len(pipeline.submitted)} match links.")
+
+        return self.get_pipeline_odds_data(pipeline)
 
     async def scrape_matches(
         self,
@@ -205,7 +264,7 @@ class OddsPortalScraper(BaseScraper):
         for link in match_links:
             self.link_logger.info(link)
 
-        await current_page.goto(ODDSPORTAL_BASE_URL, timeout=20000, wait_until="domcontentloaded")
+        await self.rate_limiter.goto(current_page, ODDSPORTAL_BASE_URL, timeout=20000, wait_until="domcontentloaded")
         await self._prepare_page_for_scraping(page=current_page)
         return await self.extract_match_odds(
             sport=sport,
@@ -213,7 +272,7 @@ class OddsPortalScraper(BaseScraper):
             markets=markets,
             scrape_odds_history=scrape_odds_history,
             target_bookmaker=target_bookmaker,
-            concurrent_scraping_task=min(len(match_links), self.concurrency_tasks),
+            concurrent_scraping_task=len(match_links),
             preview_submarkets_only=self.preview_submarkets_only,
         )
 
@@ -226,6 +285,9 @@ class OddsPortalScraper(BaseScraper):
         """
         await self.set_odds_format(page=page)
         await self.browser_helper.dismiss_cookie_banner(page=page)
+        self._warmed_contexts.add(page.context)
+        # Other contexts start with the same consent and odds format settings
+        await self.playwright_manager.share_cookies()
 
     async def _get_pagination_info(self, page: Page, max_pages: int | None) -> list[int]:
         """
@@ -240,8 +302,8 @@ class OddsPortalScraper(BaseScraper):
         """
         self.logger.info("Analyzing pagination information...")
         
-        # Wait for page to fully load
-        await page.wait_for_timeout(3000)
+        # Wait for the match rows (and the pagination rendered with them)
+        await self.page_readiness.wait_for_event_rows(page)
         
         # Try multiple selectors to find pagination
         selectors = [
@@ -391,78 +453,96 @@ class OddsPortalScraper(BaseScraper):
             self.logger.info("No pagination gaps detected")
             return sorted_pages
 
-    async def _collect_match_links(self, base_url: str, pages_to_scrape: list[int], max_matches: int | None = None) -> list[str]:
+    async def _collect_match_links(
+        self,
+        base_url: str,
+        pages_to_scrape: list[int],
+        max_matches: int | None = None,
+        on_page_links: Callable[[int, list[str]], Awaitable[None] | None] | None = None,
+    ) -> list[str]:
         """
-        Collects match links from multiple pages.
+        Collects match links from multiple pages, several pages at a time.
+
+        Up to `link_collection_tabs` result pages are loaded concurrently; their navigations go through the shared
+        rate limiter.
 
         Args:
             base_url (str): The base URL of the historic matches.
             pages_to_scrape (List[int]): Pages to scrape.
             max_matches (Optional[int]): Maximum number of matches to collect.
+            on_page_links (Optional[Callable]): Called (and awaited if async) with the page number and the links it
+                added (not seen on earlier pages), as soon as the page and every page before it are collected.
 
         Returns:
-            List[str]: List of match links found.
+            List[str]: Unique match links found, in page order.
         """
-        self.logger.info(f"Starting collection of match links from {len(pages_to_scrape)} pages")
+        self.logger.info(
+            f"Starting collection of match links from {len(pages_to_scrape)} pages "
+            f"({self.link_collection_tabs} tabs, up to {self.rate_limiter.rate} requests/s per host)"
+        )
         self.logger.info(f"Pages to process: {pages_to_scrape}")
 
-        all_links = []
-        successful_pages = 0
+        tab_slots = asyncio.Semaphore(self.link_collection_tabs)
+        page_links: dict[int, list[str]] = {}
+        finished_pages: set[int] = set()
+        seen_links: set[str] = set()
         failed_pages = 0
+        enough_links = asyncio.Event()
+        # Pages are handed to the callback in page order, whatever order they finish in
+        flush_lock = asyncio.Lock()
+        next_page_index = 0
 
-        for i, page_number in enumerate(pages_to_scrape, 1):
-            self.logger.info(f"Processing page {i}/{len(pages_to_scrape)}: {page_number}")
+        async def flush_finished_pages():
+            nonlocal next_page_index
 
-            try:
-                tab = await self.playwright_manager.context.new_page()
-                self.logger.debug(f"Created new tab for page {page_number}")
-
-                page_url = f"{base_url}#/page/{page_number}"
-                self.logger.info(f"Navigating to: {page_url}")
-                await tab.goto(page_url, timeout=10000, wait_until="domcontentloaded")
-                delay = random.randint(6000, 8000)  # noqa: S311
-                self.logger.debug(f"Waiting {delay}ms before processing...")
-                await tab.wait_for_timeout(delay)
-
-                self.logger.info(f"Scrolling page {page_number} to load all matches...")
-                scroll_success = await self.browser_helper.scroll_until_loaded(
-                    page=tab,
-                    timeout=30,
-                    scroll_pause_time=2,
-                    max_scroll_attempts=3,
-                    content_check_selector="div[class*='eventRow']",
-                )
-
-                if scroll_success:
-                    self.logger.debug(f"Successfully scrolled page {page_number}")
+            async with flush_lock:
+                while next_page_index < len(pages_to_scrape) and pages_to_scrape[next_page_index] in finished_pages:
+                    page_number = pages_to_scrape[next_page_index]
+                    next_page_index += 1
+
+                    links = dict.fromkeys(page_links.get(page_number, []))
+                    new_links = [link for link in links if link not in seen_links]
+                    seen_links.update(new_links)
+
+                    if max_matches and len(seen_links) >= max_matches:
+                        enough_links.set()
+
+                    if on_page_links and new_links:
+                        callback_result = on_page_links(page_number, new_links)
+                        if inspect.isawaitable(callback_result):
+                            await callback_result
+
+        async def collect_page(page_number: int):
+            nonlocal failed_pages
+
+            async with tab_slots:
+                if enough_links.is_set():
+                    self.logger.debug(f"Skipping page {page_number}: max matches already collected")
                 else:
-                    self.logger.warning(f"Scrolling may not have completed for page {page_number}")
+                    try:
+                        page_links[page_number] = await self._collect_page_links(
+                            base_url=base_url, page_number=page_number
+                        )
+                    except Exception as e:
+                        failed_pages += 1
+                        self.logger.error(f"Error processing page {page_number}: {e}")
 
-                self.logger.info(f"Extracting match links from page {page_number}...")
-                links = await self.extract_match_links(page=tab)
-                all_links.extend(links)
-                successful_pages += 1
-                self.logger.info(f"Extracted {len(links)} links from page {page_number}")
+            finished_pages.add(page_number)
+            await flush_finished_pages()
 
-            except Exception as e:
-                failed_pages += 1
-                self.logger.error(f"Error processing page {page_number}: {e}")
+        await asyncio.gather(*(collect_page(page_number) for page_number in pages_to_scrape))
 
-            finally:
-                if "tab" in locals() and tab:
-                    await tab.close()
-                    self.logger.debug(f"Closed tab for page {page_number}")
+        all_links = [link for page_number in pages_to_scrape for link in page_links.get(page_number, [])]
+        unique_links = list(dict.fromkeys(all_links))
 
-        unique_links = list(set(all_links))
-        
         # Apply max_matches limit if specified
         if max_matches and len(unique_links) > max_matches:
             self.logger.info(f"Limiting results to {max_matches} matches (from {len(unique_links)} found)")
             unique_links = unique_links[:max_matches]
-        
+
         self.logger.info("Collection Summary:")
         self.logger.info(f"   • Total pages processed: {len(pages_to_scrape)}")
-        self.logger.info(f"   • Successful pages: {successful_pages}")
+        self.logger.info(f"   • Successful pages: {len(page_links)}")
         self.logger.info(f"   • Failed pages: {failed_pages}")
         self.logger.info(f"   • Total links found: {len(all_links)}")
         self.logger.info(f"   • Unique links: {len(unique_links)}")
@@ -477,3 +557,48 @@ class OddsPortalScraper(BaseScraper):
             self.logger.warning(f"{failed_pages} pages failed during link collection")
 
         return unique_links
+
+    async def _collect_page_links(self, base_url: str, page_number: int) -> list[str]:
+        """
+        Load one result page in its own tab and extract its match links.
+
+        Args:
+            base_url (str): The base URL of the historic matches.
+            page_number (int): The result page to load.
+
+        Returns:
+            List[str]: The match links of the page.
+        """
+        tab = await self.playwright_manager.next_context().new_page()
+        self.logger.debug(f"Created new tab for page {page_number}")
+
+        try:
+            page_url = f"{base_url}#/page/{page_number}"
+            self.logger.info(f"Navigating to: {page_url}")
+            await self.rate_limiter.goto(tab, page_url, timeout=10000, wait_until="domcontentloaded")
+
+            if not await self.page_readiness.wait_for_event_rows(tab):
+                self.logger.warning(f"No match rows rendered on page {page_number} yet")
+
+            self.logger.info(f"Scrolling page {page_number} to load all matches...")
+            scroll_success = await self.browser_helper.scroll_until_loaded(
+                page=tab,
+                timeout=30,
+                scroll_pause_time=2,
+                max_scroll_attempts=3,
+                content_check_selector="div[class*='eventRow']",
+            )
+
+            if scroll_success:
+                self.logger.debug(f"Successfully scrolled page {page_number}")
+            else:
+                self.logger.warning(f"Scrolling may not have completed for page {page_number}")
+
+            self.logger.info(f"Extracting match links from page {page_number}...")
+            links = await self.extract_match_links(page=tab)
+            self.logger.info(f"Extracted {len(links)} links from page {page_number}")
+            return links
+
+        finally:
+            await tab.close()
+            self.logger.debug(f"Closed tab for page {page_number}")
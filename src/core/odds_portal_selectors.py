@@ -32,6 +32,29 @@ class OddsPortalSelectors:
     # Market navigation - sub-market selection
     SUB_MARKET_SELECTOR = "div.flex.w-full.items-center.justify-start.pl-3.font-bold p"
 
+    # Active market tab indicators: only items of the tab list, whose text is their own tab name (an "active"
+    # container would contain the name of every tab)
+    ACTIVE_TAB_SELECTORS: ClassVar[list[str]] = [
+        "ul.odds-tabs > li.active",
+        "ul.odds-tabs > li[class*='active']:not([class*='inactive'])",
+        "ul[class*='odds-tabs'] > li[class*='active']:not([class*='inactive'])",
+        "div[class*='odds-tabs'] li[class*='active']:not([class*='inactive'])",
+    ]
+
+    # Match page content
+    EVENT_HEADER = "#react-event-header"
+    BOOKMAKER_ROW = "div.border-black-borders.flex.h-9"
+    ODDS_BLOCK = "div.flex-center.flex-col.font-bold"
+    BOOKMAKER_LOGO = "img.bookmaker-logo"
+    ODDS_MOVEMENT_TITLE = "Odds movement"
+
+    # Results / upcoming listing pages
+    EVENT_ROW = "div[class*='eventRow']"
+
+    # Odds format dropdown
+    ODDS_FORMAT_BUTTON = "div.group > button.gap-2"
+    ODDS_FORMAT_OPTIONS = "div.group > div.dropdown-content > ul > li > a"
+
     @staticmethod
     def get_dropdown_selectors_for_market(market_name: str) -> list[str]:
         """Generate dropdown selectors for a specific market name."""
@@ -0,0 +1,221 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+import logging
+import time
+
+from playwright.async_api import BrowserContext, Page
+
+
+class PagePool:
+    """
+    A bounded pool of warmed Playwright pages shared by scraping workers.
+
+    Workers check a page out, use it and hand it back. Returned pages are reset cheaply by navigating to
+    a blank document instead of being closed, so tab creation is paid once per slot rather than once per
+    match. Pages that crashed, were closed, raised during use or served `max_uses` checkouts are recycled:
+    they are closed and a fresh page takes their slot on the next checkout.
+
+    With several browser contexts, new pages are opened in the context with the fewest live pages. A context whose
+    pages fail `CONTEXT_FAILURE_LIMIT` times in a row is benched for `CONTEXT_BENCH_SECONDS`: its idle pages are
+    recycled and new pages go to the other contexts, so one blocked context does not stall the pool. `contexts` may
+    be updated in place while the pool runs (see `PlaywrightManager.replace_context`): pages of a context that left
+    the list are recycled instead of reused.
+    """
+
+    RESET_URL = "about:blank"
+    RESET_TIMEOUT = 5000
+    CONTEXT_FAILURE_LIMIT = 3
+    CONTEXT_BENCH_SECONDS = 60.0
+
+    def __init__(
+        self,
+        contexts: list[BrowserContext],
+        size: int,
+        page_initializer: Callable[[Page], Awaitable[None]] | None = None,
+        max_uses: int = 50,
+    ):
+        """
+        Args:
+            contexts (List[BrowserContext]): The browser contexts pages are opened in.
+            size (int): Maximum number of pages alive (and checked out) at the same time.
+            page_initializer (Optional[Callable[[Page], Awaitable[None]]]): Coroutine run once on every new
+                page before its first checkout (e.g. to pre-configure timeouts or settings).
+            max_uses (int): Number of checkouts after which a page is recycled to bound renderer memory growth.
+        """
+        if size <= 0:
+            raise ValueError("Page pool size must be a positive integer.")
+        if not contexts:
+            raise ValueError("Page pool needs at least one browser context.")
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.contexts = contexts
+        self.size = size
+        self.page_initializer = page_initializer
+        self.max_uses = max_uses
+
+        self._idle_pages: asyncio.Queue[Page] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(size)
+        self._uses: dict[Page, int] = {}
+        self._crashed: set[Page] = set()
+        self._page_contexts: dict[Page, BrowserContext] = {}
+        self._context_failures: dict[BrowserContext, int] = dict.fromkeys(contexts, 0)
+        self._benched_until: dict[BrowserContext, float] = {}
+        self._closed = False
+
+    async def __aenter__(self) -> "PagePool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Check out a page for the duration of the `async with` block.
+
+        If the block raises, the page is considered poisoned and recycled; the exception is re-raised.
+        """
+        page = await self.acquire()
+        poisoned = False
+        try:
+            yield page
+        except BaseException:
+            poisoned = True
+            raise
+        finally:
+            await self.release(page, poisoned=poisoned)
+
+    async def acquire(self) -> Page:
+        """Check out an idle page, creating one if the pool has not reached its size yet."""
+        if self._closed:
+            raise RuntimeError("Cannot acquire a page from a closed pool.")
+
+        await self._slots.acquire()
+        try:
+            while not self._idle_pages.empty():
+                page = self._idle_pages.get_nowait()
+                if (
+                    self._is_healthy(page)
+                    and not self._is_retired(page)
+                    and not self._is_benched(self._page_contexts.get(page))
+                ):
+                    return page
+                await self._discard(page)
+
+            return await self._create_page()
+
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, page: Page, poisoned: bool = False):
+        """
+        Return a page to the pool.
+
+        Args:
+            page (Page): The page previously returned by `acquire`.
+            poisoned (bool): Whether the page must be recycled instead of reused.
+        """
+        try:
+            self._uses[page] = self._uses.get(page, 0) + 1
+            self._record_outcome(self._page_contexts.get(page), failed=poisoned)
+
+            if (
+                self._closed
+                or poisoned
+                or not self._is_healthy(page)
+                or self._is_retired(page)
+                or self._uses[page] >= self.max_uses
+            ):
+                await self._discard(page)
+                return
+
+            if await self._reset(page):
+                self._idle_pages.put_nowait(page)
+            else:
+                await self._discard(page)
+
+        finally:
+            self._slots.release()
+
+    async def close(self):
+        """Close every idle page. Checked-out pages are closed when they are released."""
+        self._closed = True
+        while not self._idle_pages.empty():
+            await self._discard(self._idle_pages.get_nowait())
+
+    async def _create_page(self) -> Page:
+        context = self._pick_context()
+        page = await context.new_page()
+        page.on("crash", lambda crashed_page: self._crashed.add(crashed_page))
+        self._uses[page] = 0
+        self._page_contexts[page] = context
+
+        if self.page_initializer:
+            try:
+                await self.page_initializer(page)
+            except Exception:
+                await self._discard(page)
+                raise
+
+        self.logger.debug(f"Opened pooled page ({len(self._uses)}/{self.size} alive).")
+        return page
+
+    async def _reset(self, page: Page) -> bool:
+        """Drop the previous document so the next worker starts from a clean, lightweight page."""
+        try:
+            await page.goto(self.RESET_URL, timeout=self.RESET_TIMEOUT)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to reset pooled page, recycling it: {e}")
+            return False
+
+    def _pick_context(self) -> BrowserContext:
+        """The least loaded context that is not benched (or the least loaded one if all are)."""
+        candidates = [context for context in self.contexts if not self._is_benched(context)] or self.contexts
+        live_pages = dict.fromkeys(candidates, 0)
+        for context in self._page_contexts.values():
+            if context in live_pages:
+                live_pages[context] += 1
+        return min(candidates, key=live_pages.__getitem__)
+
+    def _is_retired(self, page: Page) -> bool:
+        return self._page_contexts.get(page) not in self.contexts
+
+    def _is_benched(self, context: BrowserContext | None) -> bool:
+        return (
+            context is not None
+            and len(self.contexts) > 1
+            and self._benched_until.get(context, 0.0) > time.monotonic()
+        )
+
+    def _record_outcome(self, context: BrowserContext | None, failed: bool):
+        if context not in self.contexts:
+            return
+
+        if not failed:
+            self._context_failures[context] = 0
+            return
+
+        self._context_failures[context] = self._context_failures.get(context, 0) + 1
+        if self._context_failures[context] >= self.CONTEXT_FAILURE_LIMIT and len(self.contexts) > 1:
+            self._context_failures[context] = 0
+            self._benched_until[context] = time.monotonic() + self.CONTEXT_BENCH_SECONDS
+            self.logger.warning(
+                f"Browser context {self.contexts.index(context)} failed {self.CONTEXT_FAILURE_LIMIT} times in a row, "
+                f"benching it for {self.CONTEXT_BENCH_SECONDS:.0f}s."
+            )
+
+    async def _discard(self, page: Page):
+        self._uses.pop(page, None)
+        self._crashed.discard(page)
+        self._page_contexts.pop(page, None)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            self.logger.debug(f"Error while closing pooled page: {e}")
+
+    def _is_healthy(self, page: Page) -> bool:
+        return not page.is_closed() and page not in self._crashed
@@ -0,0 +1,329 @@
+import logging
+from typing import ClassVar
+
+from playwright.async_api import Page, TimeoutError
+
+from src.core.odds_portal_selectors import OddsPortalSelectors
+
+
+class PageReadiness:
+    """
+    Waits on concrete DOM conditions instead of fixed sleeps.
+
+    Every condition has its own timeout budget (in milliseconds). Exceeding a budget is not an error:
+    the wait returns as soon as the condition holds, or returns False once the budget is spent so the
+    caller can decide whether to continue with what is on the page or retry.
+    """
+
+    DEFAULT_TIMEOUTS: ClassVar[dict[str, int]] = {
+        "event_header": 10000,
+        "active_tab": 5000,
+        "bookmaker_rows": 5000,
+        "event_rows": 8000,
+        "odds_format": 5000,
+        "dropdown": 3000,
+        "dropdown_entry": 3000,
+        "odds_history_modal": 3000,
+        "dom_settled": 2000,
+    }
+
+    # Resolves once the DOM has not mutated for `quietMs`, or with false once `timeoutMs` is spent.
+    _DOM_SETTLED_SCRIPT = """
+        ([quietMs, timeoutMs]) => new Promise((resolve) => {
+            let quietTimer = setTimeout(done, quietMs, true);
+            const budgetTimer = setTimeout(done, timeoutMs, false);
+            const observer = new MutationObserver(() => {
+                clearTimeout(quietTimer);
+                quietTimer = setTimeout(done, quietMs, true);
+            });
+            function done(settled) {
+                observer.disconnect();
+                clearTimeout(quietTimer);
+                clearTimeout(budgetTimer);
+                resolve(settled);
+            }
+            observer.observe(document.body, { childList: true, subtree: true, attributes: true });
+        })
+    """
+
+    _EVENT_HEADER_SCRIPT = """
+        (selector) => {
+            const header = document.querySelector(selector);
+            return !!(header && header.getAttribute('data'));
+        }
+    """
+
+    _ACTIVE_TAB_SCRIPT = """
+        ([selectors, marketName]) => selectors.some((selector) =>
+            Array.from(document.querySelectorAll(selector)).some((element) =>
+                (element.textContent || '').toLowerCase().includes(marketName)
+            )
+        )
+    """
+
+    # Remembers the bookmaker rows on the page (and their text) before a click replaces them
+    _REMEMBER_ROWS_SCRIPT = """
+        (selector) => {
+            window.__previousBookmakerRows = Array.from(document.querySelectorAll(selector)).map(
+                (row) => [row, row.textContent]
+            );
+        }
+    """
+
+    # True once bookmaker rows are attached and they are not the remembered ones: a row is new, or a remembered row
+    # was detached or changed
+    _FRESH_ROWS_SCRIPT = """
+        (selector) => {
+            const rows = Array.from(document.querySelectorAll(selector));
+            const previous = window.__previousBookmakerRows || [];
+            if (!rows.length) {
+                return false;
+            }
+            if (!previous.length) {
+                return true;
+            }
+            const previousRows = new Set(previous.map(([row]) => row));
+            return rows.some((row) => !previousRows.has(row))
+                || previous.some(([row, text]) => !row.isConnected || row.textContent !== text);
+        }
+    """
+
+    # True once a visible element among `selector` has exactly `text` (lowercased) as its text
+    _VISIBLE_ENTRY_SCRIPT = """
+        ([selector, text]) => Array.from(document.querySelectorAll(selector)).some(
+            (element) => element.getClientRects().length && element.textContent.trim().toLowerCase() === text
+        )
+    """
+
+    _BUTTON_TEXT_SCRIPT = """
+        ([selector, expectedText]) => {
+            const button = document.querySelector(selector);
+            return !!(button && button.innerText.trim() === expectedText);
+        }
+    """
+
+    # Attribute naming the odds cell an odds movement modal belongs to, for modals not rendered inside their cell
+    ODDS_HISTORY_ANCHOR_ATTRIBUTE = "data-history-anchor"
+
+    # Stamps every odds movement modal that is added, changed or shown with the token of the odds cell hovered at
+    # that moment (cells carry their token in `attribute`). Installed once per page; every call forgets the anchors
+    # of earlier cells, whose tokens are reused when the cells of another market are tagged.
+    _WATCH_ODDS_HISTORY_MODALS_SCRIPT = """
+        ([title, attribute, anchorAttribute]) => {
+            document.querySelectorAll(`[${anchorAttribute}]`).forEach(
+                (modal) => modal.removeAttribute(anchorAttribute)
+            );
+            if (window.__oddsHistoryModalObserver) {
+                return;
+            }
+            window.__oddsHistoryModalObserver = new MutationObserver((mutations) => {
+                const hovered = document.querySelector(`[${attribute}]:hover`);
+                if (!hovered) {
+                    return;
+                }
+                for (const header of document.querySelectorAll("h3")) {
+                    const modal = header.parentElement;
+                    if (!modal || !header.textContent.trim().toLowerCase().includes(title)) {
+                        continue;
+                    }
+                    const touched = mutations.some((mutation) => modal.contains(mutation.target)
+                        || [...mutation.addedNodes].some((node) => node.contains && node.contains(modal)));
+                    if (touched) {
+                        modal.setAttribute(anchorAttribute, hovered.getAttribute(attribute));
+                    }
+                }
+            });
+            window.__oddsHistoryModalObserver.observe(document.body, {
+                childList: true,
+                subtree: true,
+                characterData: true,
+                attributes: true,
+                attributeFilter: ["style", "class"],
+            });
+        }
+    """
+
+    # Inner HTML of the visible odds movement modal anchored to the odds cell holding `token`: the modal sits inside
+    # that cell, or was stamped with its token while it was hovered
+    _ODDS_HISTORY_MODAL_OF_CELL_SCRIPT = """
+        ([title, attribute, anchorAttribute, token]) => {
+            const anchorOf = (modal) => {
+                const cell = modal.closest(`[${attribute}]`);
+                return cell ? cell.getAttribute(attribute) : modal.getAttribute(anchorAttribute);
+            };
+            const header = [...document.querySelectorAll("h3")].find(
+                (h) => h.getClientRects().length
+                    && h.textContent.trim().toLowerCase().includes(title)
+                    && h.parentElement
+                    && anchorOf(h.parentElement) === token
+            );
+            return header ? header.parentElement.innerHTML : false;
+        }
+    """
+
+    def __init__(self, timeouts: dict[str, int] | None = None):
+        """
+        Args:
+            timeouts (Optional[Dict[str, int]]): Per-condition timeout overrides in milliseconds,
+                keyed like `DEFAULT_TIMEOUTS`.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.timeouts = {**self.DEFAULT_TIMEOUTS, **(timeouts or {})}
+
+    async def wait_for_event_header(self, page: Page) -> bool:
+        """Wait until the react event header is rendered with its `data` attribute populated."""
+        return await self._wait_for_function(
+            page, "event_header", self._EVENT_HEADER_SCRIPT, OddsPortalSelectors.EVENT_HEADER
+        )
+
+    async def wait_for_active_tab(self, page: Page, market_name: str) -> bool:
+        """Wait until an active tab indicator contains the given market name."""
+        return await self._wait_for_function(
+            page,
+            "active_tab",
+            self._ACTIVE_TAB_SCRIPT,
+            [OddsPortalSelectors.ACTIVE_TAB_SELECTORS, market_name.lower()],
+        )
+
+    async def remember_bookmaker_rows(self, page: Page):
+        """
+        Remember the bookmaker rows currently on the page, so `wait_for_bookmaker_rows` waits for them to be replaced.
+
+        Call it right before a click that swaps the rows (market tab, sub-market); otherwise the wait would be
+        satisfied at once by the rows of the previous market.
+        """
+        await page.evaluate(self._REMEMBER_ROWS_SCRIPT, OddsPortalSelectors.BOOKMAKER_ROW)
+
+    async def forget_bookmaker_rows(self, page: Page):
+        """Accept the rows currently on the page again, e.g. when the requested tab was already open."""
+        await page.evaluate("() => { window.__previousBookmakerRows = []; }")
+
+    async def wait_for_bookmaker_rows(self, page: Page) -> bool:
+        """
+        Wait until bookmaker odds rows are attached to the page and, if rows were remembered with
+        `remember_bookmaker_rows`, until they were replaced (a new row, or a remembered row detached or changed).
+        """
+        return await self._wait_for_function(
+            page, "bookmaker_rows", self._FRESH_ROWS_SCRIPT, OddsPortalSelectors.BOOKMAKER_ROW
+        )
+
+    async def wait_for_event_rows(self, page: Page) -> bool:
+        """Wait until at least one match row is attached to a results or upcoming listing page."""
+        return await self._wait_for_selector(page, "event_rows", OddsPortalSelectors.EVENT_ROW)
+
+    async def wait_for_dropdown_options(self, page: Page) -> bool:
+        """Wait until the odds format dropdown options are visible."""
+        return await self._wait_for_selector(
+            page, "dropdown", OddsPortalSelectors.ODDS_FORMAT_OPTIONS, state="visible"
+        )
+
+    async def wait_for_dropdown_entry(self, page: Page, entry_text: str) -> bool:
+        """
+        Wait until a dropdown that was just opened (e.g. the market tabs under "More") shows an entry.
+
+        Args:
+            page (Page): The Playwright page instance.
+            entry_text (str): Text of the entry, compared case-insensitively with the whole text of the element.
+        """
+        return await self._wait_for_function(
+            page,
+            "dropdown_entry",
+            self._VISIBLE_ENTRY_SCRIPT,
+            [OddsPortalSelectors.DROPDOWN_DEBUG_ELEMENTS, entry_text.strip().lower()],
+        )
+
+    async def wait_for_odds_format(self, page: Page, odds_format_label: str) -> bool:
+        """Wait until the odds format button displays the requested format."""
+        return await self._wait_for_function(
+            page,
+            "odds_format",
+            self._BUTTON_TEXT_SCRIPT,
+            [OddsPortalSelectors.ODDS_FORMAT_BUTTON, odds_format_label],
+        )
+
+    async def watch_odds_history_modals(self, page: Page, cell_attribute: str):
+        """
+        Start anchoring odds movement modals to the odds cell hovered when they appear, for
+        `capture_odds_history_modal`. Call it every time the odds cells were (re)tagged with their token in
+        `cell_attribute`, before hovering them: the observer is only installed once per page, but anchors left from
+        earlier cells are dropped.
+
+        Args:
+            page (Page): The Playwright page instance.
+            cell_attribute (str): Attribute holding the token of each odds cell (e.g. its index).
+        """
+        await page.evaluate(
+            self._WATCH_ODDS_HISTORY_MODALS_SCRIPT,
+            [OddsPortalSelectors.ODDS_MOVEMENT_TITLE.lower(), cell_attribute, self.ODDS_HISTORY_ANCHOR_ATTRIBUTE],
+        )
+
+    async def capture_odds_history_modal(self, page: Page, cell_attribute: str, token: str) -> str | None:
+        """
+        Wait for the odds movement modal of the odds cell just hovered and return its HTML.
+
+        The modal is matched to the hovered cell rather than told apart from the previous one: it is accepted when
+        it is rendered inside the cell, or when `watch_odds_history_modals` saw it appear or change while the cell
+        was hovered. A modal still open from the previous cell is therefore never returned for this one, even when
+        both show the same odds. The HTML comes back with the wait, so each hovered cell costs one round trip.
+
+        Args:
+            page (Page): The Playwright page instance.
+            cell_attribute (str): Attribute holding the token of each odds cell.
+            token (str): Token of the hovered cell.
+
+        Returns:
+            Optional[str]: The inner HTML of the modal (as `OddsParser.parse_odds_history_modal` expects it), or None
+            if no modal of that cell appeared in time.
+        """
+        try:
+            handle = await page.wait_for_function(
+                self._ODDS_HISTORY_MODAL_OF_CELL_SCRIPT,
+                arg=[
+                    OddsPortalSelectors.ODDS_MOVEMENT_TITLE.lower(),
+                    cell_attribute,
+                    self.ODDS_HISTORY_ANCHOR_ATTRIBUTE,
+                    token,
+                ],
+                timeout=self.timeouts["odds_history_modal"],
+            )
+            return await handle.json_value()
+        except TimeoutError:
+            self.logger.debug("Odds movement modal did not appear within its timeout budget.")
+            return None
+
+    async def wait_for_dom_settled(self, page: Page, quiet_ms: int = 300) -> bool:
+        """
+        Wait until the DOM stops mutating for `quiet_ms` milliseconds.
+
+        Args:
+            page (Page): The Playwright page instance.
+            quiet_ms (int): How long the DOM must stay unchanged to be considered settled.
+
+        Returns:
+            bool: True if the DOM settled within its timeout budget, False otherwise.
+        """
+        try:
+            settled = await page.evaluate(self._DOM_SETTLED_SCRIPT, [quiet_ms, self.timeouts["dom_settled"]])
+        except Exception as e:
+            self.logger.debug(f"Could not observe DOM mutations: {e}")
+            return False
+
+        if not settled:
+            self.logger.debug("DOM still mutating after its timeout budget, continuing anyway.")
+        return bool(settled)
+
+    async def _wait_for_selector(self, page: Page, condition: str, selector: str, state: str = "attached") -> bool:
+        try:
+            await page.wait_for_selector(selector, state=state, timeout=self.timeouts[condition])
+            return True
+        except TimeoutError:
+            self.logger.debug(f"Condition '{condition}' not met within {self.timeouts[condition]}ms ({selector}).")
+            return False
+
+    async def _wait_for_function(self, page: Page, condition: str, script: str, arg) -> bool:
+        try:
+            await page.wait_for_function(script, arg=arg, timeout=self.timeouts[condition])
+            return True
+        except TimeoutError:
+            self.logger.debug(f"Condition '{condition}' not met within {self.timeouts[condition]}ms.")
+            return False
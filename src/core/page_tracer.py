@@ -0,0 +1,234 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, ClassVar
+
+from playwright.async_api import Page
+
+# Attributes (match URL, market, attempt, ...) attached to the spans of the current task; each `annotate` or
+# `update` sets a new dict, so tasks never share (or mutate) one another's attributes
+_span_attributes: ContextVar[dict[str, Any] | None] = ContextVar("span_attributes", default=None)
+
+
+def _current_attributes() -> dict[str, Any]:
+    return _span_attributes.get() or {}
+
+
+class PageTracer:
+    """
+    Opt-in tracing of the Playwright calls made on match pages.
+
+    `wrap` returns a stand-in for a page whose `goto`, `reload`, `wait_for_selector`, `wait_for_function`,
+    `wait_for_timeout`, `click`, `hover`, `evaluate`, `content`, `query_selector` and `query_selector_all` calls are
+    recorded as spans; everything else goes to the page untouched. Every span carries the function that made the
+    call (e.g. `BrowserHelper._click_more_if_market_hidden`), its selector and the attributes of the enclosing
+    `annotate` blocks: the match URL and attempt number, the market and the market attempt. Calls made on element
+    handles or locators are not traced.
+
+    At the end of the run, `write` saves the spans in the Chrome trace event format (open it in `chrome://tracing`
+    or Perfetto; every asyncio task gets its own track) and `describe_slowest` lists the slowest calls along with
+    the time spent per calling function.
+    """
+
+    TRACED_METHODS: ClassVar[tuple[str, ...]] = (
+        "goto",
+        "reload",
+        "wait_for_selector",
+        "wait_for_function",
+        "wait_for_timeout",
+        "click",
+        "hover",
+        "evaluate",
+        "content",
+        "query_selector",
+        "query_selector_all",
+    )
+    MAX_ARGUMENT_LENGTH = 120
+
+    def __init__(self, max_spans: int = 500000):
+        """
+        Args:
+            max_spans (int): Spans kept in memory; later ones are only counted, so very long runs stay bounded.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_spans = max_spans
+        self.spans: list[dict[str, Any]] = []
+        self.dropped_spans = 0
+        self._started_at = time.perf_counter()
+        self._task_tracks: dict[int, int] = {}
+
+    def wrap(self, page: Page) -> Page:
+        """
+        Trace the calls made on a page.
+
+        Args:
+            page (Page): The page.
+
+        Returns:
+            Page: A stand-in for the page that records its traced calls; pass it wherever the page would go.
+        """
+        return _TracedPage(page, self)
+
+    @staticmethod
+    @contextmanager
+    def annotate(**attributes: Any) -> Iterator[None]:
+        """
+        Attach attributes to every span recorded by the current task inside the block.
+
+        Nested blocks add to (and override) the attributes of the enclosing ones.
+
+        Args:
+            **attributes: The attributes, e.g. `match_url` and `attempt`.
+        """
+        token = _span_attributes.set({**_current_attributes(), **attributes})
+        try:
+            yield
+        finally:
+            _span_attributes.reset(token)
+
+    @staticmethod
+    def update(**attributes: Any):
+        """
+        Attach attributes to the spans recorded by the current task until the enclosing `annotate` block ends.
+
+        Args:
+            **attributes: The attributes, e.g. `market_attempt`.
+        """
+        _span_attributes.set({**_current_attributes(), **attributes})
+
+    def record(self, name: str, started_at: float, seconds: float, attributes: dict[str, Any]):
+        """
+        Record one span.
+
+        Args:
+            name (str): The operation, e.g. `click`.
+            started_at (float): Its `time.perf_counter()` start.
+            seconds (float): Its duration.
+            attributes (Dict[str, Any]): What to attach to it (caller, selector, match URL, ...).
+        """
+        if len(self.spans) >= self.max_spans:
+            self.dropped_spans += 1
+            return
+
+        task = asyncio.current_task()
+        track = self._task_tracks.setdefault(id(task), len(self._task_tracks) + 1) if task else 0
+        self.spans.append(
+            {
+                "name": name,
+                "start": started_at - self._started_at,
+                "duration": seconds,
+                "track": track,
+                "attributes": {**_current_attributes(), **attributes},
+            }
+        )
+
+    def slowest(self, top: int = 20) -> list[dict[str, Any]]:
+        """The `top` longest spans, longest first."""
+        return sorted(self.spans, key=lambda span: span["duration"], reverse=True)[:top]
+
+    def time_by_caller(self) -> dict[str, dict[str, float]]:
+        """
+        Time spent in traced calls per calling function.
+
+        Returns:
+            Dict[str, Dict[str, float]]: For each caller, longest total first, its `calls` and `total` seconds.
+        """
+        callers: dict[str, dict[str, float]] = {}
+        for span in self.spans:
+            caller = callers.setdefault(span["attributes"].get("caller", "?"), {"calls": 0, "total": 0.0})
+            caller["calls"] += 1
+            caller["total"] += span["duration"]
+        return dict(sorted(callers.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def describe_slowest(self, top: int = 20) -> str:
+        """
+        Human-readable report of the slowest calls and of the time per caller, for the end of a run.
+
+        Args:
+            top (int): How many calls and callers to list.
+
+        Returns:
+            str: The report.
+        """
+        lines = [f"Slowest {top} of {len(self.spans)} traced page calls:"]
+        for span in self.slowest(top):
+            attributes = span["attributes"]
+            caller = attributes.get("caller", "?")
+            context = ", ".join(f"{key}={value}" for key, value in attributes.items() if key != "caller")
+            lines.append(f"  {span['duration'] * 1000:9.1f} ms  {span['name']:<18} in {caller} ({context})")
+
+        lines.append(f"Time in traced page calls per caller (top {top}):")
+        for caller, totals in list(self.time_by_caller().items())[:top]:
+            lines.append(f"  {totals['total']:9.2f} s  {int(totals['calls']):6d} calls  {caller}")
+
+        if self.dropped_spans:
+            lines.append(f"{self.dropped_spans} spans beyond the first {self.max_spans} were not kept.")
+        return "\n".join(lines)
+
+    def write(self, path: str):
+        """
+        Write the spans as a Chrome trace event file.
+
+        Args:
+            path (str): The JSON file, created along with its directory if needed.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": span["name"],
+                "cat": "playwright",
+                "ph": "X",
+                "ts": round(span["start"] * 1e6, 1),
+                "dur": round(span["duration"] * 1e6, 1),
+                "pid": pid,
+                "tid": span["track"],
+                "args": span["attributes"],
+            }
+            for span in self.spans
+        ]
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file, default=str)
+        self.logger.info(f"Wrote {len(events)} page call spans to {path}")
+
+
+class _TracedPage:
+    """Stand-in for a Playwright page that records its traced calls with a `PageTracer`."""
+
+    def __init__(self, page: Page, tracer: PageTracer):
+        self._page = page
+        self._tracer = tracer
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._page, name)
+        if name not in PageTracer.TRACED_METHODS:
+            return attribute
+
+        tracer = self._tracer
+
+        async def traced(*args, **kwargs):
+            # The coroutine runs in its awaiting caller's frame chain, so the caller is one frame up
+            caller = sys._getframe(1).f_code
+            attributes = {"caller": getattr(caller, "co_qualname", caller.co_name)}
+            if args and isinstance(args[0], str):
+                attributes["argument"] = args[0][: PageTracer.MAX_ARGUMENT_LENGTH]
+
+            started_at = time.perf_counter()
+            try:
+                return await attribute(*args, **kwargs)
+            except Exception as e:
+                attributes["error"] = type(e).__name__
+                raise
+            finally:
+                tracer.record(name, started_at, time.perf_counter() - started_at, attributes)
+
+        return traced
@@ -1,23 +1,49 @@
+import asyncio
+import itertools
 import logging
 import random
+from typing import ClassVar
 
-from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext, async_playwright
 
-from src.utils.constants import PLAYWRIGHT_BROWSER_ARGS, PLAYWRIGHT_BROWSER_ARGS_DOCKER
+from src.core.asset_cache import AssetCache
+from src.core.har_archive import HarArchive
+from src.core.request_rate_limiter import RequestRateLimiter
+from src.core.resource_blocker import ResourceBlocker
+from src.utils.constants import BROWSER_USER_AGENTS, PLAYWRIGHT_BROWSER_ARGS, PLAYWRIGHT_BROWSER_ARGS_DOCKER
 from src.utils.utils import is_running_in_docker
 
 
 class PlaywrightManager:
     """
     Manages Playwright browser lifecycle and configuration.
+
+    One browser hosts a pool of isolated contexts (cookies, cache and proxy of their own). `context` and `page`
+    are the primary context and its page; work spread over several contexts uses `contexts` or `next_context`.
+    A context whose proxy went bad can be swapped for a new one with `replace_context` while the run goes on.
     """
 
+    # Chromium only honours per-context proxies when the browser itself was launched with one
+    PER_CONTEXT_PROXY: ClassVar[dict[str, str]] = {"server": "http://per-context"}
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.playwright = None
         self.browser = None
         self.context = None
+        self.contexts: list[BrowserContext] = []
+        self.context_proxies: dict[BrowserContext, dict[str, str] | None] = {}
         self.page = None
+        self.resource_blocker: ResourceBlocker | None = None
+        self.asset_cache: AssetCache | None = None
+        self.rate_limiter: RequestRateLimiter | None = None
+        self.har_archive: HarArchive | None = None
+        self._browser_proxy: dict[str, str] | None = None
+        self._context_cycle = None
+        self._context_settings: dict[BrowserContext, dict[str, str | None]] = {}
+        self._retired_contexts: list[BrowserContext] = []
+        self._retired_pages = []
+        self._replace_lock = asyncio.Lock()
 
     async def initialize(
         self,
@@ -26,49 +52,191 @@ class PlaywrightManager:
         locale: str | None = None,
         timezone_id: str | None = None,
         proxy: dict[str, str] | None = None,
+        context_count: int = 1,
+        context_proxies: list[dict[str, str]] | None = None,
+        resource_blocker: ResourceBlocker | None = None,
+        asset_cache: AssetCache | None = None,
+        rate_limiter: RequestRateLimiter | None = None,
+        har_archive: HarArchive | None = None,
     ):
         """
-        Initialize and start Playwright with a browser and page.
+        Initialize and start Playwright with a browser, its contexts and a page.
 
         Args:
-            is_webdriver_headless (bool): Whether to start the browser in headless mode.
+            headless (bool): Whether to start the browser in headless mode.
+            user_agent (Optional[str]): User agent of every context. When omitted with several contexts, each context
+                gets one from `BROWSER_USER_AGENTS`.
+            locale (Optional[str]): Browser locale (e.g., fr-BE).
+            timezone_id (Optional[str]): Browser timezone ID (e.g., Europe/Brussels).
             proxy (Optional[Dict[str, str]]): Proxy configuration with keys 'server', 'username', and 'password'.
+            context_count (int): Number of isolated browser contexts to open.
+            context_proxies (Optional[List[Dict[str, str]]]): Proxies assigned round-robin to the contexts; `proxy`
+                is used for the whole browser when omitted. Only per-context proxies can be replaced mid-run.
+            resource_blocker (Optional[ResourceBlocker]): If set, filters the requests of every context.
+            asset_cache (Optional[AssetCache]): If set, serves the static assets of every context from disk.
+            rate_limiter (Optional[RequestRateLimiter]): If set, told which proxy every context uses.
+            har_archive (Optional[HarArchive]): If set, records the traffic of every context or replays it.
         """
         try:
             self.logger.info("Starting Playwright...")
+            self.resource_blocker = resource_blocker
+            self.asset_cache = asset_cache
+            self.rate_limiter = rate_limiter
+            self.har_archive = har_archive
             self.playwright = await async_playwright().start()
 
             browser_args = PLAYWRIGHT_BROWSER_ARGS_DOCKER if is_running_in_docker() else PLAYWRIGHT_BROWSER_ARGS
+            context_count = max(1, context_count)
+            per_context_proxies = bool(context_proxies)
+            launch_proxy = self.PER_CONTEXT_PROXY if per_context_proxies else proxy
+            self._browser_proxy = None if per_context_proxies else proxy
 
-            self.browser = await self.playwright.chromium.launch(headless=headless, args=browser_args, proxy=proxy)
-
-            # Set English headers if no locale specified or for English locales
-            extra_headers = {}
-            if not locale or locale.startswith("en"):
-                extra_headers = {"Accept-Language": "en-US,en;q=0.9"}
-            
-            self.context = await self.browser.new_context(
-                locale=locale if locale else "en-US",
-                timezone_id=timezone_id if timezone_id else "America/New_York",
-                user_agent=user_agent,
-                viewport={"width": random.randint(1366, 1920), "height": random.randint(768, 1080)},  # noqa: S311
-                extra_http_headers=extra_headers
+            self.browser = await self.playwright.chromium.launch(
+                headless=headless, args=browser_args, proxy=launch_proxy
             )
 
+            for index in range(context_count):
+                if user_agent or context_count == 1:
+                    context_user_agent = user_agent
+                else:
+                    context_user_agent = BROWSER_USER_AGENTS[index % len(BROWSER_USER_AGENTS)]
+
+                self.contexts.append(
+                    await self._new_context(
+                        user_agent=context_user_agent,
+                        locale=locale,
+                        timezone_id=timezone_id,
+                        proxy=context_proxies[index % len(context_proxies)] if per_context_proxies else None,
+                    )
+                )
+
+            self.context = self.contexts[0]
+            self._context_cycle = itertools.cycle(self.contexts)
             self.page = await self.context.new_page()
-            self.logger.info("Playwright initialized successfully.")
+            self.logger.info(f"Playwright initialized successfully with {len(self.contexts)} context(s).")
 
         except Exception as e:
             self.logger.error(f"Failed to initialize Playwright: {e!s}")
             raise
 
+    def next_context(self) -> BrowserContext:
+        """
+        Return the contexts in turn, to spread short-lived tabs over the pool.
+
+        Returns:
+            BrowserContext: The next context.
+        """
+        return next(self._context_cycle)
+
+    def get_context_proxy(self, context: BrowserContext) -> dict[str, str] | None:
+        """
+        The proxy a context's requests go through.
+
+        Args:
+            context (BrowserContext): A context of this manager.
+
+        Returns:
+            Optional[Dict[str, str]]: The proxy, or None for a direct connection.
+        """
+        return self.context_proxies.get(context)
+
+    async def replace_context(self, context: BrowserContext, proxy: dict[str, str]) -> BrowserContext | None:
+        """
+        Swap a context for a new one with the same settings and cookies going through another proxy.
+
+        The new context takes the old one's place in `contexts` (and `context`/`page` if it was the primary one),
+        so new pages open on it. The old context is kept open for the pages still using it and closed on cleanup.
+
+        Args:
+            context (BrowserContext): The context to replace.
+            proxy (Dict[str, str]): The proxy of the new context.
+
+        Returns:
+            Optional[BrowserContext]: The new context, or None if the context was already replaced or its proxy is
+            browser-wide.
+        """
+        async with self._replace_lock:
+            if context not in self.contexts or context not in self._context_settings:
+                return None
+
+            new_context = await self._new_context(**self._context_settings[context], proxy=proxy)
+            try:
+                await new_context.add_cookies(await context.cookies())
+            except Exception as e:
+                self.logger.warning(f"Failed to copy cookies to the replacement context: {e}")
+
+            self.contexts[self.contexts.index(context)] = new_context
+            self._retired_contexts.append(context)
+            self._context_cycle = itertools.cycle(self.contexts)
+
+            if context is self.context:
+                self.context = new_context
+                self._retired_pages.append(self.page)
+                self.page = await new_context.new_page()
+
+            self.logger.info(f"Replaced browser context {self.contexts.index(new_context)} to switch its proxy.")
+            return new_context
+
+    async def share_cookies(self):
+        """Copy the primary context's cookies (consent, odds format, ...) to the other contexts."""
+        if len(self.contexts) < 2:
+            return
+
+        cookies = await self.context.cookies()
+        if not cookies:
+            return
+
+        for context in self.contexts[1:]:
+            try:
+                await context.add_cookies(cookies)
+            except Exception as e:
+                self.logger.warning(f"Failed to copy cookies to a browser context: {e}")
+
+    async def _new_context(
+        self,
+        user_agent: str | None,
+        locale: str | None,
+        timezone_id: str | None,
+        proxy: dict[str, str] | None,
+    ) -> BrowserContext:
+        # Set English headers if no locale specified or for English locales
+        extra_headers = {}
+        if not locale or locale.startswith("en"):
+            extra_headers = {"Accept-Language": "en-US,en;q=0.9"}
+
+        context = await self.browser.new_context(
+            locale=locale if locale else "en-US",
+            timezone_id=timezone_id if timezone_id else "America/New_York",
+            user_agent=user_agent,
+            viewport={"width": random.randint(1366, 1920), "height": random.randint(768, 1080)},  # noqa: S311
+            extra_http_headers=extra_headers,
+            proxy=proxy,
+        )
+        self.context_proxies[context] = proxy or self._browser_proxy
+        if proxy:
+            self._context_settings[context] = {"user_agent": user_agent, "locale": locale, "timezone_id": timezone_id}
+        if self.rate_limiter:
+            self.rate_limiter.attach(context, self.context_proxies[context])
+
+        # The last registered route handler runs first: blocked requests never reach the cache or the archive
+        if self.har_archive:
+            await self.har_archive.attach(context)
+        if self.asset_cache:
+            await self.asset_cache.attach(context)
+        if self.resource_blocker:
+            await self.resource_blocker.attach(context)
+
+        return context
+
     async def cleanup(self):
         """Properly closes Playwright instances."""
         self.logger.info("Cleaning up Playwright resources...")
         if self.page:
             await self.page.close()
-        if self.context:
-            await self.context.close()
+        for page in self._retired_pages:
+            await page.close()
+        for context in self.contexts + self._retired_contexts:
+            await context.close()
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from typing import Any
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Page, Response
+
+
+class RequestRateLimiter:
+    """
+    Token-bucket rate limit shared by every navigation of a run.
+
+    Each host has a bucket refilled at `rate` tokens per second and holding at most `burst` tokens; a navigation takes
+    one token and waits when the bucket is empty. With `per_proxy`, every proxy gets its own buckets, since the site
+    sees each proxy as a separate client. One limiter is shared by all tabs, contexts and browser lanes, so parallel
+    work never multiplies the request rate.
+
+    Navigations go through `goto` and `reload`; contexts are registered with `attach` so the limiter knows which proxy
+    their pages use.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 3, per_proxy: bool = False):
+        """
+        Args:
+            rate (float): Requests per second allowed per host (per proxy with `per_proxy`).
+            burst (int): Requests that may go out back to back before the rate applies.
+            per_proxy (bool): Give every proxy its own buckets instead of sharing them across proxies.
+        """
+        if rate <= 0:
+            raise ValueError("Request rate must be positive.")
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.per_proxy = per_proxy
+        self._buckets: dict[tuple[str, str | None], dict[str, float]] = {}
+        self._locks: dict[tuple[str, str | None], asyncio.Lock] = {}
+        self._context_proxies: dict[BrowserContext, str | None] = {}
+        self.counters = {"requests": 0, "delayed_requests": 0, "total_wait": 0.0}
+
+    def attach(self, context: BrowserContext, proxy: dict[str, str] | None):
+        """
+        Register the proxy a context's requests go through.
+
+        Args:
+            context (BrowserContext): The context.
+            proxy (Optional[Dict[str, str]]): Its proxy, or None for a direct connection.
+        """
+        self._context_proxies[context] = proxy["server"] if proxy else None
+
+    async def acquire(self, url: str, proxy: str | None = None):
+        """
+        Wait for a token of the URL's host bucket and take it.
+
+        Args:
+            url (str): The URL about to be requested.
+            proxy (Optional[str]): Server of the proxy the request goes through; only used with `per_proxy`.
+        """
+        key = (urlparse(url).netloc, proxy if self.per_proxy else None)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            loop = asyncio.get_running_loop()
+            bucket = self._buckets.setdefault(key, {"tokens": float(self.burst), "updated_at": loop.time()})
+            self._refill(bucket, loop.time())
+
+            if bucket["tokens"] < 1:
+                delay = (1 - bucket["tokens"]) / self.rate
+                self.logger.debug(f"Waiting {delay:.2f}s before requesting {key[0]}")
+                self.counters["delayed_requests"] += 1
+                self.counters["total_wait"] += delay
+                await asyncio.sleep(delay)
+                self._refill(bucket, loop.time())
+
+            bucket["tokens"] -= 1
+            self.counters["requests"] += 1
+
+    async def goto(self, page: Page, url: str, **kwargs: Any) -> Response | None:
+        """
+        Navigate a page once the rate limit allows it.
+
+        Args:
+            page (Page): The page to navigate.
+            url (str): The destination.
+            **kwargs: Passed to `page.goto` (timeout, wait_until, ...).
+
+        Returns:
+            Optional[Response]: The response of `page.goto`.
+        """
+        await self.acquire(url, self._context_proxies.get(page.context))
+        return await page.goto(url, **kwargs)
+
+    async def reload(self, page: Page, **kwargs: Any) -> Response | None:
+        """
+        Reload a page once the rate limit allows it.
+
+        Args:
+            page (Page): The page to reload.
+            **kwargs: Passed to `page.reload`.
+
+        Returns:
+            Optional[Response]: The response of `page.reload`.
+        """
+        await self.acquire(page.url, self._context_proxies.get(page.context))
+        return await page.reload(**kwargs)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Limiter counters since it was created.
+
+        Returns:
+            Dict[str, Any]: `requests` let through, `delayed_requests` that had to wait and `total_wait` in seconds.
+        """
+        return {**self.counters, "total_wait": round(self.counters["total_wait"], 3)}
+
+    def _refill(self, bucket: dict[str, float], now: float):
+        elapsed = now - bucket["updated_at"]
+        bucket["tokens"] = min(float(self.burst), bucket["tokens"] + elapsed * self.rate)
+        bucket["updated_at"] = now
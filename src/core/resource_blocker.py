@@ -0,0 +1,140 @@
+import logging
+from typing import Any, ClassVar
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Page, Request, Route
+
+from src.utils.constants import DEFAULT_BLOCKED_DOMAINS, DEFAULT_BLOCKED_RESOURCE_TYPES
+
+
+class ResourceBlocker:
+    """
+    Aborts requests the scraper never uses (images, fonts, ads, trackers) through `context.route`.
+
+    Hosts are checked first: an allowed host is never blocked and a denied host (ads, trackers, and their iframes)
+    always is. Other requests are blocked by resource type, documents excepted. Requests that get through are
+    passed on with `route.fallback()`, so route handlers registered before this one (such as an asset cache) still
+    see them. Blocked requests are counted per page, with an estimate of the bytes they would have cost.
+    """
+
+    # Documents drive navigation: they are only ever blocked for their host
+    NEVER_BLOCKED_TYPES: ClassVar[set[str]] = {"document"}
+
+    # Typical transfer sizes used to estimate the bytes a blocked request saved (no response is ever received)
+    ESTIMATED_BYTES_BY_TYPE: ClassVar[dict[str, int]] = {
+        "image": 15_000,
+        "media": 250_000,
+        "font": 40_000,
+        "script": 60_000,
+        "stylesheet": 20_000,
+        "xhr": 5_000,
+        "fetch": 5_000,
+    }
+    DEFAULT_ESTIMATED_BYTES = 5_000
+
+    def __init__(
+        self,
+        blocked_resource_types: list[str] | None = None,
+        blocked_domains: list[str] | None = None,
+        allowed_domains: list[str] | None = None,
+        allowed_resource_types: list[str] | None = None,
+    ):
+        """
+        Args:
+            blocked_resource_types (Optional[List[str]]): Playwright resource types to block (e.g. image, font).
+                Defaults to `DEFAULT_BLOCKED_RESOURCE_TYPES`.
+            blocked_domains (Optional[List[str]]): Hosts to block, subdomains included, on top of
+                `DEFAULT_BLOCKED_DOMAINS`.
+            allowed_domains (Optional[List[str]]): Hosts never blocked, subdomains included.
+            allowed_resource_types (Optional[List[str]]): Resource types exempt from type blocking.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.blocked_resource_types = set(
+            DEFAULT_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types
+        )
+        self.blocked_domains = [*DEFAULT_BLOCKED_DOMAINS, *(blocked_domains or [])]
+        self.allowed_domains = list(allowed_domains or [])
+        self.allowed_resource_types = self.NEVER_BLOCKED_TYPES | set(allowed_resource_types or [])
+        self._page_stats: dict[Page | None, dict[str, Any]] = {}
+        self._totals = self._new_stats()
+
+    async def attach(self, context: BrowserContext):
+        """
+        Start filtering the requests of every page of a browser context.
+
+        Args:
+            context (BrowserContext): The context to filter.
+        """
+        await context.route("**/*", self._handle_route)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """
+        Whether a request is dropped.
+
+        Args:
+            url (str): The request URL.
+            resource_type (str): The Playwright resource type (document, script, image, ...).
+
+        Returns:
+            bool: True if the request must be aborted.
+        """
+        host = urlparse(url).hostname or ""
+        if self._matches_domain(host, self.allowed_domains):
+            return False
+        if self._matches_domain(host, self.blocked_domains):
+            return True
+
+        return resource_type in self.blocked_resource_types and resource_type not in self.allowed_resource_types
+
+    def pop_page_stats(self, page: Page) -> dict[str, Any]:
+        """
+        Return and reset the blocking statistics of a page, e.g. after each match it loaded.
+
+        Args:
+            page (Page): The page.
+
+        Returns:
+            Dict[str, Any]: `blocked_requests`, `estimated_bytes_saved` and `blocked_by_type` (request counts).
+        """
+        return self._page_stats.pop(page, None) or self._new_stats()
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Blocking statistics of every page since the blocker was created.
+
+        Returns:
+            Dict[str, Any]: `blocked_requests`, `estimated_bytes_saved` and `blocked_by_type` (request counts).
+        """
+        return {**self._totals, "blocked_by_type": dict(self._totals["blocked_by_type"])}
+
+    async def _handle_route(self, route: Route, request: Request):
+        if not self.should_block(request.url, request.resource_type):
+            await route.fallback()
+            return
+
+        self._record(request)
+        try:
+            await route.abort("blockedbyclient")
+        except Exception as e:
+            self.logger.debug(f"Failed to abort {request.url}: {e}")
+
+    def _record(self, request: Request):
+        try:
+            page = request.frame.page
+        except Exception:
+            # Service worker requests have no frame
+            page = None
+
+        estimated_bytes = self.ESTIMATED_BYTES_BY_TYPE.get(request.resource_type, self.DEFAULT_ESTIMATED_BYTES)
+        for stats in (self._page_stats.setdefault(page, self._new_stats()), self._totals):
+            stats["blocked_requests"] += 1
+            stats["estimated_bytes_saved"] += estimated_bytes
+            stats["blocked_by_type"][request.resource_type] = stats["blocked_by_type"].get(request.resource_type, 0) + 1
+
+    @staticmethod
+    def _matches_domain(host: str, domains: list[str]) -> bool:
+        return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+    @staticmethod
+    def _new_stats() -> dict[str, Any]:
+        return {"blocked_requests": 0, "estimated_bytes_saved": 0, "blocked_by_type": {}}
@@ -0,0 +1,137 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import random
+from typing import ClassVar, TypeVar
+
+from src.core.scrape_errors import (
+    BlockedError,
+    EmptyMarketError,
+    NavigationTimeoutError,
+    NetworkError,
+    ParseError,
+    ScrapeError,
+    as_scrape_error,
+)
+
+T = TypeVar("T")
+
+
+class RetryPolicy:
+    """
+    Retry budgets and backoff per error class.
+
+    Every error class (see `src.core.scrape_errors`) has its own retry budget and backoff bounds, so a flaky
+    connection is retried patiently while a parse failure is retried once and a block backs off for long. Delays use
+    decorrelated jitter: each one is drawn between the class's base delay and three times the previous delay of the
+    same class, capped, which spreads retries of parallel workers apart instead of synchronising them.
+
+    A policy is stateless and can be shared; each operation being retried gets its own `RetryState` from `start`.
+    """
+
+    DEFAULT_RULES: ClassVar[dict[type[ScrapeError], dict[str, float]]] = {
+        NetworkError: {"budget": 3, "base_delay": 2.0, "max_delay": 30.0},
+        NavigationTimeoutError: {"budget": 2, "base_delay": 1.0, "max_delay": 15.0},
+        ParseError: {"budget": 1, "base_delay": 0.5, "max_delay": 2.0},
+        EmptyMarketError: {"budget": 2, "base_delay": 1.0, "max_delay": 6.0},
+        BlockedError: {"budget": 1, "base_delay": 10.0, "max_delay": 60.0},
+        ScrapeError: {"budget": 1, "base_delay": 1.0, "max_delay": 5.0},
+    }
+
+    def __init__(self, rules: dict[type[ScrapeError], dict[str, float]] | None = None):
+        """
+        Args:
+            rules (Optional[Dict[Type[ScrapeError], Dict[str, float]]]): Per error class overrides of `budget`
+                (retries allowed), `base_delay` and `max_delay` (seconds), merged into `DEFAULT_RULES`.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.rules = {error_class: dict(rule) for error_class, rule in self.DEFAULT_RULES.items()}
+        for error_class, rule in (rules or {}).items():
+            self.rules.setdefault(error_class, dict(self.DEFAULT_RULES[ScrapeError])).update(rule)
+
+    def start(self) -> "RetryState":
+        """
+        Begin retrying one operation.
+
+        Returns:
+            RetryState: Tracks the retries spent and the last delay per error class.
+        """
+        return RetryState(self)
+
+    async def run(self, operation: Callable[[], Awaitable[T]], description: str) -> T:
+        """
+        Call an operation until it succeeds or the budget of the error class it fails with is spent.
+
+        Args:
+            operation (Callable[[], Awaitable[T]]): Coroutine function to call.
+            description (str): What is being retried, for the logs.
+
+        Returns:
+            T: The operation's result.
+
+        Raises:
+            Exception: The last error, unchanged, once the budget of its class is spent.
+        """
+        state = self.start()
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                error = as_scrape_error(e)
+                delay = state.next_delay(error)
+                if delay is None:
+                    raise
+                self.logger.warning(
+                    f"{description} failed ({error.label}: {error}). "
+                    f"Retrying in {delay:.1f}s ({state.describe(error)})"
+                )
+                await asyncio.sleep(delay)
+
+    def rule_for(self, error_class: type[ScrapeError]) -> dict[str, float]:
+        """The rule of an error class, or of its closest classified parent."""
+        for cls in error_class.__mro__:
+            if cls in self.rules:
+                return self.rules[cls]
+        return self.rules[ScrapeError]
+
+
+class RetryState:
+    """Retries spent by one operation under a `RetryPolicy`."""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.retries: dict[type[ScrapeError], int] = {}
+        self._previous_delays: dict[type[ScrapeError], float] = {}
+
+    def next_delay(self, error: ScrapeError | type[ScrapeError]) -> float | None:
+        """
+        Spend one retry of the error's class.
+
+        Args:
+            error (Union[ScrapeError, Type[ScrapeError]]): The error (or error class) the last attempt failed with.
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None when the class's budget is spent.
+        """
+        error_class = error if isinstance(error, type) else type(error)
+        rule = self.policy.rule_for(error_class)
+        spent = self.retries.get(error_class, 0)
+        if spent >= rule["budget"]:
+            return None
+
+        self.retries[error_class] = spent + 1
+        # Each class backs off from its own last delay, so a long block backoff does not inflate a parse retry
+        previous = self._previous_delays.get(error_class, rule["base_delay"])
+        delay = min(rule["max_delay"], random.uniform(rule["base_delay"], previous * 3))  # noqa: S311
+        self._previous_delays[error_class] = delay
+        return delay
+
+    def attempts(self, error_class: type[ScrapeError]) -> int:
+        """Retries already spent on an error class."""
+        return self.retries.get(error_class, 0)
+
+    def describe(self, error: ScrapeError | type[ScrapeError]) -> str:
+        """Budget use of the error's class, for the logs (e.g. "network retry 1/3")."""
+        error_class = error if isinstance(error, type) else type(error)
+        budget = int(self.policy.rule_for(error_class)["budget"])
+        return f"{error_class.label} retry {self.attempts(error_class)}/{budget}"
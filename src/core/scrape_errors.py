@@ -0,0 +1,83 @@
+from typing import ClassVar
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.utils.constants import TRANSIENT_ERRORS
+
+
+class ScrapeError(Exception):
+    """Base class of the errors the retry policy tells apart. Unclassified failures use it directly."""
+
+    label: ClassVar[str] = "unclassified"
+
+
+class NetworkError(ScrapeError):
+    """The connection or the proxy failed (reset, DNS, tunnel, ...)."""
+
+    label: ClassVar[str] = "network"
+
+
+class NavigationTimeoutError(ScrapeError):
+    """A navigation or a wait for page content timed out."""
+
+    label: ClassVar[str] = "timeout"
+
+
+class ParseError(ScrapeError):
+    """The page loaded but the expected content could not be found or parsed."""
+
+    label: ClassVar[str] = "parse"
+
+
+class EmptyMarketError(ScrapeError):
+    """A market tab rendered without any odds."""
+
+    label: ClassVar[str] = "empty_market"
+
+
+class BlockedError(ScrapeError):
+    """The site refused the request (HTTP 403/429, challenge page)."""
+
+    label: ClassVar[str] = "blocked"
+
+
+BLOCKED_STATUSES = {403, 429}
+
+
+def classify_error(error: BaseException) -> type[ScrapeError]:
+    """
+    Map an exception raised while scraping to its error class.
+
+    Args:
+        error (BaseException): The exception.
+
+    Returns:
+        Type[ScrapeError]: The class of the error; `ScrapeError` itself when it matches none.
+    """
+    if isinstance(error, ScrapeError):
+        return type(error)
+
+    message = str(error)
+    if isinstance(error, PlaywrightTimeoutError | TimeoutError) or "Timeout" in message:
+        return NavigationTimeoutError
+    if any(keyword in message for keyword in TRANSIENT_ERRORS):
+        return NetworkError
+    return ScrapeError
+
+
+def as_scrape_error(error: BaseException) -> ScrapeError:
+    """
+    Wrap an exception in its error class, keeping the original message and cause.
+
+    Args:
+        error (BaseException): The exception.
+
+    Returns:
+        ScrapeError: `error` itself if already classified, otherwise a new instance of its class.
+    """
+    if isinstance(error, ScrapeError):
+        return error
+
+    scrape_error = classify_error(error)(str(error))
+    scrape_error.__cause__ = error
+    return scrape_error
@@ -0,0 +1,277 @@
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterable
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import math
+import os
+import threading
+import time
+from typing import Any, ClassVar
+
+
+def summarize_durations(samples: Iterable[float]) -> dict[str, float]:
+    """
+    Count, median, 95th percentile and maximum of a non-empty set of durations.
+
+    Args:
+        samples (Iterable[float]): The durations, in seconds.
+
+    Returns:
+        Dict[str, float]: `count`, `p50`, `p95` and `max`, rounded to the millisecond.
+    """
+    ordered = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    return {"count": len(ordered), "p50": percentile(0.5), "p95": percentile(0.95), "max": round(ordered[-1], 3)}
+
+
+class ScrapeMetrics:
+    """
+    Per-stage timings, counters and gauges of a whole scraping run.
+
+    Every match records how long each of its stages took (`goto`, `header_parse`, `tab_navigation`,
+    `submarket_click`, `content_fetch`, `parse`, `history_hover`, ...) with `stage`; counters such as market retries
+    are bumped with `increment`, and current values such as the concurrency limit are set with `set_gauge`.
+    Durations go into cumulative histograms with fixed buckets, and the most recent `max_samples` of each stage are
+    kept for p50/p95. One instance is shared by every scraper, tab and browser lane of a run and can be read from
+    another thread, e.g. the Prometheus endpoint started with `serve_prometheus`.
+
+    At the end of a run, `summary` (or `write_json`) gives the JSON summary and `prometheus_text` the same
+    histograms, counters and gauges in the Prometheus text exposition format.
+    """
+
+    # Upper bounds, in seconds, of the histogram buckets; a last `+Inf` bucket holds everything
+    BUCKETS: ClassVar[tuple[float, ...]] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    METRIC_PREFIX = "oddsharvester"
+    DEFAULT_HOST = "127.0.0.1"
+    ALL_INTERFACES = "0.0.0.0"  # noqa: S104 - only bound when asked for explicitly
+
+    def __init__(self, max_samples: int = 10000):
+        """
+        Args:
+            max_samples (int): Most recent durations kept per stage for the percentiles.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_samples = max_samples
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Record the duration of the enclosed block as one sample of a stage, whether or not it raised.
+
+        The block may await: only wall time between entering and leaving it is measured.
+
+        Args:
+            name (str): The stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float):
+        """
+        Record one duration of a stage.
+
+        Args:
+            name (str): The stage.
+            seconds (float): Its duration.
+        """
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = {
+                    "buckets": [0] * (len(self.BUCKETS) + 1),
+                    "count": 0,
+                    "sum": 0.0,
+                    "max": 0.0,
+                    "samples": deque(maxlen=self.max_samples),
+                }
+            stage["buckets"][bisect_left(self.BUCKETS, seconds)] += 1
+            stage["count"] += 1
+            stage["sum"] += seconds
+            stage["max"] = max(stage["max"], seconds)
+            stage["samples"].append(seconds)
+
+    def increment(self, name: str, value: int = 1):
+        """
+        Add to a counter.
+
+        Args:
+            name (str): The counter, e.g. `market_retries`.
+            value (int): The amount to add.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counter(self, name: str) -> int:
+        """The current value of a counter (0 if it was never incremented)."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def set_gauge(self, name: str, value: float):
+        """
+        Set a gauge to its current value.
+
+        Args:
+            name (str): The gauge, e.g. `concurrency_limit`.
+            value (float): Its value.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def gauge(self, name: str) -> float | None:
+        """The current value of a gauge (None if it was never set)."""
+        with self._lock:
+            return self._gauges.get(name)
+
+    def summary(self) -> dict[str, Any]:
+        """
+        JSON-serializable summary of the run so far.
+
+        Returns:
+            Dict[str, Any]: `stages` maps each stage to its sample `count`, `total`, `mean`, `p50`, `p95` and `max`
+            in seconds and its cumulative `histogram` (bucket upper bound to count, as strings, ending with `+Inf`);
+            `counters` holds the counters and `gauges` the last value of each gauge.
+        """
+        with self._lock:
+            return {
+                "stages": {name: self._summarize(stage) for name, stage in sorted(self._stages.items())},
+                "counters": dict(sorted(self._counters.items())),
+                "gauges": dict(sorted(self._gauges.items())),
+            }
+
+    def describe(self) -> str:
+        """Human-readable summary of the slowest stages for logging."""
+        summary = self.summary()
+        stages = sorted(summary["stages"].items(), key=lambda item: item[1]["total"], reverse=True)
+        described = ", ".join(
+            f"{name} n={stage['count']} p50={stage['p50']}s p95={stage['p95']}s total={stage['total']}s"
+            for name, stage in stages
+        )
+        return f"Stage timings: {described or 'none'}; counters: {summary['counters']}; gauges: {summary['gauges']}"
+
+    def write_json(self, path: str):
+        """
+        Write the `summary` to a JSON file.
+
+        Args:
+            path (str): The file, created along with its directory if needed.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2)
+        self.logger.info(f"Stage metrics written to {path}")
+
+    def prometheus_text(self) -> str:
+        """
+        The histograms, counters and gauges in the Prometheus text exposition format.
+
+        Returns:
+            str: A `<prefix>_stage_duration_seconds` histogram labelled by `stage`, one `<prefix>_<counter>_total`
+            counter per counter and one `<prefix>_<gauge>` gauge per gauge.
+        """
+        histogram = f"{self.METRIC_PREFIX}_stage_duration_seconds"
+        lines = [
+            f"# HELP {histogram} Duration of each scraping stage of a match.",
+            f"# TYPE {histogram} histogram",
+        ]
+
+        with self._lock:
+            for name, stage in sorted(self._stages.items()):
+                cumulative = 0
+                for bound, count in zip((*self.BUCKETS, math.inf), stage["buckets"], strict=True):
+                    cumulative += count
+                    lines.append(f'{histogram}_bucket{{stage="{name}",le="{self._format_bound(bound)}"}} {cumulative}')
+                lines.append(f'{histogram}_sum{{stage="{name}"}} {stage["sum"]:.6f}')
+                lines.append(f'{histogram}_count{{stage="{name}"}} {stage["count"]}')
+
+            for name, value in sorted(self._counters.items()):
+                counter = f"{self.METRIC_PREFIX}_{name}_total"
+                lines.extend([f"# TYPE {counter} counter", f"{counter} {value}"])
+
+            for name, value in sorted(self._gauges.items()):
+                gauge = f"{self.METRIC_PREFIX}_{name}"
+                lines.extend([f"# TYPE {gauge} gauge", f"{gauge} {value:g}"])
+
+        return "\n".join(lines) + "\n"
+
+    def serve_prometheus(self, port: int, host: str = DEFAULT_HOST) -> int:
+        """
+        Serve `prometheus_text` on `/metrics` from a background thread until `stop` is called.
+
+        Args:
+            port (int): Port to listen on; 0 picks a free one.
+            host (str): Interface to listen on. Defaults to loopback only; pass `ALL_INTERFACES` to let other
+                hosts (e.g. a Prometheus server) scrape it.
+
+        Returns:
+            int: The port listened on.
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                metrics.logger.debug(f"Metrics endpoint: {format % args}")
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-endpoint", daemon=True).start()
+        bound_port = self._server.server_address[1]
+        self.logger.info(f"Serving Prometheus metrics on http://{host}:{bound_port}/metrics")
+        return bound_port
+
+    def stop(self):
+        """Stop the Prometheus endpoint, if it is running."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _summarize(self, stage: dict[str, Any]) -> dict[str, Any]:
+        # The percentiles come from the recent samples; count and max cover the whole run
+        recent = summarize_durations(stage["samples"])
+
+        cumulative = 0
+        histogram = {}
+        for bound, count in zip((*self.BUCKETS, math.inf), stage["buckets"], strict=True):
+            cumulative += count
+            histogram[self._format_bound(bound)] = cumulative
+
+        return {
+            "count": stage["count"],
+            "total": round(stage["sum"], 3),
+            "mean": round(stage["sum"] / stage["count"], 3),
+            "p50": recent["p50"],
+            "p95": recent["p95"],
+            "max": round(stage["max"], 3),
+            "histogram": histogram,
+        }
+
+    @staticmethod
+    def _format_bound(bound: float) -> str:
+        return "+Inf" if math.isinf(bound) else f"{bound:g}"
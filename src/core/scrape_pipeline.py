@@ -0,0 +1,211 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import contextmanager
+import logging
+import time
+from typing import Any
+
+from src.core.scrape_metrics import summarize_durations
+
+
+class ScrapePipeline:
+    """
+    Producer/consumer pipeline between link discovery and odds extraction.
+
+    Producers `submit` links as soon as they are discovered; a fixed pool of workers takes them from a bounded
+    queue and runs the scrape function on each. A full queue blocks producers (backpressure), links already
+    submitted are ignored (dedup on enqueue), and per-stage latencies and queue depth are recorded.
+
+    Usage:
+        async with ScrapePipeline(worker=scrape_link, worker_count=3) as pipeline:
+            await pipeline.submit_many(links)
+        results = pipeline.results()
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        worker: Callable[[str, Any], Awaitable[Any]],
+        worker_count: int = 3,
+        max_queue_size: int | None = None,
+        max_links: int | None = None,
+        keep_results: bool = True,
+    ):
+        """
+        Args:
+            worker (Callable): Coroutine function called with `(link, payload)` for every submitted link; its return
+                value is kept as the link's result (None results are dropped).
+            worker_count (int): Number of concurrent workers.
+            max_queue_size (Optional[int]): Queue capacity before producers block. Defaults to twice the workers.
+            max_links (Optional[int]): Stop accepting links once this many were submitted.
+            keep_results (bool): Keep worker results in memory for `results()`; when False only the outcome of
+                each link is kept.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.worker = worker
+        self.worker_count = max(1, worker_count)
+        self.max_links = max_links
+        self.keep_results = keep_results
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size or 2 * self.worker_count)
+        self.submitted: list[str] = []
+        self._seen: set[str] = set()
+        self._results: dict[str, Any] = {}
+        self._succeeded: dict[str, bool] = {}
+        self._workers: list[asyncio.Task] = []
+        self._stage_latencies: dict[str, list[float]] = {}
+        self._max_queue_depth = 0
+        self._queue_depth_total = 0
+        self._queue_depth_samples = 0
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.join()
+        else:
+            await self.cancel()
+
+    def start(self):
+        """Start the workers."""
+        if self._workers:
+            return
+        self._started_at = time.perf_counter()
+        self._workers = [asyncio.create_task(self._run_worker()) for _ in range(self.worker_count)]
+
+    async def submit(self, link: str, payload: Any = None) -> bool:
+        """
+        Queue a link for scraping, waiting while the queue is full.
+
+        Args:
+            link (str): The match link.
+            payload (Any): Passed to the worker along with the link.
+
+        Returns:
+            bool: False if the link was already submitted or the link limit is reached.
+        """
+        if link in self._seen or self.is_full():
+            return False
+
+        self._seen.add(link)
+        self.submitted.append(link)
+        await self.queue.put((link, payload, time.perf_counter()))
+        self._sample_queue_depth()
+        return True
+
+    async def submit_many(self, links: Iterable[str], payload: Any = None) -> int:
+        """Queue several links; returns how many were accepted."""
+        accepted = 0
+        for link in links:
+            accepted += await self.submit(link, payload)
+        return accepted
+
+    def is_full(self) -> bool:
+        """Whether the link limit has been reached."""
+        return self.max_links is not None and len(self.submitted) >= self.max_links
+
+    async def join(self):
+        """Signal that no more links will come and wait for the workers to drain the queue."""
+        for _ in self._workers:
+            await self.queue.put(self._STOP)
+        await asyncio.gather(*self._workers)
+        self._finished_at = time.perf_counter()
+        self.logger.info(self.describe())
+
+    async def cancel(self):
+        """Stop the workers without draining the queue."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._finished_at = time.perf_counter()
+
+    def results(self) -> list[Any]:
+        """The non-None worker results, in submission order (empty when results are not kept)."""
+        return [self._results[link] for link in self.submitted if link in self._results]
+
+    def failed_links(self) -> list[str]:
+        """The submitted links whose worker raised or returned None, in submission order."""
+        return [link for link in self.submitted if self._succeeded.get(link) is False]
+
+    @contextmanager
+    def stage_timer(self, stage: str):
+        """Record the duration of the enclosed block as one sample of `stage`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, time.perf_counter() - start)
+
+    def record_stage(self, stage: str, seconds: float):
+        """Record one latency sample, in seconds, for a pipeline stage."""
+        self._stage_latencies.setdefault(stage, []).append(seconds)
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Pipeline metrics.
+
+        Returns:
+            Dict[str, Any]: Link counts, queue depth (max and mean) and, per stage, the sample count and the
+            p50/p95/max latency in seconds. Stages recorded by the pipeline itself are `queue_wait` (enqueue to
+            dequeue), `scrape` (worker call) and `end_to_end` (enqueue to result).
+        """
+        end = self._finished_at or time.perf_counter()
+        return {
+            "submitted": len(self.submitted),
+            "completed": sum(self._succeeded.values()),
+            "failed": len(self._succeeded) - sum(self._succeeded.values()),
+            "max_queue_depth": self._max_queue_depth,
+            "mean_queue_depth": (
+                round(self._queue_depth_total / self._queue_depth_samples, 2) if self._queue_depth_samples else 0
+            ),
+            "elapsed": round(end - self._started_at, 3) if self._started_at else 0.0,
+            "stages": {stage: summarize_durations(samples) for stage, samples in self._stage_latencies.items()},
+        }
+
+    def describe(self) -> str:
+        """Human-readable summary of the metrics for logging."""
+        metrics = self.metrics()
+        stages = ", ".join(
+            f"{stage} p50={summary['p50']}s p95={summary['p95']}s max={summary['max']}s"
+            for stage, summary in metrics["stages"].items()
+        )
+        return (
+            f"Pipeline: {metrics['completed']}/{metrics['submitted']} links done in {metrics['elapsed']}s, "
+            f"queue depth max={metrics['max_queue_depth']} mean={metrics['mean_queue_depth']}; {stages}"
+        )
+
+    async def _run_worker(self):
+        while True:
+            item = await self.queue.get()
+            self._sample_queue_depth()
+
+            if item is self._STOP:
+                return
+
+            link, payload, enqueued_at = item
+            started_at = time.perf_counter()
+            self.record_stage("queue_wait", started_at - enqueued_at)
+
+            try:
+                result = await self.worker(link, payload)
+            except Exception as e:
+                self.logger.error(f"Pipeline worker failed on {link}: {e}")
+                result = None
+
+            self._succeeded[link] = result is not None
+            if self.keep_results and result is not None:
+                self._results[link] = result
+
+            finished_at = time.perf_counter()
+            self.record_stage("scrape", finished_at - started_at)
+            self.record_stage("end_to_end", finished_at - enqueued_at)
+
+    def _sample_queue_depth(self):
+        depth = self.queue.qsize()
+        self._max_queue_depth = max(self._max_queue_depth, depth)
+        self._queue_depth_total += depth
+        self._queue_depth_samples += 1
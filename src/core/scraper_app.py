@@ -1,33 +1,45 @@
-import asyncio
 import logging
 
+from src.core.asset_cache import AssetCache
 from src.core.browser_helper import BrowserHelper
+from src.core.crawl_checkpoint import CrawlCheckpoint
+from src.core.har_archive import HarArchive
+from src.core.job_orchestrator import JobOrchestrator
 from src.core.odds_portal_market_extractor import OddsPortalMarketExtractor
 from src.core.odds_portal_scraper import OddsPortalScraper
+from src.core.page_readiness import PageReadiness
+from src.core.page_tracer import PageTracer
 from src.core.playwright_manager import PlaywrightManager
+from src.core.request_rate_limiter import RequestRateLimiter
+from src.core.resource_blocker import ResourceBlocker
+from src.core.retry_policy import RetryPolicy
+from src.core.scrape_errors import (
+    BlockedError,
+    EmptyMarketError,
+    NavigationTimeoutError,
+    NetworkError,
+    ParseError,
+    ScrapeError,
+    classify_error,
+)
+from src.core.scrape_metrics import ScrapeMetrics
 from src.core.sport_market_registry import SportMarketRegistrar
+from src.storage.streaming_sink import StreamingSink
 from src.utils.command_enum import CommandEnum
 from src.utils.proxy_manager import ProxyManager
 
 logger = logging.getLogger("ScraperApp")
-MAX_RETRIES = 3
-RETRY_DELAY_SECONDS = 20
-TRANSIENT_ERRORS = (
-    "ERR_CONNECTION_RESET",
-    "ERR_CONNECTION_TIMED_OUT",
-    "ERR_NAME_NOT_RESOLVED",
-    "ERR_PROXY_CONNECTION_FAILED",
-    "ERR_SOCKS_CONNECTION_FAILED",
-    "ERR_CERT_AUTHORITY_INVALID",
-    "ERR_TUNNEL_CONNECTION_FAILED",
-    "ERR_NETWORK_CHANGED",
-    "Timeout",  # generic timeout from Playwright
-    "net::ERR_FAILED",
-    "net::ERR_CONNECTION_ABORTED",
-    "net::ERR_INTERNET_DISCONNECTED",
-    "Navigation timeout",
-    "TimeoutError",
-    "Target closed",
+# Whole-run retries cover failures of the connection and listing or pagination pages that time out (3 attempts, as
+# before per-class budgets); everything else is retried per match or market
+RUN_RETRY_POLICY = RetryPolicy(
+    rules={
+        NetworkError: {"budget": 2, "base_delay": 10.0, "max_delay": 60.0},
+        BlockedError: {"budget": 1, "base_delay": 30.0, "max_delay": 120.0},
+        NavigationTimeoutError: {"budget": 2, "base_delay": 10.0, "max_delay": 60.0},
+        ParseError: {"budget": 0},
+        EmptyMarketError: {"budget": 0},
+        ScrapeError: {"budget": 0},
+    }
 )
 
 
@@ -38,7 +50,7 @@ async def run_scraper(
     sport: str | None = None,
     date: str | None = None,
     leagues: list[str] | None = None,
-    season: str | None = None,
+    season: str | list[str] | None = None,
     markets: list | None = None,
     max_pages: int | None = None,
     max_matches: int | None = None,
@@ -51,41 +63,166 @@ async def run_scraper(
     headless: bool = True,
     preview_submarkets_only: bool = False,
     concurrency_tasks: int = 3,
+    max_concurrency_tasks: int | None = None,
+    use_odds_feed: bool = False,
+    checkpoint_path: str | None = None,
+    link_collection_tabs: int = 3,
+    requests_per_second: float = 1.0,
+    request_burst: int = 3,
+    per_proxy_rate_limit: bool = False,
+    parallel_jobs: int = 1,
+    browser_contexts: int = 1,
+    block_resources: bool = False,
+    blocked_resource_types: list[str] | None = None,
+    blocked_domains: list[str] | None = None,
+    allowed_domains: list[str] | None = None,
+    asset_cache_dir: str | None = None,
+    asset_cache_size_mb: int = 500,
+    record_har: str | None = None,
+    replay_har: str | None = None,
+    metrics_json: str | None = None,
+    metrics_port: int | None = None,
+    metrics_host: str = ScrapeMetrics.DEFAULT_HOST,
+    trace_file: str | None = None,
+    trace_top: int = 20,
+    result_sink: StreamingSink | None = None,
 ) -> dict:
-    """Runs the scraping process and handles execution."""
+    """
+    Runs the scraping process and handles execution.
+
+    Every league (and, for historic scraping, every season) is a separate job; up to `parallel_jobs` of them run
+    at once, each in its own browser, sharing one per-host rate limit. When a `result_sink` is given,
+    matches are written to it as they are scraped and the returned list is empty. Per-stage timings of every match
+    are logged at the end, written to `metrics_json` and, while running, served on `metrics_port` of `metrics_host`
+    (loopback unless set otherwise) for Prometheus.
+    With `trace_file`, the Playwright calls of every match page are traced to it and the slowest are logged.
+    """
     logger.info(
         f"Starting scraper with parameters: command={command}, match_links={match_links}, "
-        f"match_links_csv={match_links_csv}, sport={sport}, date={date}, leagues={leagues}, season={season}, markets={markets}, "
-        f"max_pages={max_pages}, proxies={proxies}, browser_user_agent={browser_user_agent}, "
+        f"match_links_csv={match_links_csv}, sport={sport}, date={date}, leagues={leagues}, season={season}, "
+        f"markets={markets}, max_pages={max_pages}, proxies={proxies}, browser_user_agent={browser_user_agent}, "
         f"browser_locale_timezone={browser_locale_timezone}, browser_timezone_id={browser_timezone_id}, "
         f"scrape_odds_history={scrape_odds_history}, target_bookmaker={target_bookmaker}, "
-        f"headless={headless}, preview_submarkets_only={preview_submarkets_only}, concurrency_tasks={concurrency_tasks}"
+        f"headless={headless}, preview_submarkets_only={preview_submarkets_only}, "
+        f"concurrency_tasks={concurrency_tasks}, max_concurrency_tasks={max_concurrency_tasks}, "
+        f"use_odds_feed={use_odds_feed}, "
+        f"checkpoint_path={checkpoint_path}, "
+        f"link_collection_tabs={link_collection_tabs}, requests_per_second={requests_per_second}, "
+        f"request_burst={request_burst}, per_proxy_rate_limit={per_proxy_rate_limit}, "
+        f"parallel_jobs={parallel_jobs}, browser_contexts={browser_contexts}, block_resources={block_resources}, "
+        f"blocked_resource_types={blocked_resource_types}, blocked_domains={blocked_domains}, "
+        f"allowed_domains={allowed_domains}, asset_cache_dir={asset_cache_dir}, "
+        f"asset_cache_size_mb={asset_cache_size_mb}, record_har={record_har}, replay_har={replay_har}, "
+        f"metrics_json={metrics_json}, metrics_port={metrics_port}, metrics_host={metrics_host}, "
+        f"trace_file={trace_file}, trace_top={trace_top}, "
+        f"result_sink={result_sink.file_path if result_sink else None}"
     )
 
+    seasons = [season] if isinstance(season, str) else season
     proxy_manager = ProxyManager(cli_proxies=proxies)
     SportMarketRegistrar.register_all_markets()
-    playwright_manager = PlaywrightManager()
-    browser_helper = BrowserHelper()
-    market_extractor = OddsPortalMarketExtractor(browser_helper=browser_helper)
-
-    scraper = OddsPortalScraper(
-        playwright_manager=playwright_manager,
-        browser_helper=browser_helper,
-        market_extractor=market_extractor,
-        preview_submarkets_only=preview_submarkets_only,
-        concurrency_tasks=concurrency_tasks,
-    )
+    crawl_checkpoint = None
+    # Shared by every browser lane so parallel jobs do not multiply the request rate per host
+    rate_limiter = RequestRateLimiter(rate=requests_per_second, burst=request_burst, per_proxy=per_proxy_rate_limit)
+    resource_blocker = None
+    asset_cache = None
+    har_archive = None
+    # Shared by every browser lane so the histograms cover the whole run
+    metrics = ScrapeMetrics()
+    tracer = PageTracer() if trace_file else None
+
+    if replay_har:
+        har_archive = HarArchive(har_dir=replay_har, replay=True)
+    elif record_har:
+        har_archive = HarArchive(har_dir=record_har)
+
+    if asset_cache_dir:
+        asset_cache = AssetCache(cache_dir=asset_cache_dir, max_bytes=asset_cache_size_mb * 1024 * 1024)
+
+    if block_resources:
+        resource_blocker = ResourceBlocker(
+            blocked_resource_types=blocked_resource_types,
+            blocked_domains=blocked_domains,
+            allowed_domains=allowed_domains,
+        )
 
-    try:
-        proxy_config = proxy_manager.get_current_proxy()
-        await scraper.start_playwright(
+    if checkpoint_path:
+        crawl_checkpoint = CrawlCheckpoint(
+            db_path=checkpoint_path,
+            run_key=CrawlCheckpoint.build_run_key(
+                command=command,
+                match_links=match_links,
+                match_links_csv=match_links_csv,
+                sport=sport,
+                date=date,
+                leagues=leagues,
+                # Single-season runs keep the key they had before seasons could be combined
+                season=seasons[0] if seasons and len(seasons) == 1 else seasons,
+                markets=markets,
+                max_pages=max_pages,
+                max_matches=max_matches,
+                target_bookmaker=target_bookmaker,
+                scrape_odds_history=scrape_odds_history,
+                preview_submarkets_only=preview_submarkets_only,
+            ),
+        )
+
+    def build_scraper() -> OddsPortalScraper:
+        page_readiness = PageReadiness()
+        browser_helper = BrowserHelper(page_readiness=page_readiness)
+        return OddsPortalScraper(
+            playwright_manager=PlaywrightManager(),
+            browser_helper=browser_helper,
+            market_extractor=OddsPortalMarketExtractor(
+                browser_helper=browser_helper, page_readiness=page_readiness, rate_limiter=rate_limiter, metrics=metrics
+            ),
+            preview_submarkets_only=preview_submarkets_only,
+            concurrency_tasks=concurrency_tasks,
+            max_concurrency_tasks=max_concurrency_tasks,
+            use_odds_feed=use_odds_feed,
+            crawl_checkpoint=crawl_checkpoint,
+            result_sink=result_sink,
+            link_collection_tabs=link_collection_tabs,
+            rate_limiter=rate_limiter,
+            proxy_manager=proxy_manager,
+            metrics=metrics,
+            tracer=tracer,
+        )
+
+    async def start_scraper(lane_scraper: OddsPortalScraper):
+        await lane_scraper.start_playwright(
             headless=headless,
             browser_user_agent=browser_user_agent,
             browser_locale_timezone=browser_locale_timezone,
             browser_timezone_id=browser_timezone_id,
-            proxy=proxy_config,
+            browser_contexts=browser_contexts,
+            # Each context gets its own proxy so a failing one can be swapped without restarting the browser
+            context_proxies=proxy_manager.select_proxies(browser_contexts),
+            resource_blocker=resource_blocker,
+            asset_cache=asset_cache,
+            har_archive=har_archive,
         )
 
+    async def create_lane_scraper() -> OddsPortalScraper:
+        lane_scraper = build_scraper()
+        try:
+            await start_scraper(lane_scraper)
+        except Exception:
+            await lane_scraper.stop_playwright()
+            raise
+        return lane_scraper
+
+    scraper = build_scraper()
+    orchestrator = JobOrchestrator(
+        create_scraper=create_lane_scraper, max_parallel_jobs=parallel_jobs, scrapers=[scraper]
+    )
+
+    try:
+        if metrics_port:
+            metrics.serve_prometheus(metrics_port, host=metrics_host)
+
+        await start_scraper(scraper)
+
         # Load match links from CSVs/directories if provided
         if not match_links and match_links_csv:
             loaded_links = await _load_match_links_from_csv_inputs(match_links_csv)
@@ -110,33 +247,18 @@ async def run_scraper(
             )
 
         if command == CommandEnum.HISTORIC:
-            if not sport or not leagues or not season:
+            if not sport or not leagues or not seasons:
                 raise ValueError("Both 'sport', 'leagues' and 'season' must be provided for historic scraping.")
 
             logger.info(f"""
-                Scraping historical odds for sport={sport}, leagues={leagues}, season={season}, markets={markets},
+                Scraping historical odds for sport={sport}, leagues={leagues}, seasons={seasons}, markets={markets},
                 scrape_odds_history={scrape_odds_history}, target_bookmaker={target_bookmaker}, max_pages={max_pages}
             """)
 
-            if len(leagues) == 1:
+            async def run_historic_job(lane_scraper: OddsPortalScraper, job: dict) -> list[dict] | None:
                 return await retry_scrape(
-                    scraper.scrape_historic,
-                    sport=sport,
-                    league=leagues[0],
-                    season=season,
-                    markets=markets,
-                    scrape_odds_history=scrape_odds_history,
-                    target_bookmaker=target_bookmaker,
-                    max_pages=max_pages,
-                    max_matches=max_matches,
-                )
-            else:
-                return await _scrape_multiple_leagues(
-                    scraper=scraper,
-                    scrape_func=scraper.scrape_historic,
-                    leagues=leagues,
-                    sport=sport,
-                    season=season,
+                    lane_scraper.scrape_historic,
+                    **job,
                     markets=markets,
                     scrape_odds_history=scrape_odds_history,
                     target_bookmaker=target_bookmaker,
@@ -144,6 +266,11 @@ async def run_scraper(
                     max_matches=max_matches,
                 )
 
+            return await orchestrator.run(
+                jobs=JobOrchestrator.build_jobs(sport=sport, leagues=leagues, seasons=seasons),
+                run_job=run_historic_job,
+            )
+
         elif command == CommandEnum.UPCOMING_MATCHES:
             if not date and not leagues:
                 raise ValueError("Either 'date' or 'leagues' must be provided for upcoming matches scraping.")
@@ -154,29 +281,20 @@ async def run_scraper(
                     scrape_odds_history={scrape_odds_history}, target_bookmaker={target_bookmaker}
                 """)
 
-                if len(leagues) == 1:
+                async def run_upcoming_job(lane_scraper: OddsPortalScraper, job: dict) -> list[dict] | None:
                     return await retry_scrape(
-                        scraper.scrape_upcoming,
-                        sport=sport,
-                        date=date,
-                        league=leagues[0],
-                        markets=markets,
-                        scrape_odds_history=scrape_odds_history,
-                        target_bookmaker=target_bookmaker,
-                        max_matches=max_matches,
-                    )
-                else:
-                    return await _scrape_multiple_leagues(
-                        scraper=scraper,
-                        scrape_func=scraper.scrape_upcoming,
-                        leagues=leagues,
-                        sport=sport,
-                        date=date,
+                        lane_scraper.scrape_upcoming,
+                        **job,
                         markets=markets,
                         scrape_odds_history=scrape_odds_history,
                         target_bookmaker=target_bookmaker,
                         max_matches=max_matches,
                     )
+
+                return await orchestrator.run(
+                    jobs=JobOrchestrator.build_jobs(sport=sport, leagues=leagues, date=date),
+                    run_job=run_upcoming_job,
+                )
             else:
                 logger.info(f"""
                     Scraping upcoming matches for sport={sport}, date={date}, markets={markets},
@@ -201,7 +319,36 @@ async def run_scraper(
         return None
 
     finally:
+        await orchestrator.close()
         await scraper.stop_playwright()
+        if resource_blocker:
+            summary = resource_blocker.summary()
+            logger.info(
+                f"Resource blocking saved {summary['blocked_requests']} requests "
+                f"(~{summary['estimated_bytes_saved'] / 1024 / 1024:.1f} MiB): {summary['blocked_by_type']}"
+            )
+        if asset_cache:
+            stats = asset_cache.stats()
+            logger.info(
+                f"Asset cache: {stats['hits']} hits, {stats['revalidated']} revalidated, {stats['misses']} misses; "
+                f"{stats['bytes_from_cache'] / 1024 / 1024:.1f} MiB served from disk, "
+                f"{stats['bytes_from_network'] / 1024 / 1024:.1f} MiB fetched"
+            )
+            asset_cache.close()
+        if proxy_manager.proxies:
+            logger.info(f"Proxy health: {proxy_manager.summary()}")
+        logger.info(f"Rate limiter: {rate_limiter.stats()}")
+        if har_archive:
+            logger.info(f"HAR archive: {har_archive.stats()}")
+        logger.info(metrics.describe())
+        if metrics_json:
+            metrics.write_json(metrics_json)
+        metrics.stop()
+        if tracer:
+            tracer.write(trace_file)
+            logger.info(tracer.describe_slowest(trace_top))
+        if crawl_checkpoint:
+            crawl_checkpoint.close()
 
 
 async def _load_match_links_from_csv_inputs(paths: list[str]) -> list[str]:
@@ -250,68 +397,12 @@ async def _load_match_links_from_csv_inputs(paths: list[str]) -> list[str]:
     return urls
 
 
-async def _scrape_multiple_leagues(scraper, scrape_func, leagues: list[str], sport: str, **kwargs) -> list[dict]:
-    """
-    Helper function to handle multi-league scraping with error handling and logging.
-
-    Args:
-        scraper: The scraper instance
-        scrape_func: The function to call for each league (scrape_historic or scrape_upcoming)
-        leagues: List of leagues to scrape
-        sport: The sport being scraped
-        **kwargs: Additional arguments to pass to the scrape function
-
-    Returns:
-        List of combined results from all leagues
-    """
-    all_results = []
-    failed_leagues = []
-
-    logger.info(f"Starting multi-league scraping for {len(leagues)} leagues: {leagues}")
-
-    for i, league in enumerate(leagues, 1):
-        try:
-            logger.info(f"[{i}/{len(leagues)}] Processing league: {league}")
-
-            league_data = await retry_scrape(scrape_func, sport=sport, league=league, **kwargs)
-
-            if league_data:
-                all_results.extend(league_data)
-                logger.info(f"Successfully scraped {len(league_data)} matches from league: {league}")
-            else:
-                logger.warning(f"No data returned for league: {league}")
-
-        except Exception as e:
-            logger.error(f"Failed to scrape league '{league}': {e}")
-            failed_leagues.append(league)
-            continue
-
-    total_matches = len(all_results)
-    successful_leagues = len(leagues) - len(failed_leagues)
-
-    if failed_leagues:
-        logger.warning(f"Failed to scrape {len(failed_leagues)} leagues: {failed_leagues}")
-
-    logger.info(
-        f"Multi-league scraping completed: {successful_leagues}/{len(leagues)} leagues successful, "
-        f"{total_matches} total matches scraped"
-    )
-
-    return all_results
-
-
 async def retry_scrape(scrape_func, *args, **kwargs):
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            return await scrape_func(*args, **kwargs)
-        except Exception as e:
-            if any(keyword in str(e) for keyword in TRANSIENT_ERRORS):
-                logger.warning(
-                    f"[Attempt {attempt}] Transient error detected: {e}. Retrying in {RETRY_DELAY_SECONDS}s..."
-                )
-                await asyncio.sleep(RETRY_DELAY_SECONDS)
-            else:
-                logger.error(f"Non-retryable error encountered: {e}")
-                raise
-    logger.error("Max retries exceeded.")
-    return None
+    try:
+        return await RUN_RETRY_POLICY.run(lambda: scrape_func(*args, **kwargs), description="Scrape")
+    except Exception as e:
+        if RUN_RETRY_POLICY.rule_for(classify_error(e))["budget"] > 0:
+            logger.error(f"Max retries exceeded: {e}")
+            return None
+        logger.error(f"Non-retryable error encountered: {e}")
+        raise
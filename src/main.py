@@ -4,7 +4,10 @@ import sys
 
 from src.cli.cli_argument_handler import CLIArgumentHandler
 from src.core.scraper_app import run_scraper
+from src.storage.csv_layout import CsvLayout
+from src.storage.storage_format import StorageFormat
 from src.storage.storage_manager import store_data
+from src.storage.streaming_sink import create_streaming_sink
 from src.utils.setup_logging import setup_logger
 
 
@@ -17,36 +20,80 @@ def main():
         args = CLIArgumentHandler().parse_and_validate_args()
         logger.info(f"Parsed arguments: {args}")
 
-        scraped_data = asyncio.run(
-            run_scraper(
-                command=args["command"],
-                match_links=args["match_links"],
-                match_links_csv=args["match_links_csv"],
-                sport=args["sport"],
-                date=args["date"],
-                leagues=args["leagues"],
-                season=args["season"],
-                markets=args["markets"],
-                max_pages=args["max_pages"],
-                max_matches=args["max_matches"],
-                proxies=args["proxies"],
-                browser_user_agent=args["browser_user_agent"],
-                browser_locale_timezone=args["browser_locale_timezone"],
-                browser_timezone_id=args["browser_timezone_id"],
-                target_bookmaker=args["target_bookmaker"],
-                scrape_odds_history=args["scrape_odds_history"],
-                headless=args["headless"],
-                preview_submarkets_only=args["preview_submarkets_only"],
-                concurrency_tasks=args["concurrency_tasks"],
+        # Streamed runs write each match as it completes instead of storing everything at the end
+        result_sink = None
+        if args["stream_results"]:
+            result_sink = create_streaming_sink(
+                file_path=args["file_path"] or "scraped_data",
+                storage_format=StorageFormat(args["storage_format"]),
+                compact=args["compact_json"],
+                csv_layout=CsvLayout(args["csv_layout"]),
             )
-        )
 
-        if scraped_data:
+        try:
+            scraped_data = asyncio.run(
+                run_scraper(
+                    command=args["command"],
+                    match_links=args["match_links"],
+                    match_links_csv=args["match_links_csv"],
+                    sport=args["sport"],
+                    date=args["date"],
+                    leagues=args["leagues"],
+                    season=args["season"],
+                    markets=args["markets"],
+                    max_pages=args["max_pages"],
+                    max_matches=args["max_matches"],
+                    proxies=args["proxies"],
+                    browser_user_agent=args["browser_user_agent"],
+                    browser_locale_timezone=args["browser_locale_timezone"],
+                    browser_timezone_id=args["browser_timezone_id"],
+                    target_bookmaker=args["target_bookmaker"],
+                    scrape_odds_history=args["scrape_odds_history"],
+                    headless=args["headless"],
+                    preview_submarkets_only=args["preview_submarkets_only"],
+                    concurrency_tasks=args["concurrency_tasks"],
+                    max_concurrency_tasks=args["max_concurrency_tasks"],
+                    use_odds_feed=args["use_odds_feed"],
+                    checkpoint_path=args["checkpoint_path"],
+                    parallel_jobs=args["parallel_jobs"],
+                    browser_contexts=args["browser_contexts"],
+                    block_resources=args["block_resources"],
+                    blocked_resource_types=args["blocked_resource_types"],
+                    blocked_domains=args["blocked_domains"],
+                    allowed_domains=args["allowed_domains"],
+                    asset_cache_dir=args["asset_cache_dir"],
+                    asset_cache_size_mb=args["asset_cache_size_mb"],
+                    link_collection_tabs=args["link_collection_tabs"],
+                    requests_per_second=args["requests_per_second"],
+                    request_burst=args["request_burst"],
+                    per_proxy_rate_limit=args["per_proxy_rate_limit"],
+                    record_har=args["record_har"],
+                    replay_har=args["replay_har"],
+                    metrics_json=args["metrics_json"],
+                    metrics_port=args["metrics_port"],
+                    metrics_host=args["metrics_host"],
+                    trace_file=args["trace_file"],
+                    trace_top=args["trace_top"],
+                    result_sink=result_sink,
+                )
+            )
+        finally:
+            if result_sink:
+                result_sink.close()
+
+        if result_sink:
+            if not result_sink.records_written:
+                logger.error("Scraper did not stream any data.")
+                sys.exit(1)
+
+        elif scraped_data:
             store_data(
                 storage_type=args["storage_type"],
                 data=scraped_data,
                 storage_format=args["storage_format"],
                 file_path=args["file_path"],
+                compact=args["compact_json"],
+                csv_layout=CsvLayout(args["csv_layout"]),
             )
         else:
             logger.error("Scraper did not return valid data.")
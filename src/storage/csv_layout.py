@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CsvLayout(Enum):
+    WIDE = "wide"  # One row per match, market odds as JSON cells
+    LONG = "long"  # One row per match x market x bookmaker
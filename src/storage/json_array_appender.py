@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+from typing import Any
+
+
+class JsonArrayAppender:
+    """
+    Appends records to a JSON array file in place.
+
+    Instead of loading the existing array and dumping everything again, the file is opened for update, the
+    closing bracket is located from the end and the new records are written over it followed by a new bracket.
+    A save therefore costs O(new records) whatever the size of the file.
+    """
+
+    INDENT = 4
+    _TAIL_CHUNK_SIZE = 64
+
+    def __init__(self, file_path: str, compact: bool = False):
+        """
+        Args:
+            file_path (str): The JSON file holding a top-level array.
+            compact (bool): Write records without indentation or extra whitespace.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.file_path = file_path
+        self.compact = compact
+
+    def append(self, records: list[dict[str, Any]]):
+        """
+        Append records to the array, creating the file if needed.
+
+        A file that does not end with a JSON array is replaced by a new array holding the records.
+
+        Args:
+            records (List[Dict[str, Any]]): The records to append.
+        """
+        if not records:
+            return
+
+        body = self._serialize(records)
+
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+            self._write_new(body)
+            return
+
+        with open(self.file_path, "r+b") as file:
+            tail = self._locate_tail(file)
+
+            if tail is None:
+                self.logger.warning(f"File {self.file_path} exists but does not end with a JSON array, replacing it.")
+                file.seek(0)
+                file.truncate()
+                file.write(self._wrap(body).encode("utf-8"))
+                return
+
+            insert_at, is_empty = tail
+            file.seek(insert_at)
+            file.truncate()
+            separator = "" if is_empty else ","
+            newline = "" if self.compact else "\n"
+            file.write(f"{separator}{newline}{body}{newline}]".encode())
+
+    def _serialize(self, records: list[dict[str, Any]]) -> str:
+        """Serialize records as array items, formatted as `json.dump` would inside the array."""
+        if self.compact:
+            return json.dumps(records, separators=(",", ":"))[1:-1]
+        # Strip the brackets and their newlines, keeping the items' indentation
+        return json.dumps(records, indent=self.INDENT)[2:-2]
+
+    def _wrap(self, body: str) -> str:
+        return f"[{body}]" if self.compact else f"[\n{body}\n]"
+
+    def _write_new(self, body: str):
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            file.write(self._wrap(body))
+
+    def _locate_tail(self, file) -> tuple[int, bool] | None:
+        """
+        Find where to write new items.
+
+        Returns:
+            Optional[Tuple[int, bool]]: The offset just after the last item (or after `[` for an empty array) and
+            whether the array is empty, or None if the file does not end with `]`.
+        """
+        closing = self._previous_non_whitespace(file, os.fstat(file.fileno()).st_size)
+        if closing is None or closing[1] != b"]":
+            return None
+
+        previous = self._previous_non_whitespace(file, closing[0])
+        if previous is None:
+            return None
+
+        return previous[0] + 1, previous[1] == b"["
+
+    def _previous_non_whitespace(self, file, end: int) -> tuple[int, bytes] | None:
+        """Return the offset and value of the last non-whitespace byte before `end`, reading backwards in chunks."""
+        while end > 0:
+            start = max(0, end - self._TAIL_CHUNK_SIZE)
+            file.seek(start)
+            chunk = file.read(end - start)
+            stripped = chunk.rstrip()
+            if stripped:
+                offset = start + len(stripped) - 1
+                return offset, stripped[-1:]
+            end = start
+        return None
@@ -1,9 +1,11 @@
-import csv
-import json
 import logging
 import os
 
+from .csv_layout import CsvLayout
+from .json_array_appender import JsonArrayAppender
+from .schema_csv_writer import SchemaCsvWriter
 from .storage_format import StorageFormat
+from .streaming_sink import create_streaming_sink
 
 
 class LocalDataStorage:
@@ -26,7 +28,12 @@ class LocalDataStorage:
         self.default_storage_format = default_storage_format
 
     def save_data(
-        self, data: dict | list[dict], file_path: str | None = None, storage_format: StorageFormat | None = None
+        self,
+        data: dict | list[dict],
+        file_path: str | None = None,
+        storage_format: StorageFormat | None = None,
+        compact: bool = False,
+        csv_layout: CsvLayout = CsvLayout.WIDE,
     ):
         """
         Save scraped data to a local CSV file.
@@ -36,6 +43,8 @@ class LocalDataStorage:
             file_path (str, optional): The file path to save the data. Defaults to `self.default_file_path`.
             storage_format (StorageFormat, optional): The format to save the data in ("csv" or "json").
             Defaults to `self.default_storage_format`.
+            compact (bool): Write JSON without indentation.
+            csv_layout (CsvLayout): Write CSV with one row per match (wide) or per match, market and bookmaker (long).
 
         Raises:
             ValueError: If the data is not in the correct format (dict or list of dicts).
@@ -61,57 +70,46 @@ class LocalDataStorage:
         self._ensure_directory_exists(target_file_path)
 
         if format_to_use == StorageFormat.CSV.value:
-            self._save_as_csv(data, target_file_path)
+            self._save_as_csv(data, target_file_path, csv_layout)
         elif format_to_use == StorageFormat.JSON.value:
-            self._save_as_json(data, target_file_path)
+            self._save_as_json(data, target_file_path, compact)
+        elif format_to_use in (StorageFormat.JSONL.value, StorageFormat.PARQUET.value):
+            self._save_with_sink(data, target_file_path, StorageFormat(format_to_use))
         else:
             raise ValueError("Unsupported file format.")
 
-    def _save_as_csv(self, data: list[dict], file_path: str):
-        """Save data in CSV format."""
+    def _save_as_csv(self, data: list[dict], file_path: str, csv_layout: CsvLayout = CsvLayout.WIDE):
+        """Append data in CSV format, keeping the columns of existing rows aligned with the header."""
+        writer = SchemaCsvWriter(file_path, layout=csv_layout)
         try:
-            # Collect all unique fieldnames from all records
-            all_fieldnames = set()
-            for record in data:
-                all_fieldnames.update(record.keys())
-            
-            # Sort fieldnames for consistent column order
-            fieldnames = sorted(all_fieldnames)
-            
-            with open(file_path, mode="a", newline="", encoding="utf-8") as file:
-                writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
-
-                # Write header only if the file is newly created
-                if os.path.getsize(file_path) == 0:
-                    writer.writeheader()
-
-                writer.writerows(data)
-
-            self.logger.info(f"Successfully saved {len(data)} record(s) to {file_path}")
+            rows_written = writer.write_records(data)
+            self.logger.info(f"Successfully saved {len(data)} record(s) ({rows_written} row(s)) to {file_path}")
 
         except Exception as e:
             self.logger.error(f"Error saving data to {file_path}: {e!s}", exc_info=True)
             raise
 
-    def _save_as_json(self, data: list[dict], file_path: str):
-        """Save data in JSON format."""
-        try:
-            # Load existing data if the file already exists
-            existing_data = []
+        finally:
+            writer.close()
 
-            if os.path.exists(file_path):
-                with open(file_path, encoding="utf-8") as file:
-                    try:
-                        existing_data = json.load(file)
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"File {file_path} exists but is empty or invalid JSON.")
+    def _save_as_json(self, data: list[dict], file_path: str, compact: bool = False):
+        """Append data to the JSON array in the file, without reading or rewriting the existing records."""
+        try:
+            JsonArrayAppender(file_path, compact=compact).append(data)
+            self.logger.info(f"Successfully saved {len(data)} record(s) to {file_path}")
 
-            combined_data = existing_data + data
+        except Exception as e:
+            self.logger.error(f"Error saving data to {file_path}: {e!s}", exc_info=True)
+            raise
 
-            with open(file_path, "w", encoding="utf-8") as file:
-                json.dump(combined_data, file, indent=4)
+    def _save_with_sink(self, data: list[dict], file_path: str, storage_format: StorageFormat):
+        """Save data through the streaming sink of a record-oriented format (JSON Lines, Parquet)."""
+        try:
+            with create_streaming_sink(file_path, storage_format) as sink:
+                for record in data:
+                    sink.write(record)
 
-            self.logger.info(f"Successfully saved {len(data)} record(s) to {file_path}")
+            self.logger.info(f"Successfully saved {len(data)} record(s) to {sink.file_path}")
 
         except Exception as e:
             self.logger.error(f"Error saving data to {file_path}: {e!s}", exc_info=True)
@@ -0,0 +1,183 @@
+import csv
+import json
+import logging
+import os
+from typing import Any
+
+from .csv_layout import CsvLayout
+
+MARKET_KEY_SUFFIX = "_market"
+
+
+def serialize_value(value: Any) -> Any:
+    """Flatten a record value for tabular output: nested lists and dicts become JSON strings."""
+    if isinstance(value, list | dict):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+def explode_record(record: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Normalize a scraped match into one row per market and bookmaker.
+
+    Match fields are repeated on every row, `market` holds the market name (e.g. `over_under_2_5`) and the
+    bookmaker's odds fields follow. A match without any market odds yields a single row of match fields.
+
+    Args:
+        record (Dict[str, Any]): A scraped match, with market odds under `<market>_market` keys.
+
+    Returns:
+        List[Dict[str, Any]]: The long-layout rows.
+    """
+    match_fields = {key: value for key, value in record.items() if not key.endswith(MARKET_KEY_SUFFIX)}
+    rows = []
+
+    for key, market_odds in record.items():
+        if not key.endswith(MARKET_KEY_SUFFIX) or not market_odds:
+            continue
+
+        market = key[: -len(MARKET_KEY_SUFFIX)]
+        for bookmaker_odds in market_odds if isinstance(market_odds, list) else [market_odds]:
+            row = {**match_fields, "market": market}
+            if isinstance(bookmaker_odds, dict):
+                row.update(bookmaker_odds)
+            else:
+                row["odds"] = bookmaker_odds
+            rows.append(row)
+
+    return rows or [match_fields]
+
+
+class SchemaCsvWriter:
+    """
+    CSV writer that keeps every appended row aligned with the file header.
+
+    The column list is kept in a sidecar `<file>.schema.json`. Rows are appended under that schema; when a
+    record brings new columns, they are added at the end and the existing file is rewritten once (streamed
+    row by row) with the widened header, so files never end up with rows of different shapes. Nested values
+    are written as JSON rather than Python reprs.
+    """
+
+    SCHEMA_SUFFIX = ".schema.json"
+
+    def __init__(self, file_path: str, layout: CsvLayout = CsvLayout.WIDE):
+        """
+        Args:
+            file_path (str): The CSV file path.
+            layout (CsvLayout): One row per match (wide) or per match, market and bookmaker (long).
+
+        Raises:
+            ValueError: If the file was written with another layout.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.file_path = file_path
+        self.schema_path = f"{file_path}{self.SCHEMA_SUFFIX}"
+        self.layout = layout
+        self.columns = self._load_columns()
+        self._file = None
+        self._writer = None
+
+    def write_records(self, records: list[dict[str, Any]]) -> int:
+        """
+        Append scraped matches to the file, widening the schema first if they carry new columns.
+
+        Args:
+            records (List[Dict[str, Any]]): The scraped matches.
+
+        Returns:
+            int: The number of CSV rows written.
+        """
+        rows = [row for record in records for row in self._to_rows(record)]
+        if not rows:
+            return 0
+
+        new_columns = self._new_columns(rows)
+        if new_columns:
+            self._widen(new_columns)
+
+        writer = self._get_writer()
+        writer.writerows({key: serialize_value(value) for key, value in row.items()} for row in rows)
+        self._file.flush()
+        return len(rows)
+
+    def close(self):
+        """Close the underlying file."""
+        if self._file:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def _to_rows(self, record: dict[str, Any]) -> list[dict[str, Any]]:
+        return explode_record(record) if self.layout == CsvLayout.LONG else [record]
+
+    def _new_columns(self, rows: list[dict[str, Any]]) -> list[str]:
+        known = set(self.columns)
+        seen = dict.fromkeys(key for row in rows for key in row if key not in known)
+        # New files get sorted columns, as before; later additions are sorted among themselves
+        return sorted(seen)
+
+    def _widen(self, new_columns: list[str]):
+        old_columns = self.columns
+        self.columns = old_columns + new_columns
+        self.close()
+
+        if self._has_rows():
+            self.logger.info(f"Widening CSV schema of {self.file_path} with {new_columns}, rewriting the file once.")
+            self._rewrite_with_columns(old_columns)
+        else:
+            with open(self.file_path, "w", newline="", encoding="utf-8") as file:
+                csv.writer(file).writerow(self.columns)
+
+        self._save_schema()
+
+    def _rewrite_with_columns(self, old_columns: list[str]):
+        temp_path = f"{self.file_path}.tmp"
+        padding = [""] * (len(self.columns) - len(old_columns))
+
+        with (
+            open(self.file_path, newline="", encoding="utf-8") as source,
+            open(temp_path, "w", newline="", encoding="utf-8") as target,
+        ):
+            reader = csv.reader(source)
+            writer = csv.writer(target)
+            next(reader, None)
+            writer.writerow(self.columns)
+            for row in reader:
+                writer.writerow(row + padding)
+
+        os.replace(temp_path, self.file_path)
+
+    def _get_writer(self) -> csv.DictWriter:
+        if self._writer is None:
+            self._file = open(self.file_path, "a", newline="", encoding="utf-8")  # noqa: SIM115 - closed in close()
+            self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+        return self._writer
+
+    def _has_rows(self) -> bool:
+        return os.path.exists(self.file_path) and os.path.getsize(self.file_path) > 0
+
+    def _load_columns(self) -> list[str]:
+        # A sidecar left next to a deleted or emptied CSV is stale: start over, header included
+        if not self._has_rows():
+            return []
+
+        if os.path.exists(self.schema_path):
+            with open(self.schema_path, encoding="utf-8") as file:
+                schema = json.load(file)
+
+            if schema.get("layout", CsvLayout.WIDE.value) != self.layout.value:
+                raise ValueError(
+                    f"{self.file_path} was written with the '{schema.get('layout')}' CSV layout, "
+                    f"not '{self.layout.value}'."
+                )
+            return list(schema.get("columns", []))
+
+        # Files written before the sidecar existed: adopt their header
+        with open(self.file_path, newline="", encoding="utf-8") as file:
+            return next(csv.reader(file), [])
+
+    def _save_schema(self):
+        temp_path = f"{self.schema_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"layout": self.layout.value, "columns": self.columns}, file, indent=4)
+        os.replace(temp_path, self.schema_path)
@@ -4,3 +4,5 @@ from enum import Enum
 class StorageFormat(Enum):
     CSV = "csv"
     JSON = "json"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
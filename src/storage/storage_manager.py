@@ -1,13 +1,25 @@
 import logging
 
+from src.storage.csv_layout import CsvLayout
 from src.storage.storage_format import StorageFormat
 from src.storage.storage_type import StorageType
 
 logger = logging.getLogger("StorageManager")
 
 
-def store_data(storage_type: StorageType, data: list, storage_format: StorageFormat, file_path: str):
-    """Handles storing data in the chosen storage type."""
+def store_data(
+    storage_type: StorageType,
+    data: list,
+    storage_format: StorageFormat,
+    file_path: str,
+    compact: bool = False,
+    csv_layout: CsvLayout = CsvLayout.WIDE,
+):
+    """
+    Handles storing data in the chosen storage type.
+
+    `compact` writes local JSON without indentation; `csv_layout` picks the row layout of local CSV files.
+    """
     try:
         storage_enum = StorageType(storage_type)
         storage = storage_enum.get_storage_instance()
@@ -15,7 +27,9 @@ def store_data(storage_type: StorageType, data: list, storage_format: StorageFor
         if storage_type == StorageType.REMOTE.value:
             storage.process_and_upload(data=data, file_path=file_path)
         else:
-            storage.save_data(data=data, file_path=file_path, storage_format=storage_format)
+            storage.save_data(
+                data=data, file_path=file_path, storage_format=storage_format, compact=compact, csv_layout=csv_layout
+            )
 
         logger.info(f"Successfully stored {len(data)} records.")
         return True
@@ -0,0 +1,270 @@
+from abc import ABC, abstractmethod
+import json
+import logging
+import os
+from typing import Any
+
+from .csv_layout import CsvLayout
+from .json_array_appender import JsonArrayAppender
+from .schema_csv_writer import SchemaCsvWriter, serialize_value
+from .storage_format import StorageFormat
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+    pq = None
+
+
+class StreamingSink(ABC):
+    """
+    Writes scraped matches one by one as they complete, instead of holding the whole run in memory.
+
+    Subclasses implement `_write` and `_close`; records are flushed as they are written so partial output is usable
+    while the scraper is still running. Sinks append to existing files, so resumed runs keep earlier output.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path (str): The output file path.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.file_path = file_path
+        self.records_written = 0
+        self._closed = False
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, record: dict[str, Any]):
+        """
+        Write one scraped match.
+
+        Args:
+            record (Dict[str, Any]): The match data.
+        """
+        if self._closed:
+            raise RuntimeError(f"Cannot write to closed sink {self.file_path}")
+
+        self._write(record)
+        self.records_written += 1
+
+    def close(self):
+        """Flush pending output and release the file."""
+        if not self._closed:
+            self._close()
+            self._closed = True
+            self.logger.info(f"Streamed {self.records_written} record(s) to {self.file_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @abstractmethod
+    def _write(self, record: dict[str, Any]):
+        """Write one record to the output."""
+
+    @abstractmethod
+    def _close(self):
+        """Flush pending output and release the output file."""
+
+
+class JsonLinesSink(StreamingSink):
+    """One JSON object per line; every line is a complete record as soon as it is written."""
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._file = open(file_path, "a", encoding="utf-8")  # noqa: SIM115 - kept open for the whole run
+
+    def _write(self, record: dict[str, Any]):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+        self._file.write("\n")
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class JsonArraySink(StreamingSink):
+    """
+    A JSON array extended in place for every record, so the file is a valid JSON document after each write.
+
+    Each write only touches the end of the file (see `JsonArrayAppender`).
+    """
+
+    def __init__(self, file_path: str, compact: bool = False):
+        """
+        Args:
+            file_path (str): The output file path.
+            compact (bool): Write records without indentation.
+        """
+        super().__init__(file_path)
+        self._appender = JsonArrayAppender(file_path, compact=compact)
+
+    def _write(self, record: dict[str, Any]):
+        self._appender.append([record])
+
+    def _close(self):
+        pass
+
+
+class CsvStreamSink(StreamingSink):
+    """
+    Append-only CSV whose rows always match the header.
+
+    The schema is kept next to the file (see `SchemaCsvWriter`); a match bringing new columns widens it once,
+    every other match is a plain append. Nested market data is written as JSON, or exploded into one row per
+    market and bookmaker with the long layout.
+    """
+
+    def __init__(self, file_path: str, layout: CsvLayout = CsvLayout.WIDE):
+        """
+        Args:
+            file_path (str): The output file path.
+            layout (CsvLayout): One row per match (wide) or per match, market and bookmaker (long).
+        """
+        super().__init__(file_path)
+        self._writer = SchemaCsvWriter(file_path, layout=layout)
+
+    def _write(self, record: dict[str, Any]):
+        self._writer.write_records([record])
+
+    def _close(self):
+        self._writer.close()
+
+
+class ParquetSink(StreamingSink):
+    """
+    Parquet output written in row groups, so at most `row_group_size` records are buffered in memory.
+
+    Columns are strings (nested market data as JSON). A Parquet file has a single schema, so when a row group
+    brings columns the current file does not have, that file is closed and the rest of the run goes to a new
+    numbered part file whose schema adds the new columns; `part_paths` lists every file written. Parquet files
+    are only readable once closed; an existing file is never overwritten, a numbered part file is written next
+    to it instead. Requires `pyarrow` (the `parquet` extra).
+    """
+
+    def __init__(self, file_path: str, row_group_size: int = 100):
+        """
+        Args:
+            file_path (str): The output file path.
+            row_group_size (int): Number of records per row group.
+        """
+        if pa is None:
+            raise ImportError(
+                "Parquet output requires pyarrow; install it with `pip install pyarrow` or the `parquet` extra."
+            )
+
+        super().__init__(self._available_path(file_path))
+        self.row_group_size = row_group_size
+        self.part_paths: list[str] = []
+        self._base_path = file_path
+        self._buffer: list[dict[str, Any]] = []
+        self._schema = None
+        self._writer = None
+
+    def _write(self, record: dict[str, Any]):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.row_group_size:
+            self._flush_row_group()
+
+    def _close(self):
+        self._flush_row_group()
+        if self._writer is not None:
+            self._writer.close()
+        if len(self.part_paths) > 1:
+            self.logger.info(f"Parquet output was split into {len(self.part_paths)} files: {self.part_paths}")
+
+    def _flush_row_group(self):
+        if not self._buffer:
+            return
+
+        known = set(self._schema.names) if self._schema is not None else set()
+        buffered_names = dict.fromkeys(key for record in self._buffer for key in record)
+        new_names = [name for name in buffered_names if name not in known]
+
+        if self._schema is None or new_names:
+            fieldnames = [*(self._schema.names if self._schema is not None else []), *new_names]
+            self._schema = pa.schema([(name, pa.string()) for name in fieldnames])
+            self._open_part(new_names)
+
+        columns = {
+            name: [self._to_text(record.get(name)) for record in self._buffer] for name in self._schema.names
+        }
+        self._writer.write_table(pa.Table.from_pydict(columns, schema=self._schema))
+        self._buffer = []
+
+    def _open_part(self, new_names: list[str]):
+        """Write the next row groups to a new file with the current schema, closing the current one."""
+        if self._writer is not None:
+            self._writer.close()
+            self.file_path = self._available_path(self._base_path)
+            self.logger.warning(
+                f"New columns {new_names} do not fit the Parquet schema; continuing in {self.file_path}"
+            )
+
+        self._writer = pq.ParquetWriter(self.file_path, self._schema)
+        self.part_paths.append(self.file_path)
+
+    @staticmethod
+    def _to_text(value: Any) -> str | None:
+        value = serialize_value(value)
+        return None if value is None else str(value)
+
+    @staticmethod
+    def _available_path(file_path: str) -> str:
+        if not os.path.exists(file_path):
+            return file_path
+
+        stem, extension = os.path.splitext(file_path)
+        part = 1
+        while os.path.exists(f"{stem}-part{part:04d}{extension}"):
+            part += 1
+        return f"{stem}-part{part:04d}{extension}"
+
+
+def create_streaming_sink(
+    file_path: str, storage_format: StorageFormat, compact: bool = False, csv_layout: CsvLayout = CsvLayout.WIDE
+) -> StreamingSink:
+    """
+    Create the streaming sink for a storage format.
+
+    Args:
+        file_path (str): The output file path; the format extension is added if missing.
+        storage_format (StorageFormat): The output format.
+        compact (bool): Write JSON arrays without indentation.
+        csv_layout (CsvLayout): Row layout of CSV output.
+
+    Returns:
+        StreamingSink: The sink writing that format.
+
+    Raises:
+        ValueError: If the format cannot be streamed.
+    """
+    sinks = {
+        StorageFormat.JSON: JsonArraySink,
+        StorageFormat.JSONL: JsonLinesSink,
+        StorageFormat.CSV: CsvStreamSink,
+        StorageFormat.PARQUET: ParquetSink,
+    }
+
+    if storage_format not in sinks:
+        raise ValueError(
+            f"Format '{storage_format.value}' cannot be streamed. Streaming formats are: "
+            f"{', '.join(f.value for f in sinks)}."
+        )
+
+    if not file_path.endswith(f".{storage_format.value}"):
+        file_path = f"{file_path}.{storage_format.value}"
+
+    if storage_format == StorageFormat.JSON:
+        return JsonArraySink(file_path, compact=compact)
+    if storage_format == StorageFormat.CSV:
+        return CsvStreamSink(file_path, layout=csv_layout)
+
+    return sinks[storage_format](file_path)
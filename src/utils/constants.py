@@ -35,3 +35,60 @@ PLAYWRIGHT_BROWSER_ARGS_DOCKER = [
     "--disable-backgrounding-occluded-windows",
     "--disable-renderer-backgrounding",
 ]
+
+# Rotated across browser contexts when no user agent is given and several contexts are used
+BROWSER_USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+]
+
+# Resource types the resource blocker drops by default; the scraper only reads the DOM and never renders them
+DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+
+# Ad and tracker hosts (and their subdomains) blocked by the resource blocker
+DEFAULT_BLOCKED_DOMAINS = [
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagservices.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "criteo.net",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "facebook.net",
+    "hotjar.com",
+    "pubmatic.com",
+    "rubiconproject.com",
+    "casalemedia.com",
+    "moatads.com",
+]
+
+# Error messages of failures worth retrying; they usually come from the network or proxy rather than the page
+TRANSIENT_ERRORS = (
+    "ERR_CONNECTION_RESET",
+    "ERR_CONNECTION_TIMED_OUT",
+    "ERR_NAME_NOT_RESOLVED",
+    "ERR_PROXY_CONNECTION_FAILED",
+    "ERR_SOCKS_CONNECTION_FAILED",
+    "ERR_CERT_AUTHORITY_INVALID",
+    "ERR_TUNNEL_CONNECTION_FAILED",
+    "ERR_NETWORK_CHANGED",
+    "Timeout",  # generic timeout from Playwright
+    "net::ERR_FAILED",
+    "net::ERR_CONNECTION_ABORTED",
+    "net::ERR_INTERNET_DISCONNECTED",
+    "Navigation timeout",
+    "TimeoutError",
+    "Target closed",
+)
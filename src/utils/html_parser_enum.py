@@ -0,0 +1,12 @@
+from enum import Enum
+import importlib.util
+
+
+class HtmlParser(Enum):
+    LXML = "lxml"
+    HTML_PARSER = "html.parser"
+
+    @classmethod
+    def default(cls) -> "HtmlParser":
+        """The fastest parser available: lxml when installed, otherwise Python's built-in html.parser."""
+        return cls.LXML if importlib.util.find_spec("lxml") else cls.HTML_PARSER
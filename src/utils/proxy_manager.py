@@ -1,8 +1,26 @@
 import logging
+import time
+from typing import Any, ClassVar
 
 
 class ProxyManager:
-    """Manages proxy selection, usage, and rotation for Playwright."""
+    """
+    Manages proxy selection, health scoring, and rotation for Playwright.
+
+    Every proxy keeps a health record: requests, failures, ban signals (empty odds pages) and a smoothed latency.
+    New browser contexts are given the healthiest proxies first. A proxy failing `FAILURE_THRESHOLD` times in a row is
+    quarantined for a cool-down that doubles with each quarantine in a row (up to `MAX_COOLDOWN_SECONDS`) and resets
+    after a success, so a failing proxy can be swapped out mid-run and tried again later.
+    """
+
+    FAILURE_THRESHOLD: ClassVar[int] = 3
+    BASE_COOLDOWN_SECONDS: ClassVar[float] = 30.0
+    MAX_COOLDOWN_SECONDS: ClassVar[float] = 600.0
+    LATENCY_SMOOTHING: ClassVar[float] = 0.3
+    # How much a 100% failure rate inflates a proxy's latency score
+    ERROR_RATE_PENALTY: ClassVar[float] = 4.0
+    # Latency assumed for failing proxies while no proxy has a latency sample yet
+    DEFAULT_LATENCY_SECONDS: ClassVar[float] = 10.0
 
     def __init__(self, cli_proxies: list[str] | None = None):
         """
@@ -13,7 +31,7 @@ class ProxyManager:
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.proxies = self._parse_proxies(cli_proxies)
-        self.current_proxy_index = 0  # Track current proxy in use
+        self.health: dict[str, dict[str, Any]] = {self._key(proxy): self._new_health() for proxy in self.proxies}
 
     def _parse_proxies(self, cli_proxies: list[str] | None) -> list[dict[str, str]]:
         """
@@ -60,25 +78,189 @@ class ProxyManager:
 
     def get_current_proxy(self) -> dict[str, str] | None:
         """
-        Returns the current proxy config.
+        Returns the healthiest proxy config.
 
         Returns:
-            Optional[Dict[str, str]]: Current proxy config or None if no proxies available.
+            Optional[Dict[str, str]]: Healthiest proxy config or None if no proxies available.
         """
         if not self.proxies:
             self.logger.info("No proxies available, using direct connection.")
             return None
 
-        return self.proxies[self.current_proxy_index]
+        return self._ranked_proxies()[0]
 
-    def rotate_proxy(self):
+    def select_proxies(self, count: int) -> list[dict[str, str]]:
         """
-        Rotates to the next available proxy.
-        If all proxies fail, logs an error and switches to direct connection.
+        Proxies for `count` new browser contexts, healthiest first.
+
+        Quarantined proxies are only handed out when every proxy is quarantined, the one released soonest first.
+
+        Args:
+            count (int): Number of contexts to assign a proxy to.
+
+        Returns:
+            List[Dict[str, str]]: `count` proxies (repeating when there are fewer proxies), or an empty list if no
+            proxies are configured.
         """
-        if not self.proxies:
-            self.logger.warning("No proxies available to rotate. Running without proxy.")
+        ranked = self._ranked_proxies()
+        if not ranked:
+            return []
+        return [ranked[index % len(ranked)] for index in range(count)]
+
+    def rotate_proxy(self, proxy: dict[str, str] | None) -> dict[str, str] | None:
+        """
+        The proxy to switch to away from a failing one.
+
+        Args:
+            proxy (Optional[Dict[str, str]]): The proxy being replaced.
+
+        Returns:
+            Optional[Dict[str, str]]: The healthiest other proxy that is not quarantined, or None if there is none.
+        """
+        now = time.monotonic()
+        for candidate in self._ranked_proxies():
+            if proxy is not None and self._key(candidate) == self._key(proxy):
+                continue
+            if self.health[self._key(candidate)]["quarantined_until"] <= now:
+                self.logger.info(f"Rotating proxy {self._describe(proxy)} -> {self._describe(candidate)}")
+                return candidate
+
+        self.logger.warning(f"No healthy proxy to rotate {self._describe(proxy)} to, keeping it.")
+        return None
+
+    def record_success(self, proxy: dict[str, str] | None, latency: float):
+        """
+        Record a request that went through a proxy.
+
+        Args:
+            proxy (Optional[Dict[str, str]]): The proxy used; ignored when None.
+            latency (float): Duration of the request in seconds.
+        """
+        health = self._get_health(proxy)
+        if health is None:
             return
 
-        self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxies)
-        self.logger.info(f"Rotated to new proxy: {self.get_current_proxy()}")
+        health["requests"] += 1
+        health["consecutive_failures"] = 0
+        health["quarantines"] = 0
+        if health["latency"] is None:
+            health["latency"] = latency
+        else:
+            health["latency"] += self.LATENCY_SMOOTHING * (latency - health["latency"])
+
+    def record_failure(self, proxy: dict[str, str] | None, reason: str, banned: bool = False) -> bool:
+        """
+        Record a request that failed through a proxy, quarantining the proxy when it keeps failing.
+
+        Args:
+            proxy (Optional[Dict[str, str]]): The proxy used; ignored when None.
+            reason (str): What went wrong, for the log.
+            banned (bool): Whether the failure looks like a ban (e.g. a page served without odds).
+
+        Returns:
+            bool: True if this failure put the proxy in quarantine.
+        """
+        health = self._get_health(proxy)
+        if health is None:
+            return False
+
+        health["requests"] += 1
+        health["failures"] += 1
+        health["bans"] += int(banned)
+        health["consecutive_failures"] += 1
+
+        if health["consecutive_failures"] < self.FAILURE_THRESHOLD:
+            return False
+
+        health["consecutive_failures"] = 0
+        health["quarantines"] += 1
+        cooldown = min(self.BASE_COOLDOWN_SECONDS * 2 ** (health["quarantines"] - 1), self.MAX_COOLDOWN_SECONDS)
+        health["quarantined_until"] = time.monotonic() + cooldown
+        self.logger.warning(
+            f"Quarantining proxy {self._describe(proxy)} for {cooldown:.0f}s after "
+            f"{self.FAILURE_THRESHOLD} failures in a row (last: {reason})"
+        )
+        return True
+
+    def is_quarantined(self, proxy: dict[str, str] | None) -> bool:
+        """
+        Whether a proxy is currently quarantined.
+
+        Args:
+            proxy (Optional[Dict[str, str]]): The proxy to check.
+
+        Returns:
+            bool: True if the proxy is in its cool-down.
+        """
+        health = self._get_health(proxy)
+        return health is not None and health["quarantined_until"] > time.monotonic()
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Health of every proxy.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per proxy server: `requests`, `failures`, `bans`, `error_rate`, `latency`
+            (smoothed, in seconds) and `quarantined`.
+        """
+        summary = {}
+        for proxy in self.proxies:
+            health = self.health[self._key(proxy)]
+            summary[proxy["server"]] = {
+                "requests": health["requests"],
+                "failures": health["failures"],
+                "bans": health["bans"],
+                "error_rate": round(health["failures"] / health["requests"], 3) if health["requests"] else 0.0,
+                "latency": round(health["latency"], 3) if health["latency"] is not None else None,
+                "quarantined": self.is_quarantined(proxy),
+            }
+        return summary
+
+    def _ranked_proxies(self) -> list[dict[str, str]]:
+        """Available proxies by score, then quarantined ones by the end of their cool-down."""
+        now = time.monotonic()
+        available = [proxy for proxy in self.proxies if self.health[self._key(proxy)]["quarantined_until"] <= now]
+        quarantined = [proxy for proxy in self.proxies if proxy not in available]
+        available.sort(key=self._score)
+        quarantined.sort(key=lambda proxy: self.health[self._key(proxy)]["quarantined_until"])
+        return available + quarantined
+
+    def _score(self, proxy: dict[str, str]) -> float:
+        """Smoothed latency inflated by the error rate; lower is healthier and untried proxies score 0."""
+        health = self.health[self._key(proxy)]
+        if not health["requests"]:
+            return 0.0
+        latency = health["latency"]
+        if latency is None:
+            # A proxy that has only failed is rated as slow as the slowest one measured, then penalised
+            samples = [record["latency"] for record in self.health.values() if record["latency"] is not None]
+            latency = max(samples, default=self.DEFAULT_LATENCY_SECONDS)
+        # Laplace smoothing keeps one early failure from sinking a proxy
+        error_rate = (health["failures"] + 1) / (health["requests"] + 2)
+        return latency * (1 + self.ERROR_RATE_PENALTY * error_rate)
+
+    def _get_health(self, proxy: dict[str, str] | None) -> dict[str, Any] | None:
+        if proxy is None:
+            return None
+        return self.health.get(self._key(proxy))
+
+    @staticmethod
+    def _new_health() -> dict[str, Any]:
+        return {
+            "requests": 0,
+            "failures": 0,
+            "bans": 0,
+            "consecutive_failures": 0,
+            "latency": None,
+            "quarantines": 0,
+            "quarantined_until": 0.0,
+        }
+
+    @staticmethod
+    def _key(proxy: dict[str, str]) -> str:
+        return f"{proxy.get('username', '')}@{proxy['server']}"
+
+    @staticmethod
+    def _describe(proxy: dict[str, str] | None) -> str:
+        # Credentials are left out of logs
+        return proxy["server"] if proxy else "direct connection"
@@ -4,6 +4,7 @@ import os
 
 from bs4 import BeautifulSoup
 
+from src.utils.html_parser_enum import HtmlParser
 from src.utils.sport_market_constants import (
     BaseballMarket,
     BaseballOverUnderMarket,
@@ -116,3 +117,17 @@ def clean_html_text(html_content: str | None) -> str | None:
 
     soup = BeautifulSoup(html_content, "html.parser")
     return soup.get_text(strip=True)
+
+
+def parse_html(html_content: str, parser: HtmlParser | None = None) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup tree with the given parser backend.
+
+    Args:
+        html_content (str): The HTML to parse, typically a page fragment rather than a full document.
+        parser (Optional[HtmlParser]): The parser backend to use. Defaults to the fastest one installed.
+
+    Returns:
+        BeautifulSoup: The parsed tree.
+    """
+    return BeautifulSoup(html_content, (parser or HtmlParser.default()).value)
@@ -0,0 +1,124 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.market_extraction import OddsFeedClient, OddsFeedDecoder
+
+FIXTURES = Path(__file__).resolve().parents[2] / "fixtures" / "odds_feed"
+ODDS_1X2 = ["1", "X", "2"]
+ODDS_OVER_UNDER = ["odds_over", "odds_under"]
+
+
+@pytest.fixture
+def payload():
+    return OddsFeedClient.decode_body((FIXTURES / "match_event.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def decoder():
+    return OddsFeedDecoder()
+
+
+def _odds_by_bookmaker(odds_data):
+    return {odds["bookmaker_name"]: odds for odds in odds_data}
+
+
+def test_decode_body_reads_plain_json(payload):
+    assert payload["d"]["encodeventId"] == "KhDQvcCa"
+
+
+def test_decode_body_unwraps_jsonp(payload):
+    body = (FIXTURES / "match_event.jsonp").read_text(encoding="utf-8")
+
+    assert OddsFeedClient.decode_body(body) == payload
+
+
+@pytest.mark.parametrize("body", ["", "not json", "callback(not json)", "[1, 2, 3]", "jsonp(", "  \n  "])
+def test_decode_body_rejects_non_json_objects(body):
+    assert OddsFeedClient.decode_body(body) is None
+
+
+def test_decode_main_market(decoder, payload):
+    odds_data = decoder.decode_market(payload, "1X2", None, "FullTime", ODDS_1X2)
+    odds = _odds_by_bookmaker(odds_data)
+
+    # 1xBet only has two of the three outcomes and is skipped
+    assert set(odds) == {"bet365", "Pinnacle", "Betfair Exchange"}
+    assert odds["bet365"] == {"1": "2.10", "X": "3.40", "2": "3.50", "bookmaker_name": "bet365", "period": "FullTime"}
+    assert odds["Pinnacle"]["2"] == "3.62"
+
+
+def test_decode_market_picks_the_period(decoder, payload):
+    odds = _odds_by_bookmaker(decoder.decode_market(payload, "1X2", None, "1stHalf", ODDS_1X2))
+
+    assert set(odds) == {"bet365", "Pinnacle"}
+    assert odds["bet365"]["X"] == "2.05"
+    assert odds["bet365"]["period"] == "1stHalf"
+
+
+@pytest.mark.parametrize(
+    ("specific_market", "expected_over"),
+    [("Over/Under +2.5", "1.80"), ("Over/Under +3.5", "3.00")],
+)
+def test_decode_market_picks_the_line(decoder, payload, specific_market, expected_over):
+    odds = _odds_by_bookmaker(
+        decoder.decode_market(payload, "Over/Under", specific_market, "FullTime", ODDS_OVER_UNDER)
+    )
+
+    assert odds["bet365"]["odds_over"] == expected_over
+
+
+def test_decode_market_reads_negative_line_from_group(decoder, payload):
+    odds_data = decoder.decode_market(payload, "Asian Handicap", "Asian Handicap -0.5", "FullTime", ["1", "2"])
+
+    assert odds_data == [{"1": "2.10", "2": "1.75", "bookmaker_name": "bet365", "period": "FullTime"}]
+
+
+def test_decode_market_returns_none_for_lines_the_feed_does_not_carry(decoder, payload):
+    assert decoder.decode_market(payload, "Over/Under", "Over/Under +4.5", "FullTime", ODDS_OVER_UNDER) is None
+    assert decoder.decode_market(payload, "Draw No Bet", None, "FullTime", ["1", "2"]) is None
+
+
+@pytest.mark.parametrize(
+    ("main_market", "specific_market", "period"),
+    [
+        ("Correct Score", None, "FullTime"),
+        ("Over/Under", "Over/Under +2.5 Sets", "FullTime"),
+        ("Over/Under", "Asian Handicap -0.5", "FullTime"),
+        ("1X2", None, "3rdPeriod"),
+    ],
+)
+def test_unsupported_markets_are_left_to_the_dom(decoder, payload, main_market, specific_market, period):
+    assert not decoder.supports(main_market, specific_market, period)
+    assert decoder.decode_market(payload, main_market, specific_market, period, ODDS_1X2) is None
+
+
+@pytest.mark.parametrize(
+    ("target_bookmaker", "expected"),
+    [
+        ("bet365", {"bet365"}),
+        ("BET365", {"bet365"}),
+        (" betfair exchange", {"Betfair Exchange"}),
+        ("betfair", set()),
+        ("bet", set()),
+        ("Unibet", set()),
+    ],
+)
+def test_target_bookmaker_matches_the_whole_name_ignoring_case(decoder, payload, target_bookmaker, expected):
+    odds_data = decoder.decode_market(payload, "1X2", None, "FullTime", ODDS_1X2, target_bookmaker=target_bookmaker)
+
+    assert {odds["bookmaker_name"] for odds in odds_data} == expected
+
+
+def test_page_bookmaker_names_override_payload_names(decoder, payload):
+    odds_data = decoder.decode_market(
+        payload, "Both Teams to Score", None, "FullTime", ["btts_yes", "btts_no"], bookmaker_names={"21": "Betfair"}
+    )
+
+    assert odds_data == [{"btts_yes": "1.72", "btts_no": "2.12", "bookmaker_name": "Betfair", "period": "FullTime"}]
+
+
+def test_decode_market_accepts_unwrapped_payload(decoder, payload):
+    assert decoder.decode_market(payload["d"], "1X2", None, "FullTime", ODDS_1X2) == decoder.decode_market(
+        payload, "1X2", None, "FullTime", ODDS_1X2
+    )
@@ -0,0 +1,23 @@
+import pytest
+
+from src.core.market_extraction import ParserPatterns
+
+
+@pytest.mark.parametrize(
+    ("bookmaker_name", "target_bookmaker", "expected"),
+    [
+        ("bet365", None, True),
+        ("bet365", "", True),
+        ("bet365", "BET365", True),
+        ("Betfair Exchange", "betfair exchange ", True),
+        ("Betfair Exchange", "Betfair", False),
+        ("bet365", "bet", False),
+    ],
+)
+def test_target_bookmaker_is_the_whole_name_ignoring_case(bookmaker_name, target_bookmaker, expected):
+    assert ParserPatterns.matches_target_bookmaker(bookmaker_name, target_bookmaker) is expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1.901.90", "1.90"), ("2.05", "2.05"), ("-", "-")])
+def test_dedupe_odds(value, expected):
+    assert ParserPatterns.dedupe_odds(value) == expected
@@ -0,0 +1,73 @@
+import asyncio
+
+from playwright.async_api import TimeoutError
+
+from src.core.browser_helper import BrowserHelper
+
+
+class FakePage:
+    """A match page whose active tab condition is met or not; sleeping on it fails the test."""
+
+    url = "https://www.oddsportal.com/football/england/premier-league/a-b-xyz/"
+
+    def __init__(self, active_tab=True, mentions_market=False):
+        self.active_tab = active_tab
+        self.mentions_market = mentions_market
+        self.waits = []
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        self.waits.append(arg)
+        if not self.active_tab:
+            raise TimeoutError("condition not met")
+        return True
+
+    async def wait_for_timeout(self, timeout):
+        raise AssertionError(f"fixed sleep of {timeout}ms on the market path")
+
+    async def evaluate(self, script, arg=None):
+        # Only the page content fallback of `_verify_tab_is_active` evaluates a script here
+        return self.mentions_market
+
+
+def test_active_tab_is_confirmed_by_waiting_not_sleeping():
+    page = FakePage()
+
+    assert asyncio.run(BrowserHelper()._verify_tab_is_active(page, "Over/Under"))
+    assert page.waits[0][1] == "over/under"
+
+
+def test_inactive_tab_is_reported():
+    assert not asyncio.run(BrowserHelper()._verify_tab_is_active(FakePage(active_tab=False), "Over/Under"))
+
+
+def _helper_with_cached_tab(page):
+    helper = BrowserHelper()
+    helper.market_tab_locations[(helper._sport_of(page), "Over/Under")] = {"location": "visible", "selector": "li"}
+
+    async def click_market_tab_at(*_args):
+        return True
+
+    async def click_more_if_market_hidden(*_args, **_kwargs):
+        return None
+
+    helper._click_market_tab_at = click_market_tab_at
+    helper._click_more_if_market_hidden = click_more_if_market_hidden
+    return helper
+
+
+def test_cache_hit_is_confirmed_by_the_active_tab():
+    page = FakePage()
+    helper = _helper_with_cached_tab(page)
+
+    assert asyncio.run(helper.navigate_to_market_tab(page, "Over/Under"))
+    assert helper.market_tab_cache_stats() == {"hits": 1, "misses": 0, "probes": 0, "known_locations": 1}
+
+
+def test_cache_hit_is_not_confirmed_by_page_content():
+    page = FakePage(active_tab=False, mentions_market=True)
+    helper = _helper_with_cached_tab(page)
+
+    asyncio.run(helper.navigate_to_market_tab(page, "Over/Under", timeout=10))
+
+    assert helper.market_tab_cache_stats()["hits"] == 0
+    assert helper.market_tab_cache_stats()["misses"] == 1
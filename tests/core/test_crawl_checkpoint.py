@@ -0,0 +1,46 @@
+import pytest
+
+from src.core.crawl_checkpoint import CrawlCheckpoint
+
+MARKETS = ["1x2", "over_under_2_5"]
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.db"), "run")
+    yield checkpoint
+    checkpoint.close()
+
+
+def _links(count):
+    return [f"https://www.oddsportal.com/football/match-{index}/" for index in range(count)]
+
+
+def test_pending_markets_skip_done_tasks(checkpoint):
+    links = _links(3)
+    checkpoint.register(links, MARKETS)
+    checkpoint.record_result(
+        links[0], {"1x2_market": [{"1": "2.0"}], "over_under_2_5_market": [{"odds_over": "1.9"}]}, MARKETS
+    )
+    checkpoint.record_result(links[1], {"1x2_market": [{"1": "2.0"}], "over_under_2_5_market": []}, MARKETS)
+
+    assert checkpoint.get_pending_markets(links, MARKETS) == {links[1]: ["over_under_2_5"], links[2]: MARKETS}
+
+
+def test_pending_markets_only_look_at_the_given_matches(checkpoint):
+    links = _links(3)
+    checkpoint.register(links, None)
+    checkpoint.record_result(links[0], {"match_link": links[0]}, None)
+
+    assert checkpoint.get_pending_markets(links[:1], None) == {}
+    assert checkpoint.get_pending_markets(links[1:2], None) == {links[1]: None}
+
+
+def test_pending_markets_span_several_lookup_batches(checkpoint):
+    links = _links(CrawlCheckpoint.LOOKUP_BATCH_SIZE * 2 + 1)
+    checkpoint.register(links, None)
+    for link in links[::2]:
+        checkpoint.record_result(link, {"match_link": link}, None)
+
+    assert list(checkpoint.get_pending_markets(links, None)) == links[1::2]
+    assert checkpoint.get_pending_markets([], None) == {}
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from src.core.job_orchestrator import JobOrchestrator
+
+
+def _run(scraper, run_job, jobs):
+    orchestrator = JobOrchestrator(create_scraper=None, scrapers=[scraper])
+    return asyncio.run(orchestrator.run(jobs, run_job))
+
+
+def test_results_are_merged_in_job_order():
+    jobs = JobOrchestrator.build_jobs("football", ["england-premier-league", "france-ligue-1"], ["2023-2024"])
+
+    async def run_job(_scraper, job):
+        return [{"league": job["league"]}]
+
+    merged = _run(SimpleNamespace(result_sink=None), run_job, jobs)
+
+    assert merged == [{"league": "england-premier-league"}, {"league": "france-ligue-1"}]
+
+
+def test_streamed_jobs_do_not_warn_about_missing_data(caplog):
+    jobs = JobOrchestrator.build_jobs("football", ["england-premier-league"])
+
+    async def run_job(_scraper, _job):
+        return []
+
+    with caplog.at_level(logging.INFO, logger="JobOrchestrator"):
+        merged = _run(SimpleNamespace(result_sink=object()), run_job, jobs)
+
+    assert merged == []
+    assert "No data returned" not in caplog.text
+    assert "streamed to the result sink" in caplog.text
+
+
+def test_jobs_without_data_warn_when_not_streaming(caplog):
+    jobs = JobOrchestrator.build_jobs("football", ["england-premier-league"])
+
+    async def run_job(_scraper, _job):
+        return []
+
+    with caplog.at_level(logging.WARNING, logger="JobOrchestrator"):
+        _run(SimpleNamespace(result_sink=None), run_job, jobs)
+
+    assert "No data returned" in caplog.text
@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+import pytest
+
+from src.core.page_tracer import PageTracer
+
+
+class FakePage:
+    """The bits of a Playwright page the tracer touches."""
+
+    url = "https://www.oddsportal.com/"
+
+    async def goto(self, url, **_kwargs):
+        await asyncio.sleep(0)
+
+    async def click(self, selector, **_kwargs):
+        raise TimeoutError(selector)
+
+
+async def _scrape(tracer, link):
+    page = tracer.wrap(FakePage())
+    with PageTracer.annotate(match_url=link, attempt=1):
+        await page.goto(link)
+        PageTracer.update(attempt=2)
+        with PageTracer.annotate(market="1x2"), pytest.raises(TimeoutError):
+            await page.click("div.tab")
+
+
+def test_spans_carry_the_attributes_of_their_own_task():
+    tracer = PageTracer()
+
+    async def run():
+        await asyncio.gather(_scrape(tracer, "/match-a/"), _scrape(tracer, "/match-b/"))
+
+    asyncio.run(run())
+
+    assert len(tracer.spans) == 4
+    for span in tracer.spans:
+        attributes = span["attributes"]
+        assert attributes["caller"] == "_scrape"
+        if span["name"] == "goto":
+            assert (attributes["match_url"], attributes["attempt"]) == (attributes["argument"], 1)
+            assert "market" not in attributes
+        else:
+            assert (attributes["attempt"], attributes["market"], attributes["error"]) == (2, "1x2", "TimeoutError")
+    assert {span["attributes"]["match_url"] for span in tracer.spans} == {"/match-a/", "/match-b/"}
+
+
+def test_attributes_do_not_leak_outside_annotate():
+    tracer = PageTracer()
+    asyncio.run(_scrape(tracer, "/match-a/"))
+
+    async def unannotated():
+        await tracer.wrap(FakePage()).goto("/match-c/")
+
+    asyncio.run(unannotated())
+
+    assert "match_url" not in tracer.spans[-1]["attributes"]
+
+
+def test_untraced_attributes_pass_through_and_write_chrome_trace(tmp_path):
+    tracer = PageTracer()
+    page = tracer.wrap(FakePage())
+    asyncio.run(page.goto("/match-a/"))
+    path = tmp_path / "trace" / "page_calls.json"
+
+    tracer.write(str(path))
+
+    assert page.url == FakePage.url
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [(event["name"], event["ph"]) for event in events] == [("goto", "X")]
+    assert "Slowest 20 of 1 traced page calls" in tracer.describe_slowest()
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from src.core.retry_policy import RetryPolicy
+from src.core.scrape_errors import BlockedError, NetworkError, ParseError
+from src.core.scraper_app import retry_scrape
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy()
+
+
+def test_budget_is_spent_per_error_class(policy):
+    state = policy.start()
+
+    assert [state.next_delay(NetworkError) is not None for _ in range(4)] == [True, True, True, False]
+    assert state.next_delay(ParseError) is not None
+    assert state.next_delay(ParseError) is None
+    assert state.describe(NetworkError) == "network retry 3/3"
+
+
+def test_delays_stay_within_the_class_bounds(policy):
+    for error_class in (NetworkError, ParseError, BlockedError):
+        rule = policy.rule_for(error_class)
+        state = policy.start()
+        for _ in range(int(rule["budget"])):
+            assert rule["base_delay"] <= state.next_delay(error_class) <= rule["max_delay"]
+
+
+def test_backoff_of_one_class_does_not_inflate_another(monkeypatch, policy):
+    # Always draw the upper end of the jitter range
+    monkeypatch.setattr("src.core.retry_policy.random.uniform", lambda _low, high: high)
+    state = policy.start()
+
+    assert state.next_delay(BlockedError) == 30.0
+    assert state.next_delay(NetworkError) == 6.0
+    assert state.next_delay(NetworkError) == 18.0
+    assert state.next_delay(ParseError) == 1.5
+
+
+def test_run_policy_retries_a_job_whose_listing_page_timed_out(monkeypatch):
+    async def no_sleep(_delay):
+        return None
+
+    monkeypatch.setattr("src.core.retry_policy.asyncio.sleep", no_sleep)
+    attempts = []
+
+    async def scrape_listing():
+        attempts.append(len(attempts) + 1)
+        if len(attempts) < 3:
+            raise TimeoutError("Timeout 10000ms exceeded while loading page 2")
+        return ["match"]
+
+    assert asyncio.run(retry_scrape(scrape_listing)) == ["match"]
+    assert attempts == [1, 2, 3]
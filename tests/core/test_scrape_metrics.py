@@ -0,0 +1,64 @@
+import urllib.request
+
+import pytest
+
+from src.core.scrape_metrics import ScrapeMetrics, summarize_durations
+
+
+def test_summarize_durations():
+    samples = [0.1 * step for step in range(1, 21)]
+
+    assert summarize_durations(reversed(samples)) == {"count": 20, "p50": 1.1, "p95": 2.0, "max": 2.0}
+
+
+def test_summary_percentiles_use_recent_samples_but_count_the_whole_run():
+    metrics = ScrapeMetrics(max_samples=2)
+    for seconds in (9.0, 0.2, 0.4):
+        metrics.record("goto", seconds)
+
+    stage = metrics.summary()["stages"]["goto"]
+
+    assert (stage["count"], stage["total"], stage["max"]) == (3, 9.6, 9.0)
+    assert (stage["p50"], stage["p95"]) == (0.4, 0.4)
+    assert stage["histogram"]["0.25"] == 1
+    assert stage["histogram"]["+Inf"] == 3
+
+
+def test_prometheus_endpoint_listens_on_loopback_by_default():
+    metrics = ScrapeMetrics()
+    metrics.record("parse", 0.01)
+    metrics.increment("market_retries")
+
+    port = metrics.serve_prometheus(0)
+    try:
+        assert metrics._server.server_address[0] == "127.0.0.1"
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+    finally:
+        metrics.stop()
+
+    assert 'oddsharvester_stage_duration_seconds_count{stage="parse"} 1' in body
+    assert "oddsharvester_market_retries_total 1" in body
+
+
+def test_gauges_keep_their_last_value():
+    metrics = ScrapeMetrics()
+    metrics.set_gauge("concurrency_limit", 8)
+    metrics.set_gauge("concurrency_limit", 4)
+
+    assert metrics.gauge("concurrency_limit") == 4
+    assert metrics.gauge("missing") is None
+    assert metrics.summary()["gauges"] == {"concurrency_limit": 4}
+    assert (
+        "# TYPE oddsharvester_concurrency_limit gauge\noddsharvester_concurrency_limit 4\n" in metrics.prometheus_text()
+    )
+
+
+@pytest.mark.parametrize("stage", ["goto", "content_fetch"])
+def test_stage_records_even_when_the_block_raises(stage):
+    metrics = ScrapeMetrics()
+
+    with pytest.raises(RuntimeError), metrics.stage(stage):
+        raise RuntimeError
+
+    assert metrics.summary()["stages"][stage]["count"] == 1
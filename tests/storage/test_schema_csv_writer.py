@@ -0,0 +1,52 @@
+import csv
+import json
+
+import pytest
+
+from src.storage.csv_layout import CsvLayout
+from src.storage.schema_csv_writer import SchemaCsvWriter
+
+
+def _write(file_path, records, layout=CsvLayout.WIDE):
+    writer = SchemaCsvWriter(str(file_path), layout=layout)
+    try:
+        writer.write_records(records)
+    finally:
+        writer.close()
+
+
+def _read_rows(file_path):
+    with open(file_path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_new_columns_widen_the_header_and_pad_earlier_rows(tmp_path):
+    file_path = tmp_path / "matches.csv"
+
+    _write(file_path, [{"home": "A", "away": "B"}])
+    _write(file_path, [{"home": "C", "away": "D", "score": "1-0"}])
+
+    assert _read_rows(file_path) == [["away", "home", "score"], ["B", "A", ""], ["D", "C", "1-0"]]
+    assert json.loads((tmp_path / "matches.csv.schema.json").read_text())["columns"] == ["away", "home", "score"]
+
+
+@pytest.mark.parametrize("leftover", ["missing", "empty"])
+def test_stale_schema_sidecar_does_not_drop_the_header(tmp_path, leftover):
+    file_path = tmp_path / "matches.csv"
+    _write(file_path, [{"a": 1, "b": 2, "c": 3}])
+    if leftover == "missing":
+        file_path.unlink()
+    else:
+        file_path.write_text("")
+
+    _write(file_path, [{"a": 5}])
+
+    assert _read_rows(file_path) == [["a"], ["5"]]
+
+
+def test_layout_mismatch_is_rejected(tmp_path):
+    file_path = tmp_path / "matches.csv"
+    _write(file_path, [{"home": "A", "1x2_market": [{"bookmaker_name": "bet365", "1": "2.10"}]}], CsvLayout.LONG)
+
+    with pytest.raises(ValueError, match="long"):
+        SchemaCsvWriter(str(file_path), layout=CsvLayout.WIDE)
@@ -0,0 +1,41 @@
+import pytest
+
+from src.storage.streaming_sink import ParquetSink, StreamingSink
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_streaming_sink_requires_write_and_close(tmp_path):
+    with pytest.raises(TypeError):
+        StreamingSink(str(tmp_path / "out.jsonl"))
+
+
+def test_parquet_sink_starts_a_wider_part_file_for_new_columns(tmp_path):
+    file_path = tmp_path / "out.parquet"
+
+    with ParquetSink(str(file_path), row_group_size=2) as sink:
+        sink.write({"match": "a"})
+        sink.write({"match": "b", "score": "1-0"})
+        sink.write({"match": "c"})
+        sink.write({"match": "d", "odds": {"1X2": [1.5]}})
+        sink.write({"score": "2-2"})
+
+    assert sink.part_paths == [str(file_path), str(tmp_path / "out-part0001.parquet")]
+    first, second = (pq.read_table(path).to_pylist() for path in sink.part_paths)
+    assert first == [{"match": "a", "score": None}, {"match": "b", "score": "1-0"}]
+    assert second == [
+        {"match": "c", "score": None, "odds": None},
+        {"match": "d", "score": None, "odds": '{"1X2": [1.5]}'},
+        {"match": None, "score": "2-2", "odds": None},
+    ]
+
+
+def test_parquet_sink_never_overwrites_an_existing_file(tmp_path):
+    file_path = tmp_path / "out.parquet"
+    file_path.write_bytes(b"earlier run")
+
+    with ParquetSink(str(file_path)) as sink:
+        sink.write({"match": "a"})
+
+    assert file_path.read_bytes() == b"earlier run"
+    assert sink.part_paths == [str(tmp_path / "out-part0001.parquet")]
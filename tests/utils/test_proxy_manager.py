@@ -0,0 +1,149 @@
+import pytest
+
+from src.utils import proxy_manager as proxy_manager_module
+from src.utils.proxy_manager import ProxyManager
+
+PROXIES = ["http://proxy-a:8080", "http://proxy-b:8080 user secret", "socks5://proxy-c:1080"]
+
+
+class FakeClock:
+    """Stands in for `time.monotonic` so cool-downs can expire without sleeping."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(proxy_manager_module.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def manager(clock):
+    return ProxyManager(PROXIES)
+
+
+def _proxy(manager, server):
+    return next(proxy for proxy in manager.proxies if proxy["server"] == server)
+
+
+def _fail(manager, proxy, times):
+    return [manager.record_failure(proxy, "timeout") for _ in range(times)]
+
+
+def test_invalid_proxies_are_skipped():
+    manager = ProxyManager(["ftp://proxy:21", "http://proxy-a:8080 user", "http://proxy-b:8080 user secret"])
+
+    assert manager.proxies == [{"server": "http://proxy-b:8080", "username": "user", "password": "secret"}]
+
+
+def test_best_scored_proxy_is_chosen(manager):
+    proxy_a, proxy_b, proxy_c = manager.proxies
+    manager.record_success(proxy_a, latency=2.0)
+    manager.record_success(proxy_b, latency=0.5)
+    manager.record_success(proxy_c, latency=1.0)
+
+    assert manager.get_current_proxy() == proxy_b
+    assert manager.select_proxies(4) == [proxy_b, proxy_c, proxy_a, proxy_b]
+
+
+def test_failures_inflate_the_score(manager):
+    proxy_a, proxy_b, _ = manager.proxies
+    manager.record_success(proxy_a, latency=1.0)
+    manager.record_success(proxy_b, latency=0.8)
+    _fail(manager, proxy_b, 2)
+
+    # Untried proxies score 0 and are tried first; then the slower but reliable proxy beats the failing one
+    assert manager.select_proxies(3)[1:] == [proxy_a, proxy_b]
+
+
+def test_proxies_that_only_failed_rank_below_measured_ones(manager):
+    proxy_a, proxy_b, proxy_c = manager.proxies
+    manager.record_success(proxy_a, latency=2.0)
+    _fail(manager, proxy_b, 1)
+
+    assert manager.select_proxies(3) == [proxy_c, proxy_a, proxy_b]
+
+
+def test_proxies_that_only_failed_rank_below_untried_ones_without_latency_samples(manager):
+    proxy_a, proxy_b, proxy_c = manager.proxies
+    _fail(manager, proxy_a, 2)
+    _fail(manager, proxy_b, 1)
+
+    assert manager.select_proxies(3) == [proxy_c, proxy_b, proxy_a]
+
+
+def test_consecutive_failures_quarantine_a_proxy(manager):
+    proxy = _proxy(manager, "http://proxy-a:8080")
+
+    assert _fail(manager, proxy, ProxyManager.FAILURE_THRESHOLD) == [False, False, True]
+    assert manager.is_quarantined(proxy)
+    assert proxy not in manager.select_proxies(2)
+    assert manager.summary()["http://proxy-a:8080"]["quarantined"]
+
+
+def test_success_resets_the_failure_streak(manager):
+    proxy = _proxy(manager, "http://proxy-a:8080")
+    _fail(manager, proxy, ProxyManager.FAILURE_THRESHOLD - 1)
+    manager.record_success(proxy, latency=0.5)
+
+    assert _fail(manager, proxy, ProxyManager.FAILURE_THRESHOLD - 1) == [False, False]
+    assert not manager.is_quarantined(proxy)
+
+
+def test_quarantine_expires_after_the_cooldown(manager, clock):
+    proxy = _proxy(manager, "http://proxy-a:8080")
+    _fail(manager, proxy, ProxyManager.FAILURE_THRESHOLD)
+
+    clock.now += ProxyManager.BASE_COOLDOWN_SECONDS - 1
+    assert manager.is_quarantined(proxy)
+
+    clock.now += 1
+    assert not manager.is_quarantined(proxy)
+    assert proxy in manager.select_proxies(3)
+
+
+def test_cooldown_doubles_for_repeated_quarantines_and_is_capped(manager, clock):
+    proxy = _proxy(manager, "http://proxy-a:8080")
+    cooldowns = []
+    for _ in range(6):
+        _fail(manager, proxy, ProxyManager.FAILURE_THRESHOLD)
+        cooldowns.append(manager.health[ProxyManager._key(proxy)]["quarantined_until"] - clock.now)
+        clock.now += ProxyManager.MAX_COOLDOWN_SECONDS
+
+    assert cooldowns == [30.0, 60.0, 120.0, 240.0, 480.0, ProxyManager.MAX_COOLDOWN_SECONDS]
+
+
+def test_rotation_skips_quarantined_proxies(manager):
+    proxy_a, proxy_b, proxy_c = manager.proxies
+    manager.record_success(proxy_b, latency=0.2)
+    manager.record_success(proxy_c, latency=0.4)
+    _fail(manager, proxy_b, ProxyManager.FAILURE_THRESHOLD)
+
+    assert manager.rotate_proxy(proxy_a) == proxy_c
+
+
+def test_rotation_keeps_the_proxy_when_all_others_are_quarantined(manager):
+    proxy_a, proxy_b, proxy_c = manager.proxies
+    for proxy in (proxy_b, proxy_c):
+        _fail(manager, proxy, ProxyManager.FAILURE_THRESHOLD)
+
+    assert manager.rotate_proxy(proxy_a) is None
+
+
+def test_all_quarantined_proxies_are_handed_out_soonest_released_first(manager, clock):
+    proxy_a, proxy_b, _ = manager.proxies
+    for proxy in manager.proxies:
+        _fail(manager, proxy, ProxyManager.FAILURE_THRESHOLD)
+        clock.now += 1
+    # A second quarantine in a row doubles proxy-a's cool-down, so it is released last
+    clock.now += ProxyManager.BASE_COOLDOWN_SECONDS
+    _fail(manager, proxy_a, ProxyManager.FAILURE_THRESHOLD)
+
+    assert manager.select_proxies(3)[0] == proxy_b
+    assert manager.select_proxies(3)[-1] == proxy_a